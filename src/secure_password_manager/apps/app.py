@@ -1,7 +1,6 @@
 """Main application module for the Password Manager."""
 
 import os
-import sqlite3
 import sys
 import time
 from typing import Any, Dict, List, Optional
@@ -42,6 +41,7 @@ from secure_password_manager.utils.database import (
     get_expiring_passwords,
     get_password_history,
     get_passwords,
+    get_read_connection,
     init_db,
     update_password,
 )
@@ -218,7 +218,7 @@ def add_new_password() -> None:
     encrypted = encrypt_password(password)
     add_password(website, username, encrypted, category, notes, expiry_days)
     print_success("Password added successfully!")
-    log_info(f"Added new password for {website} in category {category}")
+    log_info("Added new password for %s in category %s", website, category)
 
 
 def view_passwords(
@@ -312,7 +312,7 @@ def view_passwords(
                 if entry[0] == pass_id:
                     copy_to_clipboard(entry[3])
                     print_success("Password copied to clipboard (auto-clear enabled)")
-                    log_info(f"Copied password for ID {pass_id}")
+                    log_info("Copied password for ID %s", pass_id)
                     break
             else:
                 print_error("Invalid ID")
@@ -329,7 +329,7 @@ def view_passwords(
                     print_success(
                         f"{'Added to' if not entry[9] else 'Removed from'} favorites"
                     )
-                    log_info(f"Updated favorite status for ID {pass_id}")
+                    log_info("Updated favorite status for ID %s", pass_id)
                     break
             else:
                 print_error("Invalid ID")
@@ -385,7 +385,7 @@ def delete_password_entry() -> None:
 
         delete_password(entry_id)
         print_success("Password deleted successfully!")
-        log_info(f"Deleted password for {website} (ID: {entry_id})")
+        log_info("Deleted password for %s (ID: %s)", website, entry_id)
     except ValueError:
         print_error("Invalid ID. Please enter a number.")
 
@@ -646,7 +646,7 @@ def edit_password() -> None:
         )
 
         print_success("Password updated successfully!")
-        log_info(f"Updated password for {new_website} (ID: {entry_id})")
+        log_info("Updated password for %s (ID: %s)", new_website, entry_id)
     except ValueError:
         print_error("Invalid ID. Please enter a number.")
 
@@ -731,7 +731,7 @@ def check_expiring_passwords() -> None:
 
             update_password(entry_id, expiry_days=new_days)
             print_success(f"Password renewed for {new_days} days")
-            log_info(f"Renewed password ID {entry_id} for {new_days} days")
+            log_info("Renewed password ID %s for %s days", entry_id, new_days)
         except ValueError:
             print_error("Invalid ID. Please enter a number.")
 
@@ -793,7 +793,7 @@ def categories_menu() -> None:
 
         add_category(name, color)
         print_success(f"Added new category: {name}")
-        log_info(f"Added new category: {name}")
+        log_info("Added new category: %s", name)
 
 
 def backup_menu() -> None:
@@ -1206,18 +1206,18 @@ def settings_menu() -> None:
         print_header("System Information")
 
         # Database info
-        conn = sqlite3.connect(str(get_database_path()))
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM passwords")
-        password_count = cursor.fetchone()[0]
+        with get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM passwords")
+            password_count = cursor.fetchone()[0]
 
-        cursor.execute("SELECT COUNT(*) FROM categories")
-        category_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM categories")
+            category_count = cursor.fetchone()[0]
 
-        cursor.execute("SELECT COUNT(*) FROM passwords WHERE expiry_date IS NOT NULL")
-        expiring_count = cursor.fetchone()[0]
-
-        conn.close()
+            cursor.execute(
+                "SELECT COUNT(*) FROM passwords WHERE expiry_date IS NOT NULL"
+            )
+            expiring_count = cursor.fetchone()[0]
 
         print(f"Total passwords: {password_count}")
         print(f"Total categories: {category_count}")
@@ -1545,7 +1545,7 @@ def key_management_menu() -> None:
         try:
             result = switch_key_mode(target, master_password)
             set_master_password_context(master_password)
-            log_info(f"Switched key mode to {target}")
+            log_info("Switched key mode to %s", target)
             print_success(
                 f"Switched to {_format_key_mode_label(target)}"
                 f" (re-encrypted {result['entries_reencrypted']} entries)"
@@ -64,6 +64,7 @@ from secure_password_manager.utils.database import (
     get_categories,
     get_password_history,
     get_passwords,
+    get_read_connection,
     init_db,
     update_password,
 )
@@ -2020,17 +2021,14 @@ class PasswordManagerApp(QMainWindow):
             categories = get_categories()
 
             # Count passwords per category using SQL GROUP BY for efficiency
-            import sqlite3
-            from secure_password_manager.utils.paths import get_database_path
-            conn = sqlite3.connect(str(get_database_path()))
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT category, COUNT(*) as count
-                FROM passwords
-                GROUP BY category
-            """)
-            category_counts = dict(cursor.fetchall())
-            conn.close()
+            with get_read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT category, COUNT(*) as count
+                    FROM passwords
+                    GROUP BY category
+                """)
+                category_counts = dict(cursor.fetchall())
 
             self.categories_list.setRowCount(len(categories))
 
@@ -2355,18 +2353,16 @@ class PasswordManagerApp(QMainWindow):
     def update_system_info(self):
         """Update system information display"""
         import os
-        import sqlite3
         from secure_password_manager.utils.database import _get_db_file
 
         # Use COUNT queries instead of loading all data (much faster)
-        conn = sqlite3.connect(_get_db_file())
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM passwords")
-        password_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM categories")
-        category_count = cursor.fetchone()[0]
-        conn.close()
+        with get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM passwords")
+            password_count = cursor.fetchone()[0]
+
+            cursor.execute("SELECT COUNT(*) FROM categories")
+            category_count = cursor.fetchone()[0]
 
         info_text = f"Password Count: {password_count}\n"
         info_text += f"Category Count: {category_count}\n"
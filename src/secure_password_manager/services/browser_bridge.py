@@ -20,11 +20,12 @@ from secure_password_manager.utils.approval_manager import (
     get_approval_manager,
 )
 from secure_password_manager.utils.crypto import decrypt_password, encrypt_password
-from secure_password_manager.utils.database import add_password, get_passwords
+from secure_password_manager.utils.database import add_password, iter_passwords
 from secure_password_manager.utils.domain_socket import (
     cleanup_socket,
     create_socket_server,
     get_socket_path,
+    is_peer_authorized,
     is_socket_available,
     receive_message,
     send_message,
@@ -199,7 +200,9 @@ class BrowserBridgeService:
             )
             service._pairing = None
             log_info(
-                f"Issued browser bridge token for {payload.fingerprint} ({payload.browser or 'unknown'})"
+                "Issued browser bridge token for %s (%s)",
+                payload.fingerprint,
+                payload.browser or 'unknown',
             )
             return {"token": record["token"], "expires_at": record["expires_at"]}
 
@@ -223,7 +226,7 @@ class BrowserBridgeService:
                 origin_domain.split(".")[0] if "." in origin_domain else origin_domain
             )
 
-            for entry in get_passwords():
+            for entry in iter_passwords():
                 (
                     _entry_id,
                     website,
@@ -255,7 +258,7 @@ class BrowserBridgeService:
                 try:
                     password = decrypt_password(encrypted)
                 except Exception as exc:
-                    log_warning(f"Failed to decrypt entry for site {website}: {exc}")
+                    log_warning("Failed to decrypt entry for site %s: %s", website, exc)
                     continue
 
                 # Store for approval check
@@ -291,8 +294,11 @@ class BrowserBridgeService:
 
                 # Log the approval decision
                 log_info(
-                    f"Credential access for {origin}: {response.decision.value} "
-                    f"(remember={response.remember}, browser={token.get('browser')})"
+                    "Credential access for %s: %s (remember=%s, browser=%s)",
+                    origin,
+                    response.decision.value,
+                    response.remember,
+                    token.get('browser'),
                 )
 
                 # Return credentials only if approved
@@ -309,7 +315,7 @@ class BrowserBridgeService:
                         ),
                     }
             except Exception as exc:
-                log_warning(f"Approval request failed: {exc}")
+                log_warning("Approval request failed: %s", exc)
                 return {"entries": [], "error": "Approval request failed"}
 
         @app.post("/v1/credentials/check")
@@ -336,7 +342,7 @@ class BrowserBridgeService:
             )
 
             # Check if credentials exist (without decrypting passwords)
-            for entry in get_passwords():
+            for entry in iter_passwords():
                 (
                     _entry_id,
                     website,
@@ -413,8 +419,10 @@ class BrowserBridgeService:
                 )
 
                 log_info(
-                    f"Browser bridge stored credentials for {website} (user: {username}) "
-                    f"from {token.get('fingerprint')}"
+                    "Browser bridge stored credentials for %s (user: %s) from %s",
+                    website,
+                    username,
+                    token.get('fingerprint'),
                 )
 
                 return {
@@ -425,7 +433,7 @@ class BrowserBridgeService:
             except HTTPException:
                 raise
             except Exception as exc:
-                log_warning(f"Failed to store credentials: {exc}")
+                log_warning("Failed to store credentials: %s", exc)
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"Failed to store credentials: {str(exc)}",
@@ -437,7 +445,9 @@ class BrowserBridgeService:
             token: Dict[str, Any] = Depends(require_token),
         ) -> Dict[str, Any]:
             log_info(
-                f"Received audit report from {token.get('fingerprint')}: {payload.get('summary', 'n/a')}"
+                "Received audit report from %s: %s",
+                token.get('fingerprint'),
+                payload.get('summary', 'n/a'),
             )
             return {"status": "recorded"}
 
@@ -445,7 +455,7 @@ class BrowserBridgeService:
         async def clipboard_clear(
             token: Dict[str, Any] = Depends(require_token),
         ) -> Dict[str, Any]:
-            log_info(f"Clipboard clear requested by {token.get('fingerprint')}")
+            log_info("Clipboard clear requested by %s", token.get('fingerprint'))
             return {"status": "cleared"}
 
         return app
@@ -510,7 +520,7 @@ class BrowserBridgeService:
                             origin_domain = origin.replace("https://", "").replace("http://", "").split("/")[0]
                             origin_name = origin_domain.split(".")[0] if "." in origin_domain else origin_domain
 
-                            for entry in get_passwords():
+                            for entry in iter_passwords():
                                 (_entry_id, website, username, encrypted, _category, _notes,
                                  _created, _updated, _expiry, _favorite) = entry
                                 site = (website or "").lower()
@@ -553,7 +563,7 @@ class BrowserBridgeService:
             send_message(conn, response)
 
         except Exception as e:
-            log_warning(f"Error handling socket request: {e}")
+            log_warning("Error handling socket request: %s", e)
             try:
                 send_message(conn, {"status_code": 500, "body": {"detail": "Internal server error"}})
             except Exception:
@@ -566,11 +576,15 @@ class BrowserBridgeService:
         if not self._socket_server or not self._socket_path:
             return
 
-        log_info(f"Domain socket server listening on {self._socket_path}")
+        log_info("Domain socket server listening on %s", self._socket_path)
 
         while self._socket_server:
             try:
                 conn, _ = self._socket_server.accept()
+                if not is_peer_authorized(conn):
+                    log_warning("Rejected domain socket connection from another user")
+                    conn.close()
+                    continue
                 # Handle each connection in a separate thread
                 handler_thread = threading.Thread(
                     target=self._handle_socket_request,
@@ -582,7 +596,7 @@ class BrowserBridgeService:
                 # Socket closed or error
                 break
             except Exception as e:
-                log_warning(f"Socket server error: {e}")
+                log_warning("Socket server error: %s", e)
 
     def start(self) -> None:
         if self.is_running:
@@ -591,7 +605,10 @@ class BrowserBridgeService:
         # Start HTTP/HTTPS server
         # Configure TLS if enabled
         if self.enable_tls and self._cert_path and self._key_path:
-            log_info(f"Browser bridge TLS enabled with certificate fingerprint: {self._cert_fingerprint}")
+            log_info(
+                "Browser bridge TLS enabled with certificate fingerprint: %s",
+                self._cert_fingerprint,
+            )
             config_obj = uvicorn.Config(
                 self._app,
                 host=self.host,
@@ -617,7 +634,7 @@ class BrowserBridgeService:
         self._thread = threading.Thread(target=_run_server, daemon=True)
         self._thread.start()
         protocol = "https" if self.enable_tls else "http"
-        log_info(f"Browser bridge started on {protocol}://{self.host}:{self.port}")
+        log_info("Browser bridge started on %s://%s:%s", protocol, self.host, self.port)
 
         # Start domain socket server if enabled
         if self.enable_domain_socket and is_socket_available() and self._socket_path:
@@ -625,9 +642,9 @@ class BrowserBridgeService:
                 self._socket_server = create_socket_server(self._socket_path)
                 self._socket_thread = threading.Thread(target=self._run_socket_server, daemon=True)
                 self._socket_thread.start()
-                log_info(f"Domain socket bridge started on {self._socket_path}")
+                log_info("Domain socket bridge started on %s", self._socket_path)
             except Exception as e:
-                log_warning(f"Failed to start domain socket server: {e}")
+                log_warning("Failed to start domain socket server: %s", e)
 
     def stop(self) -> None:
         # Stop HTTP server
@@ -643,7 +660,7 @@ class BrowserBridgeService:
             try:
                 self._socket_server.close()
             except Exception as e:
-                log_warning(f"Error closing socket server: {e}")
+                log_warning("Error closing socket server: %s", e)
             self._socket_server = None
 
         if self._socket_thread:
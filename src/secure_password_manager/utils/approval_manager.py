@@ -8,6 +8,7 @@ remembering decisions, and audit logging.
 from __future__ import annotations
 
 import json
+import secrets
 import threading
 import time
 from dataclasses import asdict, dataclass
@@ -15,6 +16,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from secure_password_manager.utils import serialization
 from secure_password_manager.utils.logger import log_info, log_warning
 from secure_password_manager.utils.paths import get_data_dir
 
@@ -58,6 +60,10 @@ class ApprovalResponse:
             self.timestamp = time.time()
 
 
+# Fields exposed by ApprovalStore.list_approvals()
+_APPROVAL_FIELDS = ("origin", "fingerprint", "timestamp", "approved")
+
+
 class ApprovalStore:
     """Manages persistent approval decisions (remembered origins)."""
 
@@ -73,20 +79,20 @@ class ApprovalStore:
             return
 
         try:
-            with open(self.path, encoding="utf-8") as f:
-                self._approvals = json.load(f)
+            with open(self.path, "rb") as f:
+                self._approvals = serialization.loads(f.read())
         except (OSError, json.JSONDecodeError) as e:
-            log_warning(f"Failed to load approval store: {e}")
+            log_warning("Failed to load approval store: %s", e)
             self._approvals = {}
 
     def _save(self) -> None:
         """Save approvals to disk."""
         try:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self._approvals, f, indent=2)
+            with open(self.path, "wb") as f:
+                f.write(serialization.dumps(self._approvals, indent=True))
         except OSError as e:
-            log_warning(f"Failed to save approval store: {e}")
+            log_warning("Failed to save approval store: %s", e)
 
     def is_approved(self, origin: str, fingerprint: str) -> bool:
         """Check if an origin is pre-approved for a fingerprint."""
@@ -109,7 +115,7 @@ class ApprovalStore:
             "fingerprint": fingerprint,
         }
         self._save()
-        log_info(f"Remembered approval for {origin}: {approved}")
+        log_info("Remembered approval for %s: %s", origin, approved)
 
     def revoke_approval(self, origin: str, fingerprint: str) -> bool:
         """Revoke a remembered approval."""
@@ -117,19 +123,14 @@ class ApprovalStore:
         if key in self._approvals:
             del self._approvals[key]
             self._save()
-            log_info(f"Revoked approval for {origin}")
+            log_info("Revoked approval for %s", origin)
             return True
         return False
 
     def list_approvals(self) -> List[Dict[str, Any]]:
         """List all remembered approvals."""
         return [
-            {
-                "origin": approval["origin"],
-                "fingerprint": approval["fingerprint"],
-                "timestamp": approval["timestamp"],
-                "approved": approval["approved"],
-            }
+            {field: approval[field] for field in _APPROVAL_FIELDS}
             for approval in self._approvals.values()
         ]
 
@@ -138,7 +139,7 @@ class ApprovalStore:
         count = len(self._approvals)
         self._approvals = {}
         self._save()
-        log_info(f"Cleared {count} remembered approvals")
+        log_info("Cleared %s remembered approvals", count)
         return count
 
 
@@ -177,15 +178,15 @@ class ApprovalManager:
         """
         # Check if pre-approved
         if self._store.is_approved(origin, fingerprint):
-            log_info(f"Auto-approved credential access for {origin} (remembered)")
+            log_info("Auto-approved credential access for %s (remembered)", origin)
             return ApprovalResponse(
                 request_id="auto",
                 decision=ApprovalDecision.APPROVED,
                 remember=True,
             )
 
-        # Create approval request
-        request_id = f"{origin}_{int(time.time() * 1000)}"
+        # Create approval request; random IDs cannot collide under bursts
+        request_id = secrets.token_hex(8)
         request = ApprovalRequest(
             request_id=request_id,
             origin=origin,
@@ -199,7 +200,13 @@ class ApprovalManager:
         with self._lock:
             self._pending[request_id] = request
 
-        log_info(f"Approval requested for {origin} from {browser} ({fingerprint})")
+        log_info(
+            "Approval %s requested for %s from %s (%s)",
+            request_id,
+            origin,
+            browser,
+            fingerprint,
+        )
 
         # Prompt user if handler is set
         if self._prompt_handler:
@@ -221,7 +228,7 @@ class ApprovalManager:
 
                 return response
             except Exception as e:
-                log_warning(f"Approval prompt handler failed: {e}")
+                log_warning("Approval prompt handler failed: %s", e)
                 # Fall through to timeout
 
         # No handler or handler failed - return timeout
@@ -271,7 +278,7 @@ class ApprovalManager:
             self._responses[request_id] = response
             del self._pending[request_id]
 
-            log_info(f"Approval {decision.value} for {request.origin}")
+            log_info("Approval %s for %s", decision.value, request.origin)
             return True
 
     def get_approval_store(self) -> ApprovalStore:
@@ -281,29 +288,39 @@ class ApprovalManager:
     def cleanup_old_responses(self, max_age_seconds: int = 300) -> int:
         """Remove old responses to prevent memory buildup."""
         cutoff = time.time() - max_age_seconds
-        removed = 0
 
         with self._lock:
-            to_remove = [
-                rid for rid, resp in self._responses.items() if resp.timestamp < cutoff
-            ]
-            for rid in to_remove:
-                del self._responses[rid]
-                removed += 1
+            kept = {
+                rid: resp
+                for rid, resp in self._responses.items()
+                if resp.timestamp >= cutoff
+            }
+            removed = len(self._responses) - len(kept)
+            if removed:
+                self._responses = kept
 
         if removed > 0:
-            log_info(f"Cleaned up {removed} old approval responses")
+            log_info("Cleaned up %s old approval responses", removed)
 
         return removed
 
 
 # Global approval manager instance
 _approval_manager: Optional[ApprovalManager] = None
+_approval_manager_lock = threading.Lock()
 
 
 def get_approval_manager() -> ApprovalManager:
-    """Get or create the global approval manager instance."""
+    """Get or create the global approval manager instance.
+
+    Reads are lock-free once initialized; the lock only guards first
+    construction so racing threads never create two stores on one file.
+    """
     global _approval_manager
-    if _approval_manager is None:
-        _approval_manager = ApprovalManager()
-    return _approval_manager
+    manager = _approval_manager
+    if manager is None:
+        with _approval_manager_lock:
+            if _approval_manager is None:
+                _approval_manager = ApprovalManager()
+            manager = _approval_manager
+    return manager
@@ -8,13 +8,17 @@ import hmac
 import json
 import os
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from secure_password_manager.utils.config import get_setting
 from secure_password_manager.utils.paths import get_auth_json_path
 
 DEFAULT_AUTH_ITERATIONS = 390_000
 
+# Parsed auth record keyed by (path, st_mtime_ns, st_size) so repeated
+# authentications skip re-reading auth.json until the file changes.
+_auth_cache: Optional[Tuple[Tuple[str, int, int], Dict[str, Any]]] = None
+
 
 def _get_auth_file() -> str:
     """Get the auth file path."""
@@ -31,21 +35,37 @@ def _pbkdf2(password: str, salt: bytes, iterations: int) -> bytes:
 
 
 def _load_auth_data() -> Optional[Dict[str, Any]]:
+    global _auth_cache
+
     auth_file = _get_auth_file()
-    if not os.path.exists(auth_file):
+    try:
+        st = os.stat(auth_file)
+    except OSError:
         return None
+
+    key = (auth_file, st.st_mtime_ns, st.st_size)
+    if _auth_cache is not None and _auth_cache[0] == key:
+        return _auth_cache[1]
+
     try:
         with open(auth_file, encoding="utf-8") as handle:
             data = json.load(handle)
-        return data if isinstance(data, dict) else None
     except (OSError, json.JSONDecodeError):
         return None
+    if not isinstance(data, dict):
+        return None
+    _auth_cache = (key, data)
+    return data
 
 
 def _write_auth_data(data: Dict[str, Any]) -> None:
+    global _auth_cache
+
     auth_file = _get_auth_file()
     with open(auth_file, "w", encoding="utf-8") as handle:
         json.dump(data, handle, indent=2, sort_keys=True)
+    # Writes may land within the filesystem's mtime granularity
+    _auth_cache = None
 
 
 def _upgrade_legacy_hash(password: str, legacy_hash: str) -> bool:
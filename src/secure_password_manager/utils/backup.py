@@ -14,11 +14,12 @@ Key design principles:
 5. Atomic operations with rollback on failure
 """
 
+import base64
 import contextlib
+import hashlib
 import json
 import os
 import shutil
-import sqlite3
 import tempfile
 import time
 import zipfile
@@ -26,13 +27,26 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from secure_password_manager.utils.crypto import (
-    decrypt_password,
+    STREAM_MAGIC,
+    decrypt_stream_with_password_envelope,
+    decrypt_with_key,
     decrypt_with_password_envelope,
     encrypt_password,
-    encrypt_with_password_envelope,
+    encrypt_stream_with_password_envelope,
+    load_key,
+)
+from secure_password_manager.utils import serialization
+from secure_password_manager.utils.database import (
+    add_category,
+    copy_database,
+    get_categories,
+    get_passwords,
+    get_write_connection,
+    replace_database,
+    sqlite3,
 )
-from secure_password_manager.utils.database import add_category, get_categories, get_passwords
 from secure_password_manager.utils.logger import log_error, log_info, log_warning
+from secure_password_manager.utils.migrations import invalidate_schema_cache
 from secure_password_manager.utils.paths import (
     get_auth_json_path,
     get_crypto_salt_path,
@@ -43,6 +57,8 @@ from secure_password_manager.utils.paths import (
 
 # Constants
 EXPORT_VERSION = "2.0"
+# Entries carry the vault ciphertext ("encrypted_blob") instead of plaintext
+EXPORT_VERSION_CIPHERTEXT = "2.1"
 BACKUP_VERSION = "2.0"
 DEFAULT_TIMEOUT = 30.0  # seconds
 
@@ -64,7 +80,8 @@ class ImportError(Exception):
 def export_passwords(
     filename: str,
     master_password: str,
-    include_notes: bool = True
+    include_notes: bool = True,
+    preserve_ciphertext: bool = False,
 ) -> bool:
     """Export passwords to an encrypted file.
 
@@ -72,6 +89,9 @@ def export_passwords(
         filename: Path to export file (will add .dat extension if missing)
         master_password: Password to encrypt the export
         include_notes: Whether to include notes field
+        preserve_ciphertext: Store each entry's vault ciphertext instead of the
+            decrypted password. Faster for same-vault backup/restore, but the
+            export can only be imported into a vault using the same key.
 
     Returns:
         True if export succeeded, False otherwise
@@ -92,16 +112,16 @@ def export_passwords(
             return False
 
         # Build export structure
-        export_data = _build_export_data(passwords, include_notes)
+        export_data = _build_export_data(passwords, include_notes, preserve_ciphertext)
 
         # Encrypt and write atomically
         _write_encrypted_export(filename, export_data, master_password)
 
-        log_info(f"Exported {len(passwords)} passwords to {filename}")
+        log_info("Exported %s passwords to %s", len(passwords), filename)
         return True
 
     except Exception as e:
-        log_error(f"Export failed: {e}")
+        log_error("Export failed: %s", e)
         # Clean up partial file
         if os.path.exists(filename):
             try:
@@ -111,12 +131,19 @@ def export_passwords(
         return False
 
 
+def _vault_key_id() -> str:
+    """Short fingerprint of the active vault key (never the key itself)."""
+    return hashlib.sha256(load_key()).hexdigest()[:16]
+
+
 def _build_export_data(
     passwords: List[Tuple],
-    include_notes: bool
+    include_notes: bool,
+    preserve_ciphertext: bool = False,
 ) -> Dict:
     """Build the export data structure."""
     entries = []
+    key = None if preserve_ciphertext else load_key()
 
     for entry in passwords:
         (
@@ -132,20 +159,22 @@ def _build_export_data(
             favorite,
         ) = entry
 
-        # Decrypt password
-        password = decrypt_password(encrypted)
-
         # Build entry dict
         entry_data = {
             "website": website,
             "username": username,
-            "password": password,
             "category": category,
             "created_at": created_at,
             "updated_at": updated_at,
             "favorite": bool(favorite),
         }
 
+        if preserve_ciphertext:
+            # Skip the decrypt here and the re-encrypt on import
+            entry_data["encrypted_blob"] = base64.b64encode(encrypted).decode("ascii")
+        else:
+            entry_data["password"] = decrypt_with_key(key, encrypted)
+
         if include_notes:
             entry_data["notes"] = notes or ""
 
@@ -157,13 +186,18 @@ def _build_export_data(
     # Get categories
     categories = get_categories()
 
+    metadata = {
+        "version": EXPORT_VERSION,
+        "exported_at": int(time.time()),
+        "entry_count": len(entries),
+    }
+    if preserve_ciphertext:
+        metadata["version"] = EXPORT_VERSION_CIPHERTEXT
+        metadata["key_id"] = _vault_key_id()
+
     # Build final structure
     return {
-        "metadata": {
-            "version": EXPORT_VERSION,
-            "exported_at": int(time.time()),
-            "entry_count": len(entries),
-        },
+        "metadata": metadata,
         "categories": [
             {"name": name, "color": color}
             for name, color in categories
@@ -177,18 +211,18 @@ def _write_encrypted_export(
     data: Dict,
     master_password: str
 ) -> None:
-    """Write encrypted export to file atomically."""
-    # Serialize to JSON
-    json_data = json.dumps(data, separators=(',', ':'))
+    """Write encrypted export to file atomically.
 
-    # Encrypt with envelope (includes HMAC)
-    blob = encrypt_with_password_envelope(json_data, master_password)
+    The JSON document is streamed through the encryptor, so the ciphertext
+    never has to be held in memory alongside the plaintext.
+    """
+    chunks = serialization.iterdumps(data)
 
     # Write atomically (write to temp, then move)
     temp_path = f"{filename}.tmp"
     try:
         with open(temp_path, 'wb') as f:
-            f.write(blob)
+            encrypt_stream_with_password_envelope(chunks, f, master_password)
         # Atomic move
         os.replace(temp_path, filename)
     except Exception as e:
@@ -216,7 +250,7 @@ def import_passwords(filename: str, master_password: str) -> int:
         ImportError: If import fails critically
     """
     if not os.path.exists(filename):
-        log_error(f"Import failed: file not found: {filename}")
+        log_error("Import failed: file not found: %s", filename)
         return 0
 
     try:
@@ -230,6 +264,9 @@ def import_passwords(filename: str, master_password: str) -> int:
             log_warning("Import file contains no entries")
             return 0
 
+        # Ciphertext entries are only valid under the key that produced them
+        _check_ciphertext_key(import_data, entries)
+
         # Import categories first
         _import_categories(categories)
 
@@ -242,12 +279,17 @@ def import_passwords(filename: str, master_password: str) -> int:
         else:
             version = "legacy"
 
-        log_info(f"Imported {imported_count} passwords from {filename} (v{version})")
+        log_info(
+            "Imported %s passwords from %s (v%s)",
+            imported_count,
+            filename,
+            version,
+        )
 
         return imported_count
 
     except Exception as e:
-        log_error(f"Import failed: {e}")
+        log_error("Import failed: %s", e)
         return 0
 
 
@@ -255,10 +297,13 @@ def _read_encrypted_import(filename: str, master_password: str) -> Dict:
     """Read and decrypt import file."""
     try:
         with open(filename, 'rb') as f:
-            blob = f.read()
-
-        json_data = decrypt_with_password_envelope(blob, master_password)
-        return json.loads(json_data)
+            if f.read(len(STREAM_MAGIC)) == STREAM_MAGIC:
+                f.seek(0)
+                json_data = decrypt_stream_with_password_envelope(f, master_password)
+            else:
+                f.seek(0)
+                json_data = decrypt_with_password_envelope(f.read(), master_password)
+        return serialization.loads(json_data)
 
     except Exception as e:
         raise ImportError(f"Failed to decrypt import file: {e}") from e
@@ -291,6 +336,17 @@ def _validate_import_data(data: Dict) -> Tuple[List[Dict], List[Dict]]:
     return entries, categories
 
 
+def _check_ciphertext_key(data: Dict, entries: List[Dict]) -> None:
+    """Reject ciphertext entries exported under a different vault key."""
+    if not any("encrypted_blob" in item for item in entries):
+        return
+    key_id = data.get("metadata", {}).get("key_id") if isinstance(data, dict) else None
+    if key_id != _vault_key_id():
+        raise ImportError(
+            "Export contains vault ciphertext for a different encryption key"
+        )
+
+
 def _import_categories(categories: List[Dict]) -> None:
     """Import categories (best-effort, ignore duplicates)."""
     for category in categories:
@@ -307,46 +363,34 @@ def _import_entries(entries: List[Dict]) -> int:
     Returns:
         Number of entries successfully imported
     """
-    db_path = str(get_database_path())
+    now = int(time.time())
 
-    # Single connection for entire import
-    conn = sqlite3.connect(db_path, timeout=DEFAULT_TIMEOUT)
-    conn.execute("PRAGMA busy_timeout = 30000")
+    # Prepare batch insert
+    rows = []
+    for item in entries:
+        try:
+            row = _prepare_entry_row(item, now)
+            rows.append(row)
+        except Exception as e:
+            log_warning("Skipping invalid entry: %s", e)
+            continue
 
+    # Batch insert in single transaction on the shared (WAL-mode) connection
     try:
-        cursor = conn.cursor()
-        now = int(time.time())
-
-        # Prepare batch insert
-        rows = []
-        for item in entries:
-            try:
-                row = _prepare_entry_row(item, now)
-                rows.append(row)
-            except Exception as e:
-                log_warning(f"Skipping invalid entry: {e}")
-                continue
-
-        # Batch insert in single transaction
-        cursor.executemany(
-            """
-            INSERT INTO passwords (
-                website, username, password, category, notes,
-                created_at, updated_at, expiry_date, favorite
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            rows
-        )
-
-        conn.commit()
-        return len(rows)
-
+        with get_write_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO passwords (
+                    website, username, password, category, notes,
+                    created_at, updated_at, expiry_date, favorite
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
     except sqlite3.Error as e:
-        conn.rollback()
         raise ImportError(f"Database import failed: {e}") from e
 
-    finally:
-        conn.close()
+    return len(rows)
 
 
 def _prepare_entry_row(item: Dict, default_time: int) -> Tuple:
@@ -354,7 +398,6 @@ def _prepare_entry_row(item: Dict, default_time: int) -> Tuple:
     # Required fields
     website = item["website"]
     username = item["username"]
-    password = item["password"]
 
     # Optional fields with defaults
     category = item.get("category", "General")
@@ -368,8 +411,11 @@ def _prepare_entry_row(item: Dict, default_time: int) -> Tuple:
     if expiry_date is not None and not isinstance(expiry_date, int):
         expiry_date = None
 
-    # Encrypt password
-    encrypted = encrypt_password(password)
+    # Same-key exports carry ciphertext that can be stored as-is
+    if "encrypted_blob" in item:
+        encrypted = base64.b64decode(item["encrypted_blob"])
+    else:
+        encrypted = encrypt_password(item["password"])
 
     return (
         website,
@@ -413,25 +459,31 @@ def create_full_backup(backup_dir: str, master_password: str) -> Optional[str]:
                 log_error("Failed to export passwords for backup")
                 return None
 
+            # Snapshot the database through SQLite so WAL contents are included
+            database_path = os.path.join(temp_dir, "passwords.db")
+            copy_database(database_path)
+
             # Create backup zip
-            _create_backup_zip(backup_path, export_path, timestamp)
+            _create_backup_zip(backup_path, export_path, database_path, timestamp)
 
-        log_info(f"Created full backup at {backup_path}")
+        log_info("Created full backup at %s", backup_path)
         return backup_path
 
     except Exception as e:
-        log_error(f"Full backup failed: {e}")
+        log_error("Full backup failed: %s", e)
         return None
 
 
-def _create_backup_zip(zip_path: str, export_path: str, timestamp: int) -> None:
+def _create_backup_zip(
+    zip_path: str, export_path: str, database_path: str, timestamp: int
+) -> None:
     """Create backup zip with all necessary files."""
     with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as backup_zip:
         # Add password export
         backup_zip.write(export_path, "passwords_export.dat")
 
         # Add system files
-        _add_file_to_zip(backup_zip, get_database_path(), "passwords.db")
+        _add_file_to_zip(backup_zip, Path(database_path), "passwords.db")
         _add_file_to_zip(backup_zip, get_secret_key_path(), "secret.key")
         _add_file_to_zip(backup_zip, get_auth_json_path(), "auth.json")
         _add_file_to_zip(backup_zip, get_crypto_salt_path(), "crypto.salt")
@@ -466,7 +518,7 @@ def restore_from_backup(backup_path: str, master_password: str) -> bool:
         True if restore succeeded, False otherwise
     """
     if not os.path.exists(backup_path):
-        log_error(f"Restore failed: backup not found: {backup_path}")
+        log_error("Restore failed: backup not found: %s", backup_path)
         return False
 
     try:
@@ -487,19 +539,63 @@ def restore_from_backup(backup_path: str, master_password: str) -> bool:
 
             # Restore files
             _restore_files_from_temp(temp_dir)
+            invalidate_schema_cache()
 
-        log_info(f"Successfully restored from {backup_path}")
+        log_info("Successfully restored from %s", backup_path)
         return True
 
     except Exception as e:
-        log_error(f"Restore failed: {e}")
+        log_error("Restore failed: %s", e)
+        return False
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy file contents and mode, letting the kernel do the copy when possible.
+
+    Uses ``os.copy_file_range`` (Linux), which avoids a userspace read/write
+    loop and can reflink on btrfs/XFS. Falls back to ``shutil.copyfile``.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    copied = False
+    if copy_file_range is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                copied = remaining == 0
+        except OSError:
+            copied = False
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+
+
+def _same_filesystem(src: str, dst: str) -> bool:
+    """Return True if ``src`` can be renamed onto ``dst`` without copying."""
+    try:
+        return os.stat(src).st_dev == os.stat(os.path.dirname(dst) or ".").st_dev
+    except OSError:
         return False
 
 
 def _backup_current_files(suffix: int) -> None:
-    """Create backups of current files before restore."""
+    """Create backups of current files before restore.
+
+    The database is copied through SQLite (see ``copy_database``) so pages
+    still in its WAL file are included.
+    """
+    database_path = get_database_path()
+    if database_path.exists():
+        try:
+            copy_database(f"{database_path}.bak{suffix}")
+        except Exception as e:
+            log_warning("Failed to backup %s: %s", database_path, e)
+
     files_to_backup = [
-        get_database_path(),
         get_secret_key_path(),
         get_auth_json_path(),
         get_crypto_salt_path(),
@@ -509,15 +605,22 @@ def _backup_current_files(suffix: int) -> None:
         if file_path.exists():
             backup_path = Path(f"{file_path}.bak{suffix}")
             try:
-                shutil.copy(str(file_path), str(backup_path))
+                _fast_copy(str(file_path), str(backup_path))
             except Exception as e:
-                log_warning(f"Failed to backup {file_path}: {e}")
+                log_warning("Failed to backup %s: %s", file_path, e)
 
 
 def _restore_files_from_temp(temp_dir: str) -> None:
-    """Restore files from temporary extraction directory."""
+    """Restore files from temporary extraction directory.
+
+    The database is copied in through SQLite (see ``replace_database``)
+    rather than replacing the file under open connections.
+    """
+    database_path = os.path.join(temp_dir, "passwords.db")
+    if os.path.exists(database_path):
+        replace_database(database_path)
+
     file_mappings = {
-        "passwords.db": get_database_path(),
         "secret.key": get_secret_key_path(),
         "auth.json": get_auth_json_path(),
         "crypto.salt": get_crypto_salt_path(),
@@ -525,5 +628,10 @@ def _restore_files_from_temp(temp_dir: str) -> None:
 
     for filename, dest_path in file_mappings.items():
         source_path = os.path.join(temp_dir, filename)
-        if os.path.exists(source_path):
-            shutil.copy(source_path, str(dest_path))
\ No newline at end of file
+        if not os.path.exists(source_path):
+            continue
+        # Extracted files are discarded afterwards, so move them when we can
+        if _same_filesystem(source_path, str(dest_path)):
+            os.replace(source_path, str(dest_path))
+        else:
+            _fast_copy(source_path, str(dest_path))
\ No newline at end of file
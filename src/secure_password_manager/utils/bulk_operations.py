@@ -10,27 +10,67 @@ from __future__ import annotations
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from secure_password_manager.utils.crypto import decrypt_password, encrypt_password
+from secure_password_manager.utils.crypto import (
+    decrypt_many_with_key,
+    encrypt_with_key,
+    load_key,
+)
 from secure_password_manager.utils.database import (
-    delete_password,
+    bulk_delete_passwords,
+    bulk_update_passwords,
+    get_password_ids,
     get_passwords,
-    update_password,
 )
 from secure_password_manager.utils.logger import log_info, log_warning
 from secure_password_manager.utils.migrations import ensure_latest_schema
 from secure_password_manager.utils.password_generator import (
     PasswordOptions,
-    generate_password,
+    generate_passwords,
 )
 
+# Max IDs per "WHERE id IN (...)" query; stays below SQLite's 999 parameter limit
+_ID_BATCH_SIZE = 500
+
+
+def _fetch_entries_map(entry_ids: List[int]) -> Dict[int, Tuple]:
+    """Fetch the requested entries with batched IN queries, keyed by ID."""
+    unique_ids = list(dict.fromkeys(entry_ids))
+    entries: Dict[int, Tuple] = {}
+    for start in range(0, len(unique_ids), _ID_BATCH_SIZE):
+        for entry in get_passwords(ids=unique_ids[start : start + _ID_BATCH_SIZE]):
+            entries[entry[0]] = entry
+    return entries
+
 
 class BulkOperationResult:
-    """Result of a bulk operation."""
+    """Result of a bulk operation.
+
+    Failures and skips are stored as parallel id/reason lists; the
+    ``failed``/``skipped`` tuple views are built only when requested.
+    """
+
+    __slots__ = (
+        "successful",
+        "failed_ids",
+        "failed_reasons",
+        "skipped_ids",
+        "skipped_reasons",
+    )
 
     def __init__(self):
         self.successful: List[int] = []
-        self.failed: List[Tuple[int, str]] = []
-        self.skipped: List[Tuple[int, str]] = []
+        self.failed_ids: List[int] = []
+        self.failed_reasons: List[str] = []
+        self.skipped_ids: List[int] = []
+        self.skipped_reasons: List[str] = []
+
+    @property
+    def failed(self) -> List[Tuple[int, str]]:
+        return list(zip(self.failed_ids, self.failed_reasons))
+
+    @property
+    def skipped(self) -> List[Tuple[int, str]]:
+        return list(zip(self.skipped_ids, self.skipped_reasons))
 
     @property
     def success_count(self) -> int:
@@ -38,11 +78,11 @@ class BulkOperationResult:
 
     @property
     def failure_count(self) -> int:
-        return len(self.failed)
+        return len(self.failed_ids)
 
     @property
     def skip_count(self) -> int:
-        return len(self.skipped)
+        return len(self.skipped_ids)
 
     @property
     def total_attempted(self) -> int:
@@ -52,10 +92,12 @@ class BulkOperationResult:
         self.successful.append(entry_id)
 
     def add_failure(self, entry_id: int, reason: str) -> None:
-        self.failed.append((entry_id, reason))
+        self.failed_ids.append(entry_id)
+        self.failed_reasons.append(reason)
 
     def add_skip(self, entry_id: int, reason: str) -> None:
-        self.skipped.append((entry_id, reason))
+        self.skipped_ids.append(entry_id)
+        self.skipped_reasons.append(reason)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -69,6 +111,64 @@ class BulkOperationResult:
         }
 
 
+def _apply_bulk_updates(
+    result: BulkOperationResult,
+    updates: List[Dict[str, Any]],
+    op_name: str,
+) -> None:
+    """Write queued updates in one transaction and record per-entry outcomes."""
+    if not updates:
+        return
+
+    try:
+        failures = dict(bulk_update_passwords(updates))
+    except Exception as e:
+        failures = {update["entry_id"]: str(e) for update in updates}
+
+    for update in updates:
+        entry_id = update["entry_id"]
+        if entry_id in failures:
+            result.add_failure(entry_id, failures[entry_id])
+            log_warning("Bulk %s failed for entry %s: %s", op_name, entry_id, failures[entry_id])
+        else:
+            result.add_success(entry_id)
+
+
+def _bulk_update(
+    entry_ids: List[int],
+    field_updates: Dict[str, Any],
+    op_name: str,
+) -> BulkOperationResult:
+    """Apply the same field changes to many entries in one transaction.
+
+    Unchanged columns are carried over from the fetched row and merged with
+    ``field_updates`` before the batch is handed to ``bulk_update_passwords``.
+    """
+    result = BulkOperationResult()
+    entries_map = _fetch_entries_map(entry_ids)
+    updates = []
+
+    for entry_id in entry_ids:
+        entry = entries_map.get(entry_id)
+        if entry is None:
+            result.add_failure(entry_id, "Entry not found")
+            continue
+
+        update = {
+            "entry_id": entry_id,
+            "website": entry[1],
+            "username": entry[2],
+            "encrypted_password": entry[3],
+            "category": entry[4] or "General",
+            "notes": entry[5] or "",
+        }
+        update.update(field_updates)
+        updates.append(update)
+
+    _apply_bulk_updates(result, updates, op_name)
+    return result
+
+
 def bulk_delete(
     entry_ids: List[int],
     confirm_callback: Optional[Callable[[int], bool]] = None,
@@ -85,23 +185,33 @@ def bulk_delete(
     """
     result = BulkOperationResult()
 
-    for entry_id in entry_ids:
-        # Optional per-entry confirmation
-        if confirm_callback and not confirm_callback(entry_id):
-            result.add_skip(entry_id, "User cancelled")
-            continue
+    if confirm_callback is None:
+        to_delete = list(entry_ids)
+    else:
+        to_delete = []
+        for entry_id in entry_ids:
+            # Optional per-entry confirmation
+            if not confirm_callback(entry_id):
+                result.add_skip(entry_id, "User cancelled")
+                continue
+            to_delete.append(entry_id)
 
+    if to_delete:
         try:
-            delete_password(entry_id)
-            result.add_success(entry_id)
-            log_info(f"Bulk delete: removed entry {entry_id}")
+            bulk_delete_passwords(to_delete)
         except Exception as e:
-            result.add_failure(entry_id, str(e))
-            log_warning(f"Bulk delete failed for entry {entry_id}: {e}")
+            result.failed_ids.extend(to_delete)
+            result.failed_reasons.extend([str(e)] * len(to_delete))
+            log_warning("Bulk delete failed for entries %s: %s", to_delete, e)
+        else:
+            result.successful.extend(to_delete)
 
     log_info(
-        f"Bulk delete completed: {result.success_count} succeeded, "
-        f"{result.failure_count} failed, {result.skip_count} skipped"
+        "Bulk delete completed: %d succeeded, %d failed, %d skipped; removed ids=%s",
+        result.success_count,
+        result.failure_count,
+        result.skip_count,
+        result.successful,
     )
     return result
 
@@ -125,44 +235,56 @@ def bulk_rotate_passwords(
     ensure_latest_schema()
 
     result = BulkOperationResult()
+    entries_map = _fetch_entries_map(entry_ids)
+    updates = []
+    key = load_key()
+    options = password_options or PasswordOptions()
+
+    # Generate every replacement password up front from one entropy draw
+    found_count = sum(1 for entry_id in entry_ids if entry_id in entries_map)
+    try:
+        new_passwords = iter(generate_passwords(found_count, options))
+    except ValueError as e:
+        new_passwords = None
+        generation_error = str(e)
 
     for entry_id in entry_ids:
         try:
             # Get current entry
-            entries = [e for e in get_passwords() if e[0] == entry_id]
-            if not entries:
+            entry = entries_map.get(entry_id)
+            if entry is None:
                 result.add_failure(entry_id, "Entry not found")
                 continue
 
-            entry = entries[0]
-            website = entry[1]
-            username = entry[2]
-
-            # Generate new password
-            new_password = generate_password(options=password_options)
+            if new_passwords is None:
+                result.add_failure(entry_id, generation_error)
+                continue
 
             # Encrypt new password
-            encrypted = encrypt_password(new_password)
-
-            # Update with rotation tracking
-            update_password(
-                entry_id=entry_id,
-                website=website,
-                username=username,
-                encrypted_password=encrypted,
-                rotation_reason=rotation_reason,
-            )
+            encrypted = encrypt_with_key(key, next(new_passwords))
 
-            result.add_success(entry_id)
-            log_info(f"Bulk rotate: updated password for entry {entry_id}")
+            # Queue update with rotation tracking
+            updates.append(
+                {
+                    "entry_id": entry_id,
+                    "website": entry[1],
+                    "username": entry[2],
+                    "encrypted_password": encrypted,
+                    "rotation_reason": rotation_reason,
+                }
+            )
 
         except Exception as e:
             result.add_failure(entry_id, str(e))
-            log_warning(f"Bulk rotate failed for entry {entry_id}: {e}")
+            log_warning("Bulk rotate failed for entry %s: %s", entry_id, e)
+
+    _apply_bulk_updates(result, updates, "rotate")
 
     log_info(
-        f"Bulk password rotation completed: {result.success_count} succeeded, "
-        f"{result.failure_count} failed"
+        "Bulk password rotation completed: %d succeeded, %d failed; rotated ids=%s",
+        result.success_count,
+        result.failure_count,
+        result.successful,
     )
     return result
 
@@ -180,42 +302,14 @@ def bulk_change_category(
     Returns:
         BulkOperationResult with details of the operation.
     """
-    result = BulkOperationResult()
-
-    for entry_id in entry_ids:
-        try:
-            # Get current entry
-            entries = [e for e in get_passwords() if e[0] == entry_id]
-            if not entries:
-                result.add_failure(entry_id, "Entry not found")
-                continue
-
-            entry = entries[0]
-            website = entry[1]
-            username = entry[2]
-            encrypted = entry[3]
-            notes = entry[5] or ""
-
-            # Update category
-            update_password(
-                entry_id=entry_id,
-                website=website,
-                username=username,
-                encrypted_password=encrypted,
-                category=new_category,
-                notes=notes,
-            )
-
-            result.add_success(entry_id)
-            log_info(f"Bulk category change: updated entry {entry_id} to '{new_category}'")
-
-        except Exception as e:
-            result.add_failure(entry_id, str(e))
-            log_warning(f"Bulk category change failed for entry {entry_id}: {e}")
+    result = _bulk_update(entry_ids, {"category": new_category}, "category change")
 
     log_info(
-        f"Bulk category change completed: {result.success_count} succeeded, "
-        f"{result.failure_count} failed"
+        "Bulk category change completed: %d succeeded, %d failed; moved to '%s' ids=%s",
+        result.success_count,
+        result.failure_count,
+        new_category,
+        result.successful,
     )
     return result
 
@@ -233,47 +327,26 @@ def bulk_set_expiry(
     Returns:
         BulkOperationResult with details of the operation.
     """
-    result = BulkOperationResult()
-
-    for entry_id in entry_ids:
-        try:
-            # Get current entry
-            entries = [e for e in get_passwords() if e[0] == entry_id]
-            if not entries:
-                result.add_failure(entry_id, "Entry not found")
-                continue
-
-            entry = entries[0]
-            website = entry[1]
-            username = entry[2]
-            encrypted = entry[3]
-            category = entry[4] or "General"
-            notes = entry[5] or ""
-
-            # Update expiry (database uses expiry_days, not expiry_date)
-            # Pass None to clear, positive number to set days from now
-            update_password(
-                entry_id=entry_id,
-                website=website,
-                username=username,
-                encrypted_password=encrypted,
-                category=category,
-                notes=notes,
-                expiry_days=expiry_days,
-            )
-
-            result.add_success(entry_id)
-            action = f"set to {expiry_days} days" if expiry_days else "cleared"
-            log_info(f"Bulk expiry: {action} for entry {entry_id}")
-
-        except Exception as e:
-            result.add_failure(entry_id, str(e))
-            log_warning(f"Bulk expiry update failed for entry {entry_id}: {e}")
-
-    log_info(
-        f"Bulk expiry update completed: {result.success_count} succeeded, "
-        f"{result.failure_count} failed"
-    )
+    # Update expiry (database uses expiry_days, not expiry_date)
+    result = _bulk_update(entry_ids, {"expiry_days": expiry_days}, "expiry update")
+
+    if expiry_days:
+        log_info(
+            "Bulk expiry update completed: %d succeeded, %d failed; "
+            "set to %s days for ids=%s",
+            result.success_count,
+            result.failure_count,
+            expiry_days,
+            result.successful,
+        )
+    else:
+        log_info(
+            "Bulk expiry update completed: %d succeeded, %d failed; "
+            "cleared for ids=%s",
+            result.success_count,
+            result.failure_count,
+            result.successful,
+        )
     return result
 
 
@@ -290,56 +363,27 @@ def bulk_toggle_favorite(
     Returns:
         BulkOperationResult with details of the operation.
     """
-    result = BulkOperationResult()
-
-    for entry_id in entry_ids:
-        try:
-            # Get current entry
-            entries = [e for e in get_passwords() if e[0] == entry_id]
-            if not entries:
-                result.add_failure(entry_id, "Entry not found")
-                continue
-
-            entry = entries[0]
-            website = entry[1]
-            username = entry[2]
-            encrypted = entry[3]
-            category = entry[4] or "General"
-            notes = entry[5] or ""
-
-            # Update favorite status
-            update_password(
-                entry_id=entry_id,
-                website=website,
-                username=username,
-                encrypted_password=encrypted,
-                category=category,
-                notes=notes,
-                favorite=favorite,
-            )
-
-            result.add_success(entry_id)
-            action = "favorited" if favorite else "unfavorited"
-            log_info(f"Bulk favorite: {action} entry {entry_id}")
-
-        except Exception as e:
-            result.add_failure(entry_id, str(e))
-            log_warning(f"Bulk favorite toggle failed for entry {entry_id}: {e}")
+    result = _bulk_update(entry_ids, {"favorite": favorite}, "favorite toggle")
 
     log_info(
-        f"Bulk favorite toggle completed: {result.success_count} succeeded, "
-        f"{result.failure_count} failed"
+        "Bulk favorite toggle completed: %d succeeded, %d failed; %s ids=%s",
+        result.success_count,
+        result.failure_count,
+        "favorited" if favorite else "unfavorited",
+        result.successful,
     )
     return result
 
 
 def bulk_export(
     entry_ids: List[int],
+    max_workers: Optional[int] = None,
 ) -> Tuple[List[Dict[str, Any]], BulkOperationResult]:
     """Export multiple entries to a list of dictionaries.
 
     Args:
         entry_ids: List of entry IDs to export.
+        max_workers: Decryption threads for large exports (default: CPU count).
 
     Returns:
         Tuple of (exported_entries, result).
@@ -347,57 +391,60 @@ def bulk_export(
     """
     result = BulkOperationResult()
     exported = []
+    entries_map = _fetch_entries_map(entry_ids)
+    key = load_key()
 
+    found = []
     for entry_id in entry_ids:
-        try:
-            # Get entry
-            entries = [e for e in get_passwords() if e[0] == entry_id]
-            if not entries:
-                result.add_failure(entry_id, "Entry not found")
-                continue
-
-            entry = entries[0]
-            (
-                _id,
-                website,
-                username,
-                encrypted,
-                category,
-                notes,
-                created_at,
-                updated_at,
-                expiry_date,
-                favorite,
-            ) = entry
-
-            # Decrypt password
-            password = decrypt_password(encrypted)
-
-            # Add to export list
-            exported.append(
-                {
-                    "id": _id,
-                    "website": website,
-                    "username": username,
-                    "password": password,
-                    "category": category,
-                    "notes": notes,
-                    "created_at": created_at,
-                    "updated_at": updated_at,
-                    "expiry_date": expiry_date,
-                    "favorite": favorite,
-                }
-            )
-
-            result.add_success(entry_id)
+        entry = entries_map.get(entry_id)
+        if entry is None:
+            result.add_failure(entry_id, "Entry not found")
+            continue
+        found.append(entry)
+
+    decrypted = decrypt_many_with_key(key, [entry[3] for entry in found], max_workers)
+
+    for entry, (password, error) in zip(found, decrypted):
+        (
+            _id,
+            website,
+            username,
+            _encrypted,
+            category,
+            notes,
+            created_at,
+            updated_at,
+            expiry_date,
+            favorite,
+        ) = entry
+
+        if error is not None:
+            result.add_failure(_id, error)
+            log_warning("Bulk export failed for entry %s: %s", _id, error)
+            continue
 
-        except Exception as e:
-            result.add_failure(entry_id, str(e))
-            log_warning(f"Bulk export failed for entry {entry_id}: {e}")
+        # Add to export list
+        exported.append(
+            {
+                "id": _id,
+                "website": website,
+                "username": username,
+                "password": password,
+                "category": category,
+                "notes": notes,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "expiry_date": expiry_date,
+                "favorite": favorite,
+            }
+        )
+
+        result.add_success(_id)
 
     log_info(
-        f"Bulk export completed: {result.success_count} entries exported, "
-        f"{result.failure_count} failed"
+        "Bulk export completed: %d entries exported, %d failed",
+        result.success_count,
+        result.failure_count,
     )
     return exported, result
 
@@ -419,21 +466,9 @@ def select_entries_by_filter(
     Returns:
         List of matching entry IDs.
     """
-    entries = get_passwords(category=category, search_term=search_term)
-    current_time = int(time.time())
-
-    matching_ids = []
-    for entry in entries:
-        entry_id, _website, _username, _encrypted, _cat, _notes, _created, _updated, expiry, favorite = entry
-
-        # Apply filters
-        if favorites_only and not favorite:
-            continue
-
-        if expired_only:
-            if not expiry or expiry > current_time:
-                continue
-
-        matching_ids.append(entry_id)
-
-    return matching_ids
+    return get_password_ids(
+        category=category,
+        search_term=search_term,
+        favorites_only=favorites_only,
+        expired_before=int(time.time()) if expired_only else None,
+    )
@@ -6,8 +6,11 @@ configurable timeout to prevent sensitive data from remaining in the clipboard.
 
 from __future__ import annotations
 
+import sys
 import threading
-from typing import Optional
+import time
+import weakref
+from typing import Callable, Optional
 
 import pyperclip
 
@@ -15,12 +18,84 @@ from secure_password_manager.utils import config
 from secure_password_manager.utils.logger import log_info
 
 
+def _select_native_clear() -> Optional[Callable[[], None]]:
+    """Return a platform clipboard-clear function, or None to use pyperclip.
+
+    pyperclip shells out to a helper process on some platforms; where an
+    in-process API is available we empty the clipboard directly instead.
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        user32 = ctypes.windll.user32
+
+        def _clear_windows() -> None:
+            if not user32.OpenClipboard(None):
+                raise OSError("Could not open clipboard")
+            try:
+                user32.EmptyClipboard()
+            finally:
+                user32.CloseClipboard()
+
+        return _clear_windows
+
+    if sys.platform == "darwin":
+        try:
+            from AppKit import NSPasteboard
+        except ImportError:
+            return None
+
+        def _clear_macos() -> None:
+            NSPasteboard.generalPasteboard().clearContents()
+
+        return _clear_macos
+
+    return None
+
+
+_native_clear = _select_native_clear()
+
+
+def _run_clear_worker(
+    manager_ref: Callable[[], Optional["ClipboardManager"]],
+    wake: threading.Event,
+    stop: threading.Event,
+) -> None:
+    """Clear the clipboard whenever the manager's deadline passes.
+
+    Holds only a weak reference so the manager can still be garbage collected;
+    the thread exits once the manager is gone or ``stop`` is set.
+    """
+    while not stop.is_set():
+        manager = manager_ref()
+        if manager is None:
+            return
+
+        with manager._lock:
+            deadline = manager._deadline
+            due = deadline is not None and time.monotonic() >= deadline
+            if due:
+                manager._deadline = None
+        if due:
+            manager._clear_clipboard()
+            deadline = None
+        del manager
+
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        wake.wait(timeout)
+        wake.clear()
+
+
 class ClipboardManager:
     """Manages clipboard operations with automatic clearing."""
 
     def __init__(self) -> None:
-        self._clear_timer: Optional[threading.Timer] = None
+        self._deadline: Optional[float] = None
         self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._clear_seconds: Optional[int] = None
 
     def copy(self, text: str, auto_clear: bool = True) -> None:
         """
@@ -30,7 +105,7 @@ class ClipboardManager:
             text: The text to copy to clipboard.
             auto_clear: Whether to automatically clear the clipboard after timeout.
         """
-        # Cancel any existing timer
+        # Cancel any pending clear
         self._cancel_timer()
 
         # Copy to clipboard
@@ -39,32 +114,54 @@ class ClipboardManager:
 
         # Schedule auto-clear if enabled
         if auto_clear:
-            clear_seconds = config.get_setting("clipboard.auto_clear_seconds", 25)
+            clear_seconds = self._get_clear_seconds()
             if clear_seconds > 0:
                 self._schedule_clear(clear_seconds)
 
+    def _get_clear_seconds(self) -> int:
+        """Return the auto-clear timeout, reading settings on first use only."""
+        if self._clear_seconds is None:
+            self._clear_seconds = config.get_setting("clipboard.auto_clear_seconds", 25)
+        return self._clear_seconds
+
+    def reload_config(self) -> None:
+        """Re-read clipboard settings on the next copy."""
+        self._clear_seconds = None
+
     def _schedule_clear(self, seconds: int) -> None:
-        """Schedule clipboard clearing after specified seconds."""
+        """Schedule clipboard clearing after specified seconds.
+
+        A single long-lived worker thread services every copy; scheduling just
+        moves its deadline and wakes it to recompute the wait.
+        """
         with self._lock:
-            self._clear_timer = threading.Timer(seconds, self._clear_clipboard)
-            self._clear_timer.daemon = True
-            self._clear_timer.start()
-            log_info(f"Clipboard will auto-clear in {seconds} seconds")
+            self._deadline = time.monotonic() + seconds
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=_run_clear_worker,
+                    args=(weakref.ref(self), self._wake, self._stop),
+                    name="clipboard-auto-clear",
+                    daemon=True,
+                )
+                self._worker.start()
+            log_info("Clipboard will auto-clear in %s seconds", seconds)
+        self._wake.set()
 
     def _clear_clipboard(self) -> None:
         """Clear the clipboard contents."""
         try:
-            pyperclip.copy("")
+            if _native_clear is not None:
+                _native_clear()
+            else:
+                pyperclip.copy("")
             log_info("Clipboard cleared automatically")
         except Exception as e:
-            log_info(f"Failed to clear clipboard: {e}")
+            log_info("Failed to clear clipboard: %s", e)
 
     def _cancel_timer(self) -> None:
-        """Cancel any pending clear timer."""
+        """Cancel any pending clear."""
         with self._lock:
-            if self._clear_timer and self._clear_timer.is_alive():
-                self._clear_timer.cancel()
-                self._clear_timer = None
+            self._deadline = None
 
     def clear_now(self) -> None:
         """Immediately clear the clipboard and cancel any pending timers."""
@@ -72,8 +169,10 @@ class ClipboardManager:
         self._clear_clipboard()
 
     def __del__(self) -> None:
-        """Cleanup: cancel timer on deletion."""
-        self._cancel_timer()
+        """Cleanup: cancel the pending clear and stop the worker thread."""
+        self._deadline = None
+        self._stop.set()
+        self._wake.set()
 
 
 # Global clipboard manager instance
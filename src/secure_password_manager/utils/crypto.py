@@ -1,14 +1,17 @@
 """Cryptographic utilities for Password Manager."""
 
 import base64
+import concurrent.futures
 import hmac
+import io
 import json
 import os
 import time
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from secure_password_manager.utils import config
@@ -23,6 +26,14 @@ from secure_password_manager.utils.paths import (
 CURRENT_KDF_VERSION = 1
 DEFAULT_ITERATIONS = 100_000
 
+# Streaming export envelope: MAGIC + JSON header line + AES-CTR ciphertext + HMAC
+STREAM_MAGIC = b"SPMX\x01"
+STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_TAG_SIZE = 32
+
+# Below this many values decrypt_many_with_key decrypts inline, not in a pool
+_PARALLEL_DECRYPT_MIN = 32
+
 # In-memory context for master password (set at login)
 _MASTER_PW_CONTEXT: Optional[str] = None
 
@@ -358,6 +369,49 @@ def decrypt_password(
         raise ValueError(f"Decryption failed: {e}")
 
 
+def encrypt_with_key(key: bytes, password: str) -> bytes:
+    """Encrypt with an already-loaded vault key (see ``load_key``).
+
+    Bulk callers load the key once and reuse it, avoiding a key-file read
+    (or a full PBKDF2 run in password-derived mode) per entry.
+    """
+    return Fernet(key).encrypt(password.encode("utf-8"))
+
+
+def decrypt_with_key(key: bytes, encrypted_password: bytes) -> str:
+    """Decrypt with an already-loaded vault key (see ``load_key``)."""
+    try:
+        return Fernet(key).decrypt(encrypted_password).decode("utf-8")
+    except Exception as e:
+        raise ValueError(f"Decryption failed: {e}")
+
+
+def decrypt_many_with_key(
+    key: bytes,
+    encrypted: List[bytes],
+    max_workers: Optional[int] = None,
+) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Decrypt values in order with one loaded key, returning (password, error).
+
+    Failures are reported per value instead of raising. Large batches are
+    spread over a thread pool; small ones run inline where thread start-up
+    would cost more than it saves.
+    """
+
+    def decrypt_single(token: bytes) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            return decrypt_with_key(key, token), None
+        except Exception as e:
+            return None, str(e)
+
+    if len(encrypted) < _PARALLEL_DECRYPT_MIN:
+        return [decrypt_single(token) for token in encrypted]
+
+    workers = max_workers or min(len(encrypted), os.cpu_count() or 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(decrypt_single, encrypted))
+
+
 # Envelope helpers for export/import with integrity HMAC
 
 
@@ -381,10 +435,13 @@ def encrypt_with_password_envelope(plaintext: str, password: str) -> bytes:
 
 
 def decrypt_with_password_envelope(blob: bytes, password: str) -> str:
-    """Decrypt either a raw Fernet token (legacy) or a JSON envelope.
+    """Decrypt a streaming envelope, a JSON envelope, or a raw Fernet token (legacy).
 
     Verifies HMAC when envelope is present.
     """
+    if blob.startswith(STREAM_MAGIC):
+        return decrypt_stream_with_password_envelope(io.BytesIO(blob), password)
+
     # Try parse as JSON envelope
     integrity_error = False
     try:
@@ -408,3 +465,111 @@ def decrypt_with_password_envelope(blob: bytes, password: str) -> str:
 
     # Legacy format: blob is a raw Fernet token
     return decrypt_password(blob, master_password=password)
+
+
+# Streaming envelope: constant-memory export encryption for large vaults
+
+
+def encrypt_stream_with_password_envelope(
+    chunks: Iterable[Union[str, bytes]],
+    dst: BinaryIO,
+    password: str,
+) -> None:
+    """Encrypt an iterable of plaintext chunks straight into ``dst``.
+
+    Plaintext is buffered into ``STREAM_CHUNK_SIZE`` blocks and encrypted with
+    AES-256-CTR; an HMAC-SHA256 over the header and ciphertext is appended as
+    the final 32 bytes (encrypt-then-MAC).
+    """
+    enc_key, mac_key, kdf_meta = derive_keys_from_password(password)
+    nonce = os.urandom(16)
+    header = {
+        "format": "spm-export-stream",
+        "version": "3.0",
+        "kdf": kdf_meta,
+        "cipher": "AES-256-CTR",
+        "nonce": base64.b64encode(nonce).decode("ascii"),
+        "hmac_alg": "HMAC-SHA256",
+    }
+    header_line = STREAM_MAGIC + json.dumps(header).encode("utf-8") + b"\n"
+
+    mac = hmac.new(mac_key, header_line, digestmod="sha256")
+    encryptor = Cipher(
+        algorithms.AES(base64.urlsafe_b64decode(enc_key)), modes.CTR(nonce)
+    ).encryptor()
+    dst.write(header_line)
+
+    def _emit(data: Union[bytes, memoryview]) -> None:
+        ciphertext = encryptor.update(data)
+        mac.update(ciphertext)
+        dst.write(ciphertext)
+
+    pending = bytearray()
+    for chunk in chunks:
+        pending += chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        if len(pending) >= STREAM_CHUNK_SIZE:
+            # Large chunks are split so each cipher call stays block-sized
+            full = len(pending) - len(pending) % STREAM_CHUNK_SIZE
+            with memoryview(pending) as view:
+                for start in range(0, full, STREAM_CHUNK_SIZE):
+                    _emit(view[start : start + STREAM_CHUNK_SIZE])
+            del pending[:full]
+    if pending:
+        _emit(bytes(pending))
+
+    tail = encryptor.finalize()
+    if tail:
+        mac.update(tail)
+        dst.write(tail)
+    dst.write(mac.digest())
+
+
+def decrypt_stream_with_password_envelope(src: BinaryIO, password: str) -> str:
+    """Verify and decrypt a streaming envelope read from a seekable file.
+
+    The HMAC is checked over the whole file before any plaintext is produced.
+    """
+    header_line = src.readline(STREAM_CHUNK_SIZE)
+    if not header_line.startswith(STREAM_MAGIC) or not header_line.endswith(b"\n"):
+        raise ValueError("Not a streaming export envelope")
+    try:
+        header = json.loads(header_line[len(STREAM_MAGIC) :].decode("utf-8"))
+        kdf = header["kdf"]
+        salt = base64.b64decode(kdf["salt"])
+        iterations = int(kdf["iterations"])
+        nonce = base64.b64decode(header["nonce"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid streaming export header: {e}")
+
+    body_start = src.tell()
+    body_end = src.seek(0, io.SEEK_END) - _STREAM_TAG_SIZE
+    if body_end < body_start:
+        raise ValueError("Backup integrity verification failed")
+
+    enc_key, mac_key, _ = derive_keys_from_password(
+        password, salt=salt, iterations=iterations
+    )
+
+    def _read_body() -> Iterable[bytes]:
+        src.seek(body_start)
+        remaining = body_end - body_start
+        while remaining > 0:
+            block = src.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+
+    mac = hmac.new(mac_key, header_line, digestmod="sha256")
+    for block in _read_body():
+        mac.update(block)
+    expected = src.read(_STREAM_TAG_SIZE)
+    if not hmac.compare_digest(mac.digest(), expected):
+        raise ValueError("Backup integrity verification failed")
+
+    decryptor = Cipher(
+        algorithms.AES(base64.urlsafe_b64decode(enc_key)), modes.CTR(nonce)
+    ).decryptor()
+    parts = [decryptor.update(block) for block in _read_body()]
+    parts.append(decryptor.finalize())
+    return b"".join(parts).decode("utf-8")
@@ -8,20 +8,81 @@ This module provides a centralized database interface with:
 - Automatic cleanup
 """
 
-import sqlite3
+import atexit
+import itertools
 import threading
 import time
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+try:
+    # Same DB-API as the stdlib module, but built against a recent SQLite
+    # instead of the system library (``pip install .[fast]`` on Linux)
+    from pysqlite3 import dbapi2 as sqlite3
+except ImportError:  # pragma: no cover - depends on installed extras
+    import sqlite3
 
 from secure_password_manager.utils import config
-from secure_password_manager.utils.logger import log_info, log_warning
+from secure_password_manager.utils.logger import log_debug, log_info, log_warning
 from secure_password_manager.utils.paths import get_database_path
 
-
 # Thread-local storage for connections
 _thread_local = threading.local()
-_connection_lock = threading.RLock()
+
+# Categories rarely change; their list is cached per database file
+_categories_cache: Dict[str, List[Tuple[str, str]]] = {}
+_categories_lock = threading.Lock()
+
+# Whether each database file has the passwords_fts search index (migration 3)
+_search_index_cache: Dict[str, bool] = {}
+
+# history_max_versions value last written to metadata per database file; the
+# trg_prune_history trigger (migration 4) reads the limit from there
+_history_limit_synced: Dict[str, int] = {}
+
+# Read-query results are cached per thread (LRU, _QUERY_CACHE_SIZE entries)
+# and dropped whenever _write_version or the connection's data_version moves
+_QUERY_CACHE_SIZE = 128
+_write_counter = itertools.count(1)
+_write_version = 0
+
+# Trigram search cannot match terms shorter than this; those use LIKE
+_MIN_INDEXED_SEARCH_LEN = 3
+
+# Bytes of the database file to memory-map per connection
+_MMAP_SIZE = 256 * 1024 * 1024
+
+# Size of each connection's prepared-statement cache (sqlite3 default: 128)
+_STATEMENT_CACHE_SIZE = 256
+
+# Hot-path statements, kept as constants so they hit the statement cache
+_SQL_INSERT_PW = """
+    INSERT INTO passwords
+    (website, username, password, category, notes, created_at, updated_at, expiry_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_DEL_PW = "DELETE FROM passwords WHERE id = ?"
+_SQL_INSERT_CAT = "INSERT OR IGNORE INTO categories (name, color) VALUES (?, ?)"
+_SQL_INSERT_HIST = """
+    INSERT INTO password_history
+    (password_id, old_password, changed_at, rotation_reason, changed_by)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_SET_HIST_LIMIT = """
+    INSERT OR REPLACE INTO metadata (key, value)
+    VALUES ('history_max_versions', ?)
+"""
 
 
 def _get_db_file() -> str:
@@ -31,6 +92,9 @@ def _get_db_file() -> str:
 
 def _initialize_connection(conn: sqlite3.Connection) -> None:
     """Initialize a database connection with optimal settings."""
+    # Page size only applies to a new, empty file and must precede WAL mode
+    conn.execute("PRAGMA page_size=4096")
+
     # Enable WAL mode for better concurrency
     conn.execute("PRAGMA journal_mode=WAL")
 
@@ -46,6 +110,15 @@ def _initialize_connection(conn: sqlite3.Connection) -> None:
     # Optimize cache size (2MB)
     conn.execute("PRAGMA cache_size=-2000")
 
+    # Checkpoint the WAL every 1000 pages so commits share checkpoint I/O
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
+
+    # Memory-map up to 256MB of the file so reads skip read() and a page copy;
+    # SQLite silently caps this at its compile-time SQLITE_MAX_MMAP_SIZE
+    granted = conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}").fetchone()
+    if granted is not None and granted[0] < _MMAP_SIZE:
+        log_debug("SQLite memory-mapped I/O limited to %s bytes", granted[0])
+
 
 def _get_connection() -> sqlite3.Connection:
     """Get or create a thread-local database connection.
@@ -54,31 +127,120 @@ def _get_connection() -> sqlite3.Connection:
     Connections are cached per thread for performance.
     """
     if not hasattr(_thread_local, 'connection') or _thread_local.connection is None:
-        with _connection_lock:
-            conn = sqlite3.connect(_get_db_file(), timeout=30.0, check_same_thread=False)
-            _initialize_connection(conn)
-            _thread_local.connection = conn
-            log_info("Created new database connection for thread")
+        # The connection is private to this thread, so no lock is needed
+        conn = sqlite3.connect(
+            _get_db_file(),
+            timeout=30.0,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        _initialize_connection(conn)
+        _thread_local.connection = conn
+        log_info("Created new database connection for thread")
 
     return _thread_local.connection
 
 
+def _invalidate_categories_cache() -> None:
+    """Drop cached category lists after a write or database swap."""
+    with _categories_lock:
+        _categories_cache.clear()
+
+
+def invalidate_search_index_cache() -> None:
+    """Forget which databases have a usable search index (e.g. after a resync)."""
+    _search_index_cache.clear()
+
+
 def close_connection() -> None:
     """Close the thread-local database connection.
 
     This should be called when a thread is done with database operations,
     especially in long-running threads or background workers.
     """
+    _invalidate_categories_cache()
+    _search_index_cache.clear()
+    _history_limit_synced.clear()
+    _thread_local.query_cache = None
     if hasattr(_thread_local, 'connection') and _thread_local.connection is not None:
         try:
+            # Refresh planner statistics for the indexes used this session
+            _thread_local.connection.execute("PRAGMA optimize")
             _thread_local.connection.close()
             log_info("Closed database connection for thread")
         except Exception as e:
-            log_warning(f"Error closing database connection: {e}")
+            log_warning("Error closing database connection: %s", e)
         finally:
             _thread_local.connection = None
 
 
+# Flush the main thread's cached connection cleanly on interpreter exit
+atexit.register(close_connection)
+
+
+def copy_database(dest_path: str) -> None:
+    """Write a consistent copy of the database, WAL contents included, to a file."""
+    dest = sqlite3.connect(dest_path)
+    try:
+        _get_connection().backup(dest)
+    finally:
+        dest.close()
+
+
+def replace_database(source_path: str) -> None:
+    """Overwrite the database's contents with the SQLite file at ``source_path``.
+
+    The copy goes through SQLite's online backup API on this thread's
+    connection rather than swapping the file, so connections held by other
+    threads keep a valid file and WAL and see the restored data on their next
+    read.
+    """
+    source = sqlite3.connect(source_path)
+    try:
+        source.backup(_get_connection())
+    finally:
+        source.close()
+    _note_write()
+    _invalidate_categories_cache()
+    _search_index_cache.clear()
+    _history_limit_synced.clear()
+
+
+def _note_write() -> None:
+    """Invalidate every thread's cached query results after a write."""
+    global _write_version
+    _write_version = next(_write_counter)
+
+
+def _cached_query(key: Tuple, run: Callable[[sqlite3.Cursor], List[Tuple]]) -> List[Tuple]:
+    """Return ``run(cursor)``'s rows, reusing an earlier result for ``key``.
+
+    Results stay valid until a write commits through this module or, as
+    reported by ``PRAGMA data_version``, through any other connection. Reads
+    inside an open transaction always go to the database.
+    """
+    conn = _get_connection()
+    cursor = conn.cursor()
+    if conn.in_transaction:
+        return run(cursor)
+
+    stamp = (_write_version, cursor.execute("PRAGMA data_version").fetchone()[0])
+    cache = getattr(_thread_local, "query_cache", None)
+    if cache is None or _thread_local.query_cache_stamp != stamp:
+        cache = _thread_local.query_cache = OrderedDict()
+        _thread_local.query_cache_stamp = stamp
+
+    rows = cache.get(key)
+    if rows is None:
+        rows = run(cursor)
+        cache[key] = rows
+        if len(cache) > _QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return list(rows)
+
+
 @contextmanager
 def get_db_connection():
     """Context manager for database operations with automatic commit/rollback.
@@ -96,12 +258,56 @@ def get_db_connection():
         conn.commit()
     except Exception:
         conn.rollback()
+        # A rolled-back retention sync must be written again
+        _history_limit_synced.clear()
         raise
+    finally:
+        _note_write()
+
+
+@contextmanager
+def get_read_connection():
+    """Context manager for read-only queries.
+
+    No write transaction is opened, so in WAL mode readers on other threads'
+    connections proceed alongside the single writer.
+    """
+    yield _get_connection()
+
+
+@contextmanager
+def get_write_connection():
+    """Context manager for writes that takes the write lock upfront.
+
+    Starts with ``BEGIN IMMEDIATE`` so a writer waits (up to busy_timeout) for
+    the lock at the start instead of failing with SQLITE_BUSY when upgrading a
+    read transaction. Nested inside an open transaction it defers the
+    commit/rollback to the outer owner.
+    """
+    conn = _get_connection()
+    owns_transaction = not conn.in_transaction
+    if owns_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        if owns_transaction:
+            conn.commit()
+    except Exception:
+        if owns_transaction:
+            conn.rollback()
+            _history_limit_synced.clear()
+        raise
+    finally:
+        if owns_transaction:
+            _note_write()
 
 
 def init_db() -> None:
     """Initialize the database and create tables if not exists."""
-    from secure_password_manager.utils.migrations import ensure_latest_schema
+    from secure_password_manager.utils.migrations import (
+        ensure_latest_schema,
+        invalidate_schema_cache,
+    )
 
     try:
         with get_db_connection() as conn:
@@ -125,6 +331,30 @@ def init_db() -> None:
             """
             )
 
+            # Speeds up favorite/expiry filtering in bulk selection
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_passwords_favorite_expiry
+                ON passwords(favorite, expiry_date)
+            """
+            )
+
+            # Category filter plus the list ordering (favorite, website)
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_passwords_category_favorite_website
+                ON passwords(category, favorite DESC, website)
+            """
+            )
+
+            # Expiry range scans; most entries never expire, so keep it partial
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_passwords_expiry
+                ON passwords(expiry_date) WHERE expiry_date IS NOT NULL
+            """
+            )
+
             # Categories table
             cursor.execute(
                 """
@@ -145,16 +375,18 @@ def init_db() -> None:
                 ("Social", "orange"),
             ]
 
-            for category, color in default_categories:
-                cursor.execute(
-                    "INSERT OR IGNORE INTO categories (name, color) VALUES (?, ?)",
-                    (category, color),
-                )
+            cursor.executemany(_SQL_INSERT_CAT, default_categories)
+
+        _invalidate_categories_cache()
 
-        # Run any pending migrations (uses its own connection)
+        # Run any pending migrations; the file may have been recreated since
+        # the last check, so always re-check here
+        invalidate_schema_cache()
         ensure_latest_schema()
+        _search_index_cache.clear()
+        _history_limit_synced.clear()
     except Exception as e:
-        log_warning(f"Error initializing database: {e}")
+        log_warning("Error initializing database: %s", e)
         raise
 
 
@@ -170,14 +402,10 @@ def add_password(
     current_time = int(time.time())
     expiry_date = current_time + (expiry_days * 86400) if expiry_days else None
 
-    with get_db_connection() as conn:
+    with get_write_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            INSERT INTO passwords
-            (website, username, password, category, notes, created_at, updated_at, expiry_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+            _SQL_INSERT_PW,
             (
                 website,
                 username,
@@ -191,10 +419,111 @@ def add_password(
         )
 
 
+def add_passwords_bulk(
+    entries: Iterable[Tuple[str, str, bytes, str, str, Optional[int]]],
+) -> int:
+    """Insert many entries in one transaction.
+
+    Each item holds ``add_password`` positional arguments: ``(website,
+    username, encrypted_password, category, notes, expiry_days)``.
+
+    Returns:
+        Number of entries inserted.
+    """
+    current_time = int(time.time())
+    rows = [
+        (
+            website,
+            username,
+            encrypted_password,
+            category,
+            notes,
+            current_time,
+            current_time,
+            current_time + (expiry_days * 86400) if expiry_days else None,
+        )
+        for website, username, encrypted_password, category, notes, expiry_days in entries
+    ]
+    if not rows:
+        return 0
+
+    with get_write_connection() as conn:
+        conn.executemany(_SQL_INSERT_PW, rows)
+    return len(rows)
+
+
+def _has_search_index(cursor: sqlite3.Cursor) -> bool:
+    """Return True if the current database has a maintained passwords_fts index.
+
+    The sync triggers are dropped when the index is unusable with the loaded
+    SQLite (see ``migrations.sync_search_index``), so both must be present.
+    """
+    db_file = _get_db_file()
+    available = _search_index_cache.get(db_file)
+    if available is None:
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master"
+            " WHERE name IN ('passwords_fts', 'passwords_ai')"
+        )
+        available = cursor.fetchone()[0] == 2
+        _search_index_cache[db_file] = available
+    return available
+
+
+def _password_filters(
+    category: Optional[str] = None,
+    search_term: Optional[str] = None,
+    show_expired: bool = True,
+    ids: Optional[Sequence[int]] = None,
+    favorites_only: bool = False,
+    expired_before: Optional[int] = None,
+    use_search_index: bool = False,
+) -> Tuple[str, List[Any]]:
+    """Build the WHERE clause shared by password list queries."""
+    params: List[Any] = []
+    conditions = []
+
+    if ids is not None:
+        conditions.append(f"id IN ({', '.join('?' * len(ids))})")
+        params.extend(ids)
+
+    if category:
+        conditions.append("category = ?")
+        params.append(category)
+
+    if search_term:
+        if use_search_index and len(search_term) >= _MIN_INDEXED_SEARCH_LEN:
+            # Quoted trigram phrase: case-insensitive substring match
+            conditions.append(
+                "id IN (SELECT rowid FROM passwords_fts WHERE passwords_fts MATCH ?)"
+            )
+            params.append('"' + search_term.replace('"', '""') + '"')
+        else:
+            conditions.append("(website LIKE ? OR username LIKE ?)")
+            params.extend([f"%{search_term}%", f"%{search_term}%"])
+
+    if not show_expired:
+        conditions.append("(expiry_date IS NULL OR expiry_date > ?)")
+        params.append(int(time.time()))
+
+    if favorites_only:
+        conditions.append("favorite = 1")
+
+    if expired_before is not None:
+        conditions.append("expiry_date IS NOT NULL AND expiry_date != 0 AND expiry_date <= ?")
+        params.append(expired_before)
+
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    return where, params
+
+
 def get_passwords(
     category: Optional[str] = None,
     search_term: Optional[str] = None,
     show_expired: bool = True,
+    ids: Optional[Sequence[int]] = None,
+    favorites_only: bool = False,
+    expired_before: Optional[int] = None,
 ) -> List[Tuple]:
     """
     Retrieve password entries with filtering options.
@@ -203,46 +532,121 @@ def get_passwords(
         category: Filter by category name
         search_term: Search in website and username
         show_expired: Whether to include expired passwords
+        ids: Only return entries with these IDs (keep batches under
+            SQLite's bound-parameter limit)
+        favorites_only: Only return favorites
+        expired_before: Only return entries whose expiry is at or before
+            this timestamp
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+    if ids is not None and not ids:
+        return []
+
+    def run(cursor: sqlite3.Cursor) -> List[Tuple]:
+        where, params = _password_filters(
+            category,
+            search_term,
+            show_expired,
+            ids,
+            favorites_only,
+            expired_before,
+            use_search_index=bool(search_term) and _has_search_index(cursor),
+        )
+        # Order by favorite first, then by website
+        cursor.execute(
+            f"SELECT * FROM passwords{where} ORDER BY favorite DESC, website ASC",
+            params,
+        )
+        return cursor.fetchall()
 
-        query = "SELECT * FROM passwords"
-        params = []
-        conditions = []
+    if not show_expired:
+        # The expiry cut-off is "now", so the result cannot be reused
+        with get_read_connection() as conn:
+            return run(conn.cursor())
 
-        # Apply filters
-        if category:
-            conditions.append("category = ?")
-            params.append(category)
+    key = (
+        "get_passwords",
+        category,
+        search_term,
+        tuple(ids) if ids is not None else None,
+        favorites_only,
+        expired_before,
+    )
+    return _cached_query(key, run)
 
-        if search_term:
-            conditions.append("(website LIKE ? OR username LIKE ?)")
-            params.extend([f"%{search_term}%", f"%{search_term}%"])
 
-        if not show_expired:
-            conditions.append("(expiry_date IS NULL OR expiry_date > ?)")
-            params.append(int(time.time()))
+def iter_passwords(
+    category: Optional[str] = None,
+    search_term: Optional[str] = None,
+    show_expired: bool = True,
+    batch_size: int = 100,
+) -> Iterator[Tuple]:
+    """Yield the rows ``get_passwords`` returns, ``batch_size`` at a time.
 
-        # Construct WHERE clause if we have conditions
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+    For callers that scan and filter entries one by one: peak memory is one
+    batch rather than the whole vault, and the scan can stop early. Avoid
+    writing on the same thread until the iterator is exhausted or closed.
+    """
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+        where, params = _password_filters(
+            category,
+            search_term,
+            show_expired,
+            use_search_index=bool(search_term) and _has_search_index(cursor),
+        )
+        cursor.execute(
+            f"SELECT * FROM passwords{where} ORDER BY favorite DESC, website ASC",
+            params,
+        )
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
 
-        # Order by favorite first, then by website
-        query += " ORDER BY favorite DESC, website ASC"
 
-        cursor.execute(query, params)
-        return cursor.fetchall()
+def get_password_ids(
+    category: Optional[str] = None,
+    search_term: Optional[str] = None,
+    favorites_only: bool = False,
+    expired_before: Optional[int] = None,
+) -> List[int]:
+    """Return IDs of matching entries without fetching full rows."""
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+        where, params = _password_filters(
+            category,
+            search_term,
+            favorites_only=favorites_only,
+            expired_before=expired_before,
+            use_search_index=bool(search_term) and _has_search_index(cursor),
+        )
+        cursor.execute(
+            f"SELECT id FROM passwords{where} ORDER BY favorite DESC, website ASC",
+            params,
+        )
+        return [row[0] for row in cursor.fetchall()]
 
 
 def delete_password(entry_id: int) -> None:
     """Delete a password entry by ID."""
-    with get_db_connection() as conn:
+    with get_write_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM passwords WHERE id = ?", (entry_id,))
+        cursor.execute(_SQL_DEL_PW, (entry_id,))
 
 
-def update_password(
+def bulk_delete_passwords(entry_ids: Sequence[int]) -> None:
+    """Delete several password entries in a single transaction."""
+    with get_write_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany(_SQL_DEL_PW, [(i,) for i in entry_ids])
+
+
+def _apply_password_update(
+    cursor: sqlite3.Cursor,
     entry_id: int,
     website: Optional[str] = None,
     username: Optional[str] = None,
@@ -253,96 +657,143 @@ def update_password(
     favorite: Optional[bool] = None,
     rotation_reason: str = "manual",
 ) -> None:
-    """Update a password entry with new information."""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+    """Apply one entry update on an open cursor (caller owns the transaction)."""
+    # Only the old password is needed (for history); otherwise just check
+    # the entry exists
+    if encrypted_password is not None:
+        cursor.execute("SELECT password FROM passwords WHERE id = ?", (entry_id,))
+    else:
+        cursor.execute("SELECT 1 FROM passwords WHERE id = ?", (entry_id,))
+    current = cursor.fetchone()
+
+    if not current:
+        raise ValueError(f"Password entry {entry_id} not found")
+
+    # One timestamp for the history row, updated_at and the expiry date
+    current_time = int(time.time())
 
-        # Get current values
-        cursor.execute("SELECT * FROM passwords WHERE id = ?", (entry_id,))
-        current = cursor.fetchone()
+    # If password is being changed, save old password to history
+    if encrypted_password is not None and encrypted_password != current[0]:
+        # Check if password history is enabled
+        history_enabled = config.get_setting("password_history.enabled", True)
+
+        if history_enabled:
+            _record_password_history(
+                cursor,
+                password_id=entry_id,
+                old_password=current[0],
+                rotation_reason=rotation_reason,
+                changed_by="user",
+                changed_at=current_time,
+            )
 
-        if not current:
-            conn.rollback()
-            raise ValueError(f"Password entry {entry_id} not found")
-
-        # Map column names to indices
-        columns = [
-            "id",
-            "website",
-            "username",
-            "password",
-            "category",
-            "notes",
-            "created_at",
-            "updated_at",
-            "expiry_date",
-            "favorite",
-        ]
-        col_idx = {col: i for i, col in enumerate(columns)}
-
-        # If password is being changed, save old password to history
-        if (
-            encrypted_password is not None
-            and encrypted_password != current[col_idx["password"]]
-        ):
-            # Check if password history is enabled
-            history_enabled = config.get_setting("password_history.enabled", True)
-
-            if history_enabled:
-                add_password_history(
-                    password_id=entry_id,
-                    old_password=current[col_idx["password"]],
-                    rotation_reason=rotation_reason,
-                    changed_by="user",
-                )
+    # Prepare update values
+    updates: Dict[str, Any] = {"updated_at": current_time}
 
-        # Prepare update values
-        current_time = int(time.time())
-        updates: Dict[str, Any] = {"updated_at": current_time}
+    if website is not None:
+        updates["website"] = website
 
-        if website is not None:
-            updates["website"] = website
+    if username is not None:
+        updates["username"] = username
 
-        if username is not None:
-            updates["username"] = username
+    if encrypted_password is not None:
+        updates["password"] = encrypted_password
 
-        if encrypted_password is not None:
-            updates["password"] = encrypted_password
+    if category is not None:
+        updates["category"] = category
 
-        if category is not None:
-            updates["category"] = category
+    if notes is not None:
+        updates["notes"] = notes
 
-        if notes is not None:
-            updates["notes"] = notes
+    if expiry_days is not None:
+        updates["expiry_date"] = current_time + (expiry_days * 86400)
 
-        if expiry_days is not None:
-            updates["expiry_date"] = current_time + (expiry_days * 86400)
+    if favorite is not None:
+        updates["favorite"] = int(favorite)
 
-        if favorite is not None:
-            updates["favorite"] = int(favorite)
+    # Build update query
+    set_clause = ", ".join(f"{key} = ?" for key in updates.keys())
+    query = f"UPDATE passwords SET {set_clause} WHERE id = ?"
 
-        # Build update query
-        set_clause = ", ".join(f"{key} = ?" for key in updates.keys())
-        query = f"UPDATE passwords SET {set_clause} WHERE id = ?"
+    # Execute update
+    params = list(updates.values()) + [entry_id]
+    cursor.execute(query, params)
 
-        # Execute update
-        params = list(updates.values()) + [entry_id]
-        cursor.execute(query, params)
 
+def update_password(
+    entry_id: int,
+    website: Optional[str] = None,
+    username: Optional[str] = None,
+    encrypted_password: Optional[bytes] = None,
+    category: Optional[str] = None,
+    notes: Optional[str] = None,
+    expiry_days: Optional[int] = None,
+    favorite: Optional[bool] = None,
+    rotation_reason: str = "manual",
+) -> None:
+    """Update a password entry with new information."""
+    with get_write_connection() as conn:
+        _apply_password_update(
+            conn.cursor(),
+            entry_id,
+            website=website,
+            username=username,
+            encrypted_password=encrypted_password,
+            category=category,
+            notes=notes,
+            expiry_days=expiry_days,
+            favorite=favorite,
+            rotation_reason=rotation_reason,
+        )
 
-def get_categories() -> List[Tuple[str, str]]:
-    """Get list of all categories with their colors."""
-    with get_db_connection() as conn:
+
+def bulk_update_passwords(updates: Sequence[Dict[str, Any]]) -> List[Tuple[int, str]]:
+    """Apply several entry updates in a single transaction.
+
+    Each item holds ``update_password`` keyword arguments (``entry_id``
+    required). A failing item is rolled back on its own via a savepoint and
+    reported; the rest still commit together.
+
+    Returns:
+        List of ``(entry_id, error message)`` for updates that failed.
+    """
+    failures: List[Tuple[int, str]] = []
+    with get_write_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT name, color FROM categories")
-        return cursor.fetchall()
+        # Sync outside the per-row savepoints so a row rollback cannot undo it
+        _sync_history_limit(cursor)
+        for update in updates:
+            cursor.execute("SAVEPOINT bulk_update_row")
+            try:
+                _apply_password_update(cursor, **update)
+            except (ValueError, sqlite3.Error) as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT bulk_update_row")
+                failures.append((update["entry_id"], str(e)))
+            cursor.execute("RELEASE SAVEPOINT bulk_update_row")
+    return failures
+
+
+def get_categories() -> List[Tuple[str, str]]:
+    """Get list of all categories with their colors (cached until a write)."""
+    db_file = _get_db_file()
+    cached = _categories_cache.get(db_file)
+    if cached is None:
+        # Populate under the lock so a concurrent invalidation cannot be lost
+        with _categories_lock:
+            with get_read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT name, color FROM categories")
+                cached = cursor.fetchall()
+            _categories_cache[db_file] = cached
+    return list(cached)
 
 
 def add_category(name: str, color: str = "blue") -> None:
     """Add a new category."""
-    with get_db_connection() as conn:
+    with get_write_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("INSERT OR IGNORE INTO categories (name, color) VALUES (?, ?)", (name, color))
+        cursor.execute(_SQL_INSERT_CAT, (name, color))
+    _invalidate_categories_cache()
 
 
 def get_expiring_passwords(days: int = 30) -> List[Tuple]:
@@ -350,7 +801,7 @@ def get_expiring_passwords(days: int = 30) -> List[Tuple]:
     current_time = int(time.time())
     expiry_threshold = current_time + (days * 86400)
 
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -365,51 +816,59 @@ def get_expiring_passwords(days: int = 30) -> List[Tuple]:
         return cursor.fetchall()
 
 
-def add_password_history(
+def _sync_history_limit(cursor: sqlite3.Cursor) -> None:
+    """Mirror ``password_history.max_versions`` into the metadata table.
+
+    Only writes when the configured value differs from the last one synced
+    for this database file, so repeated history inserts cost nothing here.
+    """
+    max_versions = config.get_setting("password_history.max_versions", 10)
+    db_file = _get_db_file()
+    if _history_limit_synced.get(db_file) != max_versions:
+        cursor.execute(_SQL_SET_HIST_LIMIT, (str(max_versions),))
+        _history_limit_synced[db_file] = max_versions
+
+
+def _record_password_history(
+    cursor: sqlite3.Cursor,
     password_id: int,
     old_password: bytes,
     rotation_reason: str = "manual",
     changed_by: str = "user",
+    changed_at: Optional[int] = None,
 ) -> None:
-    """Record a password change in history."""
-    current_time = int(time.time())
+    """Insert a history row on an open cursor.
 
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+    Retention is enforced by the trg_prune_history trigger as part of the
+    insert. ``changed_at`` lets a caller reuse a timestamp it already has.
+    """
+    if changed_at is None:
+        changed_at = int(time.time())
 
-        # Add history entry
-        cursor.execute(
-            """
-            INSERT INTO password_history
-            (password_id, old_password, changed_at, rotation_reason, changed_by)
-            VALUES (?, ?, ?, ?, ?)
-        """,
-            (password_id, old_password, current_time, rotation_reason, changed_by),
-        )
+    _sync_history_limit(cursor)
+    cursor.execute(
+        _SQL_INSERT_HIST,
+        (password_id, old_password, changed_at, rotation_reason, changed_by),
+    )
 
-        # Enforce retention limit
-        max_versions = config.get_setting("password_history.max_versions", 10)
 
-        if max_versions > 0:
-            cursor.execute(
-                """
-                DELETE FROM password_history
-                WHERE password_id = ?
-                AND id NOT IN (
-                    SELECT id FROM password_history
-                    WHERE password_id = ?
-                    ORDER BY changed_at DESC
-                    LIMIT ?
-                )
-            """,
-                (password_id, password_id, max_versions),
-            )
+def add_password_history(
+    password_id: int,
+    old_password: bytes,
+    rotation_reason: str = "manual",
+    changed_by: str = "user",
+) -> None:
+    """Record a password change in history."""
+    with get_write_connection() as conn:
+        _record_password_history(
+            conn.cursor(), password_id, old_password, rotation_reason, changed_by
+        )
 
 
 def get_password_history(password_id: int, limit: int = 10) -> List[Tuple]:
     """Get password change history for an entry."""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+
+    def run(cursor: sqlite3.Cursor) -> List[Tuple]:
         cursor.execute(
             """
             SELECT id, password_id, old_password, changed_at, rotation_reason, changed_by
@@ -422,6 +881,8 @@ def get_password_history(password_id: int, limit: int = 10) -> List[Tuple]:
         )
         return cursor.fetchall()
 
+    return _cached_query(("get_password_history", password_id, limit), run)
+
 
 def get_all_password_history(limit: int = 50) -> List[Tuple]:
     """
@@ -433,7 +894,7 @@ def get_all_password_history(limit: int = 50) -> List[Tuple]:
     Returns:
         List of tuples with password details and history.
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -457,7 +918,7 @@ def get_all_password_history(limit: int = 50) -> List[Tuple]:
 
 def delete_password_history(password_id: int) -> None:
     """Delete all history for a password entry."""
-    with get_db_connection() as conn:
+    with get_write_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM password_history WHERE password_id = ?", (password_id,))
-        log_info(f"Password history deleted for entry {password_id}")
+        log_info("Password history deleted for entry %s", password_id)
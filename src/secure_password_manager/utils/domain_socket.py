@@ -7,17 +7,31 @@ offer better security on Unix-like systems by leveraging filesystem permissions.
 
 from __future__ import annotations
 
-import json
 import os
 import socket
 import stat
+import struct
 import tempfile
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
+from secure_password_manager.utils import serialization
 from secure_password_manager.utils.logger import log_info, log_warning
 from secure_password_manager.utils.paths import get_data_dir
 
+# Connections the server queues while busy (browser extensions open bursts)
+_LISTEN_BACKLOG = 128
+
+# Largest message a client reuses its receive buffer for; bigger ones get a
+# one-off buffer so a rare large reply does not stay allocated
+_MAX_POOLED_BUFFER = 1 << 20
+
+# Kernel send/receive buffer size requested for both ends of the socket
+_SOCKET_BUFFER_SIZE = 1 << 20
+
+# Socket directories already created and restricted during this process
+_prepared_socket_dirs: Set[Path] = set()
+
 
 def get_socket_path() -> Path:
     """Get the path for the domain socket.
@@ -29,20 +43,20 @@ def get_socket_path() -> Path:
     runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
     if runtime_dir:
         socket_dir = Path(runtime_dir) / "secure-password-manager"
-        socket_dir.mkdir(parents=True, exist_ok=True)
     else:
         socket_dir = get_data_dir() / "sockets"
-        socket_dir.mkdir(parents=True, exist_ok=True)
 
-    socket_path = socket_dir / "bridge.sock"
-
-    # Ensure directory has restrictive permissions (owner only)
-    try:
-        os.chmod(socket_dir, stat.S_IRWXU)  # 700
-    except OSError as e:
-        log_warning(f"Failed to set socket directory permissions: {e}")
+    if socket_dir not in _prepared_socket_dirs:
+        socket_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure directory has restrictive permissions (owner only)
+        try:
+            os.chmod(socket_dir, stat.S_IRWXU)  # 700
+        except OSError as e:
+            log_warning("Failed to set socket directory permissions: %s", e)
+        else:
+            _prepared_socket_dirs.add(socket_dir)
 
-    return socket_path
+    return socket_dir / "bridge.sock"
 
 
 def is_socket_available() -> bool:
@@ -68,9 +82,9 @@ def cleanup_socket(socket_path: Path) -> None:
     try:
         if socket_path.exists():
             socket_path.unlink()
-            log_info(f"Cleaned up socket: {socket_path}")
+            log_info("Cleaned up socket: %s", socket_path)
     except OSError as e:
-        log_warning(f"Failed to cleanup socket {socket_path}: {e}")
+        log_warning("Failed to cleanup socket %s: %s", socket_path, e)
 
 
 def create_socket_server(socket_path: Path) -> socket.socket:
@@ -96,16 +110,18 @@ def create_socket_server(socket_path: Path) -> socket.socket:
     sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
 
     try:
-        # Bind to path
-        sock.bind(str(socket_path))
+        # Accepted connections inherit these buffer sizes
+        _set_buffer_sizes(sock)
 
-        # Set restrictive permissions (owner read/write only)
+        # Bind to path; the socket directory is already owner-only (700), so
+        # nobody else can reach the socket before it is restricted here
+        sock.bind(str(socket_path))
         os.chmod(socket_path, stat.S_IRUSR | stat.S_IWUSR)  # 600
 
         # Start listening
-        sock.listen(5)
+        sock.listen(_LISTEN_BACKLOG)
 
-        log_info(f"Domain socket server listening on {socket_path}")
+        log_info("Domain socket server listening on %s", socket_path)
         return sock
 
     except OSError as e:
@@ -114,6 +130,34 @@ def create_socket_server(socket_path: Path) -> socket.socket:
         raise OSError(f"Failed to create socket server: {e}") from e
 
 
+def is_peer_authorized(conn: socket.socket) -> bool:
+    """Check that the process on the other end of ``conn`` runs as this user.
+
+    Uses ``SO_PEERCRED`` where the platform provides it; elsewhere the
+    owner-only socket directory is the only access control and this
+    returns True.
+    """
+    peercred = getattr(socket, "SO_PEERCRED", None)
+    if peercred is None:
+        return True
+    try:
+        creds = conn.getsockopt(socket.SOL_SOCKET, peercred, struct.calcsize("3i"))
+    except OSError as e:
+        log_warning("Failed to read peer credentials: %s", e)
+        return False
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+def _set_buffer_sizes(sock: socket.socket) -> None:
+    """Request larger kernel buffers so big messages do not block mid-write.
+
+    The kernel may clamp the sizes (e.g. to ``net.core.rmem_max``).
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+
+
 def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
     """Send a JSON message over a socket.
 
@@ -124,18 +168,46 @@ def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
     Raises:
         OSError: If sending fails.
     """
-    data = json.dumps(message).encode("utf-8")
+    data = serialization.dumps(message)
     # Prefix with 4-byte length
     length = len(data).to_bytes(4, byteorder="big")
-    sock.sendall(length + data)
+    if hasattr(sock, "sendmsg"):
+        # Gather prefix and payload in the kernel instead of concatenating
+        _sendmsg_all(sock, [memoryview(length), memoryview(data)])
+    else:
+        sock.sendall(length + data)
+
 
+def _sendmsg_all(sock: socket.socket, buffers: List[memoryview]) -> None:
+    """Send every buffer with ``sendmsg``, resuming after partial sends.
 
-def receive_message(sock: socket.socket, timeout: Optional[float] = 30.0) -> Dict[str, Any]:
+    Args:
+        sock: Socket to send on.
+        buffers: Buffers to send, in order.
+
+    Raises:
+        OSError: If sending fails.
+    """
+    while buffers:
+        sent = sock.sendmsg(buffers)
+        while buffers and sent >= len(buffers[0]):
+            sent -= len(buffers.pop(0))
+        if sent:
+            buffers[0] = buffers[0][sent:]
+
+
+def receive_message(
+    sock: socket.socket,
+    timeout: Optional[float] = 30.0,
+    buffer: Optional[bytearray] = None,
+) -> Dict[str, Any]:
     """Receive a JSON message from a socket.
 
     Args:
         sock: Socket to receive from.
         timeout: Timeout in seconds (None for blocking).
+        buffer: Reusable receive buffer, grown in place when a message
+            (up to ``_MAX_POOLED_BUFFER`` bytes) does not fit.
 
     Returns:
         Received message dictionary.
@@ -145,30 +217,32 @@ def receive_message(sock: socket.socket, timeout: Optional[float] = 30.0) -> Dic
         json.JSONDecodeError: If message is not valid JSON.
         TimeoutError: If timeout is reached.
     """
-    if timeout is not None:
+    # gettimeout() is a plain attribute read; settimeout() costs a syscall,
+    # so only switch when a connection's timeout actually changes
+    if timeout is not None and sock.gettimeout() != timeout:
         sock.settimeout(timeout)
 
     # Read 4-byte length prefix
-    length_data = _recv_exact(sock, 4)
-    if not length_data:
-        raise OSError("Connection closed before receiving length")
-
-    message_length = int.from_bytes(length_data, byteorder="big")
+    message_length = int.from_bytes(_recv_exact(sock, 4), byteorder="big")
 
     # Sanity check message length (max 10MB)
     if message_length > 10 * 1024 * 1024:
         raise ValueError(f"Message too large: {message_length} bytes")
 
-    # Read message data
-    data = _recv_exact(sock, message_length)
-    if not data:
-        raise OSError("Connection closed before receiving complete message")
+    if buffer is None or message_length > _MAX_POOLED_BUFFER:
+        # Parsed straight from the UTF-8 bytes, no decode step
+        return serialization.loads(_recv_exact(sock, message_length))
+
+    if len(buffer) < message_length:
+        buffer.extend(bytes((1 << (message_length - 1).bit_length()) - len(buffer)))
 
-    return json.loads(data.decode("utf-8"))
+    with memoryview(buffer) as view, view[:message_length] as payload:
+        _recv_into(sock, payload)
+        return serialization.loads(payload)
 
 
-def _recv_exact(sock: socket.socket, length: int) -> bytes:
-    """Receive exactly `length` bytes from socket.
+def _recv_exact(sock: socket.socket, length: int) -> bytearray:
+    """Receive exactly `length` bytes from socket into a new buffer.
 
     Args:
         sock: Socket to receive from.
@@ -178,15 +252,30 @@ def _recv_exact(sock: socket.socket, length: int) -> bytes:
         Received bytes.
 
     Raises:
-        OSError: If receiving fails.
+        OSError: If receiving fails or the peer closes the connection early.
+    """
+    buf = bytearray(length)
+    _recv_into(sock, memoryview(buf))
+    return buf
+
+
+def _recv_into(sock: socket.socket, view: memoryview) -> None:
+    """Fill ``view`` completely from the socket.
+
+    Reads straight into the caller's buffer instead of concatenating chunks.
+
+    Raises:
+        OSError: If receiving fails or the peer closes the connection early.
     """
-    data = b""
-    while len(data) < length:
-        chunk = sock.recv(length - len(data))
-        if not chunk:
-            break
-        data += chunk
-    return data
+    length = len(view)
+    received = 0
+    while received < length:
+        count = sock.recv_into(view[received:], length - received)
+        if not count:
+            raise OSError(
+                f"Connection closed after receiving {received} of {length} bytes"
+            )
+        received += count
 
 
 class DomainSocketClient:
@@ -200,6 +289,7 @@ class DomainSocketClient:
         """
         self.socket_path = socket_path or get_socket_path()
         self.sock: Optional[socket.socket] = None
+        self._recv_buf = bytearray(4096)
 
     def connect(self, timeout: float = 5.0) -> None:
         """Connect to the socket server.
@@ -221,8 +311,9 @@ class DomainSocketClient:
         self.sock.settimeout(timeout)
 
         try:
+            _set_buffer_sizes(self.sock)
             self.sock.connect(str(self.socket_path))
-            log_info(f"Connected to domain socket: {self.socket_path}")
+            log_info("Connected to domain socket: %s", self.socket_path)
         except OSError as e:
             self.sock.close()
             self.sock = None
@@ -259,7 +350,7 @@ class DomainSocketClient:
         if not self.sock:
             raise RuntimeError("Not connected to socket server")
 
-        return receive_message(self.sock, timeout)
+        return receive_message(self.sock, timeout, self._recv_buf)
 
     def close(self) -> None:
         """Close the connection."""
@@ -268,7 +359,7 @@ class DomainSocketClient:
                 self.sock.close()
                 log_info("Closed domain socket connection")
             except OSError as e:
-                log_warning(f"Error closing socket: {e}")
+                log_warning("Error closing socket: %s", e)
             finally:
                 self.sock = None
 
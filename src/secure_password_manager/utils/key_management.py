@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import hashlib
 import os
-import sqlite3
 import time
 from pathlib import Path
 from typing import Any, Dict, List
@@ -25,8 +24,8 @@ from secure_password_manager.utils.crypto import (
     save_kdf_params,
     unprotect_key,
 )
+from secure_password_manager.utils.database import get_write_connection
 from secure_password_manager.utils.paths import (
-    get_database_path,
     get_secret_key_enc_path,
     get_secret_key_path,
 )
@@ -70,14 +69,12 @@ def _reencrypt_vault(
     target_mode: str,
     master_password: str,
 ) -> int:
-    db_path = str(get_database_path())
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, password FROM passwords")
-    rows = cursor.fetchall()
-
     updated = 0
-    try:
+    with get_write_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, password FROM passwords")
+        rows = cursor.fetchall()
+
         for entry_id, encrypted in rows:
             plaintext = decrypt_password(
                 encrypted,
@@ -98,12 +95,6 @@ def _reencrypt_vault(
                 (ciphertext, int(time.time()), entry_id),
             )
             updated += 1
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
     return updated
 
 
@@ -123,13 +114,12 @@ def _reencrypt_password_mode_vault(
     old_cipher = Fernet(old_key)
     new_cipher = Fernet(new_key)
 
-    db_path = str(get_database_path())
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, password FROM passwords")
-    rows = cursor.fetchall()
     updated = 0
-    try:
+    with get_write_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, password FROM passwords")
+        rows = cursor.fetchall()
+
         for entry_id, encrypted in rows:
             plaintext = old_cipher.decrypt(encrypted)
             ciphertext = new_cipher.encrypt(plaintext)
@@ -138,12 +128,6 @@ def _reencrypt_password_mode_vault(
                 (ciphertext, int(time.time()), entry_id),
             )
             updated += 1
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
     return updated
 
 
@@ -1,9 +1,12 @@
 """Logging utilities for password manager."""
 
+import atexit
 import logging
 import os
+import queue
 import time
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import BinaryIO, List, Optional
 
 from secure_password_manager.utils.paths import get_log_dir
 
@@ -12,12 +15,31 @@ LOG_DIR: Optional[str] = None
 LOG_FILE: Optional[str] = None
 _initialized = False
 
+# Records are handed to a background listener that does the file/console I/O
+_log_queue: Optional["queue.Queue[logging.LogRecord]"] = None
+_listener: Optional[QueueListener] = None
+
 logger = logging.getLogger("password_manager")
 
 
+def _stop_listener() -> None:
+    """Write out queued records and stop the background listener."""
+    global _log_queue, _listener
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+    _listener = None
+    _log_queue = None
+
+
+atexit.register(_stop_listener)
+
+
 def _ensure_logger_initialized() -> None:
     """Ensure logger is initialized with proper paths."""
-    global LOG_DIR, LOG_FILE, _initialized
+    global LOG_DIR, LOG_FILE, _initialized, _log_queue, _listener
 
     if _initialized:
         return
@@ -27,42 +49,79 @@ def _ensure_logger_initialized() -> None:
 
     # Configure logger only once
     if not logger.handlers:
+        _stop_listener()
         handler = logging.FileHandler(LOG_FILE)
         handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-        logger.addHandler(handler)
-        logger.addHandler(logging.StreamHandler())
+
+        # Callers only enqueue; the listener thread writes, so logging from
+        # worker threads never waits on the file handler's lock or flush
+        _log_queue = queue.Queue(-1)
+        _listener = QueueListener(_log_queue, handler, logging.StreamHandler())
+        _listener.start()
+        logger.addHandler(QueueHandler(_log_queue))
         logger.setLevel(logging.INFO)
 
     _initialized = True
 
 
-def log_info(message: str) -> None:
-    """Log an informational message."""
+def log_info(message: str, *args: object) -> None:
+    """Log an informational message; ``args`` are %-formatted only if it is emitted."""
     _ensure_logger_initialized()
-    logger.info(message)
+    logger.info(message, *args)
 
 
-def log_error(message: str) -> None:
-    """Log an error message."""
+def log_error(message: str, *args: object) -> None:
+    """Log an error message; ``args`` are %-formatted only if it is emitted."""
     _ensure_logger_initialized()
-    logger.error(message)
+    logger.error(message, *args)
 
 
-def log_warning(message: str) -> None:
-    """Log a warning message."""
+def log_warning(message: str, *args: object) -> None:
+    """Log a warning message; ``args`` are %-formatted only if it is emitted."""
     _ensure_logger_initialized()
-    logger.warning(message)
+    logger.warning(message, *args)
 
 
-def log_debug(message: str) -> None:
-    """Log a debug message."""
+def log_debug(message: str, *args: object) -> None:
+    """Log a debug message; ``args`` are %-formatted only if it is emitted."""
     _ensure_logger_initialized()
-    logger.debug(message)
+    logger.debug(message, *args)
+
+
+def flush_logs() -> None:
+    """Block until every record logged so far has been written."""
+    log_queue = _log_queue
+    if log_queue is not None:
+        log_queue.join()
+
+
+def _read_tail(f: BinaryIO, count: int, block_size: int = 4096) -> bytes:
+    """Read enough whole lines from the end of ``f`` to cover ``count`` lines.
+
+    Seeks backwards a block at a time like ``tail -n`` so only the end of a
+    large log is read. A non-positive ``count`` reads the whole file.
+    """
+    if count <= 0:
+        return f.read()
+
+    pos = f.seek(0, os.SEEK_END)
+    blocks: List[bytes] = []
+    newlines = 0
+    # One extra newline: the file's final line break does not start a line
+    while pos > 0 and newlines <= count:
+        step = min(block_size, pos)
+        pos -= step
+        f.seek(pos)
+        block = f.read(step)
+        blocks.append(block)
+        newlines += block.count(b"\n")
+    return b"".join(reversed(blocks))
 
 
 def get_log_entries(count: int = 50) -> list:
     """Get the most recent log entries."""
     _ensure_logger_initialized()
+    flush_logs()
     entries = []
     assert LOG_FILE is not None
 
@@ -70,10 +129,11 @@ def get_log_entries(count: int = 50) -> list:
         return entries
 
     try:
-        with open(LOG_FILE) as f:
-            lines = f.readlines()
+        with open(LOG_FILE, "rb") as f:
+            data = _read_tail(f, count)
 
         # Get the last 'count' lines
+        lines = data.decode("utf-8", errors="replace").splitlines(keepends=True)
         return lines[-count:]
     except Exception as e:
         logger.error(f"Error reading log file: {e}")
@@ -83,6 +143,7 @@ def get_log_entries(count: int = 50) -> list:
 def clear_logs(backup: bool = True) -> bool:
     """Clear logs with optional backup."""
     _ensure_logger_initialized()
+    flush_logs()
     assert LOG_FILE is not None
     if not os.path.exists(LOG_FILE):
         return True
@@ -109,6 +170,8 @@ def reset_logger() -> None:
     LOG_FILE = None
     _initialized = False
 
+    _stop_listener()
+
     # Remove all handlers
     for handler in logger.handlers[:]:
         handler.close()
@@ -1,11 +1,22 @@
 """Database migration utilities."""
 
-import sqlite3
-from typing import Any, Callable, Dict, List, Optional
-
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from secure_password_manager.utils.database import (
+    get_read_connection,
+    get_write_connection,
+    invalidate_search_index_cache,
+    sqlite3,  # the connection's driver module, so its exceptions match
+)
 from secure_password_manager.utils.logger import log_info, log_warning
 from secure_password_manager.utils.paths import get_database_path
 
+# Database paths already confirmed at the latest schema in this process
+_schema_ready: Set[str] = set()
+
+# Triggers that keep passwords_fts (migration 3) in sync with passwords
+_SEARCH_TRIGGERS = ("passwords_ai", "passwords_ad", "passwords_au")
+
 
 def _get_db_file() -> str:
     """Get the database file path."""
@@ -14,102 +25,259 @@ def _get_db_file() -> str:
 
 def get_schema_version() -> int:
     """Get the current schema version from the database."""
-    conn = sqlite3.connect(_get_db_file())
-    cursor = conn.cursor()
-
-    # Check if metadata table exists
-    cursor.execute(
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+
+        # Check if metadata table exists
+        cursor.execute(
+            """
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='metadata'
         """
-        SELECT name FROM sqlite_master
-        WHERE type='table' AND name='metadata'
-    """
-    )
+        )
 
-    if not cursor.fetchone():
-        # No metadata table means version 0
-        conn.close()
-        return 0
+        if not cursor.fetchone():
+            # No metadata table means version 0
+            return 0
 
-    # Get version from metadata
-    cursor.execute("SELECT value FROM metadata WHERE key = 'schema_version'")
-    result = cursor.fetchone()
-    conn.close()
+        # Get version from metadata
+        cursor.execute("SELECT value FROM metadata WHERE key = 'schema_version'")
+        result = cursor.fetchone()
 
     return int(result[0]) if result else 0
 
 
 def set_schema_version(version: int) -> None:
     """Set the schema version in the database."""
-    conn = sqlite3.connect(_get_db_file())
-    cursor = conn.cursor()
+    with get_write_connection() as conn:
+        cursor = conn.cursor()
+
+        # Create metadata table if it doesn't exist
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+        """
+        )
 
-    # Create metadata table if it doesn't exist
-    cursor.execute(
+        # Update or insert version
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO metadata (key, value)
+            VALUES ('schema_version', ?)
+        """,
+            (str(version),),
+        )
+
+
+def migration_001_add_password_history() -> None:
+    """Migration 001: Add password_history table."""
+    with get_write_connection() as conn:
+        cursor = conn.cursor()
+
+        # Create password_history table
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS password_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                password_id INTEGER NOT NULL,
+                old_password BLOB NOT NULL,
+                changed_at INTEGER NOT NULL,
+                rotation_reason TEXT DEFAULT 'manual',
+                changed_by TEXT DEFAULT 'user',
+                FOREIGN KEY (password_id) REFERENCES passwords(id) ON DELETE CASCADE
+            )
         """
-        CREATE TABLE IF NOT EXISTS metadata (
-            key TEXT PRIMARY KEY,
-            value TEXT NOT NULL
         )
+
+        # Create index for faster lookups
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_password_history_password_id
+            ON password_history(password_id)
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_password_history_changed_at
+            ON password_history(changed_at DESC)
+        """
+        )
+
+    log_info("Migration 001: password_history table created")
+
+
+def migration_002_history_lookup_index() -> None:
+    """Migration 002: Composite (password_id, changed_at) history index.
+
+    Serves the per-entry history listing and retention prune from one index;
+    it also covers lookups by password_id alone, so that index is dropped.
     """
-    )
+    with get_write_connection() as conn:
+        cursor = conn.cursor()
 
-    # Update or insert version
-    cursor.execute(
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_password_history_password_changed
+            ON password_history(password_id, changed_at DESC)
         """
-        INSERT OR REPLACE INTO metadata (key, value)
-        VALUES ('schema_version', ?)
-    """,
-        (str(version),),
-    )
+        )
 
-    conn.commit()
-    conn.close()
+        cursor.execute("DROP INDEX IF EXISTS idx_password_history_password_id")
 
+    log_info("Migration 002: password_history lookup index created")
 
-def migration_001_add_password_history() -> None:
-    """Migration 001: Add password_history table."""
-    conn = sqlite3.connect(_get_db_file())
-    cursor = conn.cursor()
 
-    # Create password_history table
+def migration_003_add_search_index() -> None:
+    """Migration 003: Trigram FTS5 index over website/username for search.
+
+    Skipped with a warning when SQLite lacks FTS5 or the trigram tokenizer
+    (SQLite < 3.34); searches then keep using LIKE scans.
+    """
+    with get_write_connection() as conn:
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS passwords_fts USING fts5(
+                    website, username,
+                    content='passwords', content_rowid='id',
+                    tokenize='trigram'
+                )
+            """
+            )
+        except sqlite3.OperationalError as e:
+            log_warning(
+                "Migration 003: search index unavailable (%s), using LIKE search",
+                e,
+            )
+            return
+
+        _create_search_triggers(cursor)
+
+        # Index entries that existed before the migration
+        cursor.execute("INSERT INTO passwords_fts(passwords_fts) VALUES ('rebuild')")
+
+    log_info("Migration 003: password search index created")
+
+
+def _create_search_triggers(cursor: sqlite3.Cursor) -> None:
+    """Keep the external-content passwords_fts index in sync with passwords."""
     cursor.execute(
         """
-        CREATE TABLE IF NOT EXISTS password_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            password_id INTEGER NOT NULL,
-            old_password BLOB NOT NULL,
-            changed_at INTEGER NOT NULL,
-            rotation_reason TEXT DEFAULT 'manual',
-            changed_by TEXT DEFAULT 'user',
-            FOREIGN KEY (password_id) REFERENCES passwords(id) ON DELETE CASCADE
-        )
+        CREATE TRIGGER IF NOT EXISTS passwords_ai AFTER INSERT ON passwords BEGIN
+            INSERT INTO passwords_fts(rowid, website, username)
+            VALUES (new.id, new.website, new.username);
+        END
     """
     )
-
-    # Create index for faster lookups
     cursor.execute(
         """
-        CREATE INDEX IF NOT EXISTS idx_password_history_password_id
-        ON password_history(password_id)
+        CREATE TRIGGER IF NOT EXISTS passwords_ad AFTER DELETE ON passwords BEGIN
+            INSERT INTO passwords_fts(passwords_fts, rowid, website, username)
+            VALUES ('delete', old.id, old.website, old.username);
+        END
     """
     )
-
     cursor.execute(
         """
-        CREATE INDEX IF NOT EXISTS idx_password_history_changed_at
-        ON password_history(changed_at DESC)
+        CREATE TRIGGER IF NOT EXISTS passwords_au
+        AFTER UPDATE OF website, username ON passwords BEGIN
+            INSERT INTO passwords_fts(passwords_fts, rowid, website, username)
+            VALUES ('delete', old.id, old.website, old.username);
+            INSERT INTO passwords_fts(rowid, website, username)
+            VALUES (new.id, new.website, new.username);
+        END
     """
     )
 
-    conn.commit()
-    conn.close()
 
-    log_info("Migration 001: password_history table created")
+def sync_search_index() -> None:
+    """Match the search index triggers to what this SQLite build supports.
+
+    A vault indexed under an SQLite with FTS5 trigram support (e.g. pysqlite3)
+    may later be opened with one without it, where every write would fail in
+    the sync triggers. The triggers are then dropped and searches use LIKE;
+    once the index is usable again they are recreated and it is rebuilt.
+    """
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name IN (?, ?, ?, ?)",
+            ("passwords_fts",) + _SEARCH_TRIGGERS,
+        )
+        names = {row[0] for row in cursor.fetchall()}
+        if "passwords_fts" not in names:
+            return
+        try:
+            cursor.execute("SELECT 1 FROM passwords_fts LIMIT 0")
+            usable = True
+        except sqlite3.OperationalError as e:
+            usable = False
+            error = e
+
+    has_triggers = names.issuperset(_SEARCH_TRIGGERS)
+    if usable and not has_triggers:
+        with get_write_connection() as conn:
+            cursor = conn.cursor()
+            _create_search_triggers(cursor)
+            cursor.execute("INSERT INTO passwords_fts(passwords_fts) VALUES ('rebuild')")
+        invalidate_search_index_cache()
+        log_info("Search index re-enabled and rebuilt")
+    elif not usable and names.intersection(_SEARCH_TRIGGERS):
+        with get_write_connection() as conn:
+            for trigger in _SEARCH_TRIGGERS:
+                conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        invalidate_search_index_cache()
+        log_warning(
+            "Search index unusable with this SQLite (%s), using LIKE search", error
+        )
+
+
+def migration_004_history_retention_trigger() -> None:
+    """Migration 004: Prune password history in an AFTER INSERT trigger.
+
+    The limit is read from the ``history_max_versions`` metadata row, which
+    the database module keeps in step with ``password_history.max_versions``;
+    a missing row or a limit of 0 keeps every version.
+    """
+    with get_write_connection() as conn:
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_prune_history
+            AFTER INSERT ON password_history
+            WHEN (SELECT CAST(value AS INTEGER) FROM metadata
+                  WHERE key = 'history_max_versions') > 0
+            BEGIN
+                DELETE FROM password_history
+                WHERE id IN (
+                    SELECT id FROM password_history
+                    WHERE password_id = NEW.password_id
+                    ORDER BY changed_at DESC, id DESC
+                    LIMIT -1 OFFSET (
+                        SELECT CAST(value AS INTEGER) FROM metadata
+                        WHERE key = 'history_max_versions'
+                    )
+                );
+            END
+        """
+        )
+
+    log_info("Migration 004: password history retention trigger created")
 
 
 # Migration registry: version -> migration function
 MIGRATIONS: Dict[int, Callable[[], None]] = {
     1: migration_001_add_password_history,
+    2: migration_002_history_lookup_index,
+    3: migration_003_add_search_index,
+    4: migration_004_history_retention_trigger,
 }
 
 
@@ -139,12 +307,15 @@ def run_migrations(target_version: Optional[int] = None) -> Dict[str, Any]:
 
     if target_version > max_version:
         log_warning(
-            f"Target version {target_version} exceeds max available {max_version}"
+            "Target version %s exceeds max available %s", target_version, max_version
         )
         target_version = max_version
 
     if current_version >= target_version:
-        log_info(f"Database already at version {current_version}, no migrations needed")
+        log_info(
+            "Database already at version %s, no migrations needed",
+            current_version,
+        )
         return {
             "current_version": current_version,
             "target_version": target_version,
@@ -155,23 +326,31 @@ def run_migrations(target_version: Optional[int] = None) -> Dict[str, Any]:
     migrations_run = []
     errors = []
 
-    for version in range(current_version + 1, target_version + 1):
-        if version not in MIGRATIONS:
-            log_warning(f"Migration {version} not found, skipping")
-            continue
-
-        try:
-            log_info(f"Running migration {version}...")
-            MIGRATIONS[version]()
-            set_schema_version(version)
+    # All pending migrations share one transaction (a single commit and
+    # fsync); each runs under a savepoint so a failure undoes only that
+    # migration and its version bump, keeping the ones before it
+    with get_write_connection() as conn:
+        for version in range(current_version + 1, target_version + 1):
+            if version not in MIGRATIONS:
+                log_warning("Migration %s not found, skipping", version)
+                continue
+
+            conn.execute("SAVEPOINT migration")
+            try:
+                log_info("Running migration %s...", version)
+                MIGRATIONS[version]()
+                set_schema_version(version)
+            except Exception as e:
+                conn.execute("ROLLBACK TO SAVEPOINT migration")
+                conn.execute("RELEASE SAVEPOINT migration")
+                error_msg = f"Migration {version} failed: {str(e)}"
+                log_warning(error_msg)
+                errors.append(error_msg)
+                # Stop on first error
+                break
+            conn.execute("RELEASE SAVEPOINT migration")
             migrations_run.append(version)
-            log_info(f"Migration {version} completed successfully")
-        except Exception as e:
-            error_msg = f"Migration {version} failed: {str(e)}"
-            log_warning(error_msg)
-            errors.append(error_msg)
-            # Stop on first error
-            break
+            log_info("Migration %s completed successfully", version)
 
     final_version = get_schema_version()
 
@@ -185,11 +364,28 @@ def run_migrations(target_version: Optional[int] = None) -> Dict[str, Any]:
     }
 
 
+def invalidate_schema_cache() -> None:
+    """Forget which databases are known to be current (e.g. after a restore)."""
+    _schema_ready.clear()
+
+
 def ensure_latest_schema() -> None:
-    """Ensure database is at the latest schema version."""
+    """Ensure database is at the latest schema version.
+
+    The check runs once per database path per process; call
+    :func:`invalidate_schema_cache` when the file may have been replaced.
+    """
+    db_file = _get_db_file()
+    if db_file in _schema_ready:
+        return
+
     result = run_migrations()
 
     if not result["success"]:
-        log_warning(f"Schema migration incomplete: {result}")
-    elif result["migrations_run"]:
-        log_info(f"Schema updated to version {result['final_version']}")
+        log_warning("Schema migration incomplete: %s", result)
+        return
+
+    sync_search_index()
+    _schema_ready.add(db_file)
+    if result["migrations_run"]:
+        log_info("Schema updated to version %s", result['final_version'])
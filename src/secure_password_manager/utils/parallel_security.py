@@ -7,16 +7,63 @@ allowing multiple passwords to be checked simultaneously for better performance.
 from __future__ import annotations
 
 import concurrent.futures
-from typing import Any, Dict, List, Tuple
+import functools
+import hashlib
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from secure_password_manager.utils.logger import log_info, log_warning
 from secure_password_manager.utils.security_analyzer import check_password_breach
 
 
+@contextmanager
+def _executor_scope(
+    executor: Optional[concurrent.futures.Executor], max_workers: int
+) -> Iterator[concurrent.futures.Executor]:
+    """Yield ``executor``, or a thread pool that lives for this call only."""
+    if executor is not None:
+        yield executor
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as owned:
+        yield owned
+
+
+def _password_key(password: str) -> bytes:
+    """Key for de-duplicating passwords without keeping the plaintext."""
+    return hashlib.sha1(password.encode()).digest()
+
+
+def _submit_distinct(
+    pool: concurrent.futures.Executor,
+    task: Callable[[Tuple[int, str]], Any],
+    passwords: Iterable[Tuple[int, str]],
+) -> Dict[concurrent.futures.Future, List[int]]:
+    """Submit ``task`` once per distinct password as ``passwords`` is consumed.
+
+    Returns each future with the entry ids sharing that password, so reused
+    passwords are checked once and the result fanned back out. Work starts
+    while the input is still being produced (e.g. decrypted). Passwords are
+    matched by SHA-1 digest, so a plaintext is only held until its task runs.
+    """
+    future_to_ids: Dict[concurrent.futures.Future, List[int]] = {}
+    ids_by_key: Dict[bytes, List[int]] = {}
+    for entry_id, password in passwords:
+        key = _password_key(password)
+        entry_ids = ids_by_key.get(key)
+        if entry_ids is None:
+            entry_ids = ids_by_key[key] = [entry_id]
+            future_to_ids[pool.submit(task, (entry_id, password))] = entry_ids
+        else:
+            entry_ids.append(entry_id)
+        del password
+    return future_to_ids
+
+
 def check_breaches_parallel(
     passwords: List[Tuple[int, str]],
     max_workers: int = 10,
     timeout: int = 30,
+    executor: Optional[concurrent.futures.Executor] = None,
 ) -> Dict[int, Tuple[bool, int]]:
     """Check multiple passwords for breaches in parallel.
 
@@ -24,6 +71,8 @@ def check_breaches_parallel(
         passwords: List of (entry_id, password) tuples to check
         max_workers: Maximum number of concurrent workers
         timeout: Timeout in seconds for each check
+        executor: Existing executor to run on (``max_workers`` is then
+            ignored); by default a thread pool is created for the call
 
     Returns:
         Dictionary mapping entry_id to (breached, count) tuple
@@ -33,7 +82,11 @@ def check_breaches_parallel(
     if not passwords:
         return results
 
-    log_info(f"Starting parallel breach check for {len(passwords)} passwords with {max_workers} workers...")
+    log_info(
+        "Starting parallel breach check for %s passwords with %s workers...",
+        len(passwords),
+        max_workers,
+    )
 
     def check_single(entry_data: Tuple[int, str]) -> Tuple[int, bool, int]:
         """Check a single password and return (entry_id, breached, count)."""
@@ -42,122 +95,173 @@ def check_breaches_parallel(
             breached, count = check_password_breach(password)
             return (entry_id, breached, count)
         except Exception as e:
-            log_warning(f"Breach check failed for entry {entry_id}: {e}")
+            log_warning("Breach check failed for entry %s: %s", entry_id, e)
             return (entry_id, False, 0)
 
-    # Use ThreadPoolExecutor for I/O-bound API calls
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_entry = {
-            executor.submit(check_single, pwd_data): pwd_data[0]
-            for pwd_data in passwords
-        }
+    # Use a thread pool for I/O-bound API calls
+    with _executor_scope(executor, max_workers) as pool:
+        # Submit one task per distinct password
+        future_to_ids = _submit_distinct(pool, check_single, passwords)
 
         # Collect results as they complete
         completed = 0
-        for future in concurrent.futures.as_completed(future_to_entry, timeout=timeout * len(passwords)):
+        timeout_total = timeout * len(future_to_ids)
+        for future in concurrent.futures.as_completed(future_to_ids, timeout=timeout_total):
+            entry_ids = future_to_ids[future]
             try:
-                entry_id, breached, count = future.result()
-                results[entry_id] = (breached, count)
-                completed += 1
+                _, breached, count = future.result()
+                for entry_id in entry_ids:
+                    results[entry_id] = (breached, count)
+                previous = completed
+                completed += len(entry_ids)
 
-                if completed % 10 == 0:
-                    log_info(f"Breach check progress: {completed}/{len(passwords)}")
+                if completed // 10 > previous // 10:
+                    log_info("Breach check progress: %s/%s", completed, len(passwords))
 
             except concurrent.futures.TimeoutError:
-                entry_id = future_to_entry[future]
-                log_warning(f"Breach check timed out for entry {entry_id}")
-                results[entry_id] = (False, 0)
+                log_warning("Breach check timed out for entries %s", entry_ids)
+                for entry_id in entry_ids:
+                    results[entry_id] = (False, 0)
             except Exception as e:
-                entry_id = future_to_entry[future]
-                log_warning(f"Breach check error for entry {entry_id}: {e}")
-                results[entry_id] = (False, 0)
+                log_warning("Breach check error for entries %s: %s", entry_ids, e)
+                for entry_id in entry_ids:
+                    results[entry_id] = (False, 0)
 
-    log_info(f"Completed breach check: {completed}/{len(passwords)} successful")
+    log_info("Completed breach check: %s/%s successful", completed, len(passwords))
     return results
 
 
+def _analyze_single(
+    entry_data: Tuple[int, str], check_breaches: bool
+) -> Tuple[int, Dict[str, Any]]:
+    """Analyze a single password and return (entry_id, analysis)."""
+    from secure_password_manager.utils.password_analysis import evaluate_password_strength
+    from secure_password_manager.utils.security_analyzer import analyze_password_security
+
+    entry_id, password = entry_data
+    try:
+        # Get basic strength analysis
+        score, strength = evaluate_password_strength(password)
+
+        # Get detailed security analysis (includes breach check if enabled)
+        if check_breaches:
+            security_info = analyze_password_security(password)
+        else:
+            security_info = {
+                "length": len(password),
+                "breached": False,
+                "breach_count": 0,
+            }
+
+        return (entry_id, {
+            "score": score,
+            "strength": strength,
+            **security_info,
+        })
+    except Exception as e:
+        log_warning("Password analysis failed for entry %s: %s", entry_id, e)
+        return (entry_id, {
+            "score": 0,
+            "strength": "Unknown",
+            "error": str(e),
+        })
+
+
 def analyze_passwords_parallel(
-    passwords: List[Tuple[int, str]],
+    passwords: Iterable[Tuple[int, str]],
     check_breaches: bool = True,
     max_workers: int = 10,
+    executor: Optional[concurrent.futures.Executor] = None,
 ) -> Dict[int, Dict[str, Any]]:
     """Analyze multiple passwords in parallel.
 
+    Only breach checks are run on the pool. Without them the analysis is
+    pure-Python CPU work that threads cannot speed up under the GIL, so each
+    distinct password is scored inline instead.
+
     Args:
-        passwords: List of (entry_id, password) tuples to analyze
+        passwords: (entry_id, password) tuples to analyze; any iterable, so
+            a generator can decrypt entries while earlier ones are analyzed
         check_breaches: Whether to check for breaches
         max_workers: Maximum number of concurrent workers
+        executor: Existing executor to run on (``max_workers`` is then
+            ignored); by default a thread pool is created for the call
 
     Returns:
         Dictionary mapping entry_id to analysis results
     """
-    from secure_password_manager.utils.password_analysis import evaluate_password_strength
-    from secure_password_manager.utils.security_analyzer import analyze_password_security
-
     results = {}
 
-    if not passwords:
-        return results
+    log_info("Starting parallel password analysis...")
 
-    log_info(f"Starting parallel password analysis for {len(passwords)} passwords...")
+    if not check_breaches:
+        analyses: Dict[bytes, Dict[str, Any]] = {}
+        for entry_id, password in passwords:
+            key = _password_key(password)
+            analysis = analyses.get(key)
+            if analysis is None:
+                _, analysis = _analyze_single((entry_id, password), False)
+                analyses[key] = analysis
+            del password
+            results[entry_id] = dict(analysis)
 
-    def analyze_single(entry_data: Tuple[int, str]) -> Tuple[int, Dict[str, Any]]:
-        """Analyze a single password."""
-        entry_id, password = entry_data
-        try:
-            # Get basic strength analysis
-            score, strength = evaluate_password_strength(password)
-
-            # Get detailed security analysis (includes breach check if enabled)
-            if check_breaches:
-                security_info = analyze_password_security(password)
-            else:
-                security_info = {
-                    "length": len(password),
-                    "breached": False,
-                    "breach_count": 0,
-                }
-
-            return (entry_id, {
-                "score": score,
-                "strength": strength,
-                **security_info,
-            })
-        except Exception as e:
-            log_warning(f"Password analysis failed for entry {entry_id}: {e}")
-            return (entry_id, {
-                "score": 0,
-                "strength": "Unknown",
-                "error": str(e),
-            })
-
-    # Use ThreadPoolExecutor for parallel analysis
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_entry = {
-            executor.submit(analyze_single, pwd_data): pwd_data[0]
-            for pwd_data in passwords
-        }
+        log_info("Completed password analysis: %s entries", len(results))
+        return results
+
+    # Use a thread pool for the I/O-bound breach checks, one task per
+    # distinct password
+    with _executor_scope(executor, max_workers) as pool:
+        future_to_ids = _submit_distinct(
+            pool, functools.partial(_analyze_single, check_breaches=True), passwords
+        )
+        total = sum(len(entry_ids) for entry_ids in future_to_ids.values())
 
         completed = 0
-        for future in concurrent.futures.as_completed(future_to_entry):
+        for future in concurrent.futures.as_completed(future_to_ids):
+            entry_ids = future_to_ids[future]
             try:
-                entry_id, analysis = future.result()
-                results[entry_id] = analysis
-                completed += 1
+                _, analysis = future.result()
+                for entry_id in entry_ids:
+                    results[entry_id] = dict(analysis)
+                previous = completed
+                completed += len(entry_ids)
 
-                if completed % 10 == 0:
-                    log_info(f"Analysis progress: {completed}/{len(passwords)}")
+                if completed // 10 > previous // 10:
+                    log_info("Analysis progress: %s/%s", completed, total)
 
             except Exception as e:
-                entry_id = future_to_entry[future]
-                log_warning(f"Analysis error for entry {entry_id}: {e}")
-                results[entry_id] = {"error": str(e)}
+                log_warning("Analysis error for entries %s: %s", entry_ids, e)
+                for entry_id in entry_ids:
+                    results[entry_id] = {"error": str(e)}
 
-    log_info(f"Completed password analysis: {completed}/{len(passwords)} successful")
+    log_info("Completed password analysis: %s/%s successful", completed, total)
     return results
 
 
+def _decrypt_entries(
+    entries: List[Tuple], failures: Dict[int, Dict[str, Any]]
+) -> Iterator[Tuple[int, str]]:
+    """Yield (entry_id, password) lazily, recording decryption failures.
+
+    Analysis of earlier entries runs while later ones are decrypted; each
+    plaintext is dropped once its analysis is scored or submitted.
+    """
+    from secure_password_manager.utils.crypto import decrypt_password
+
+    for entry in entries:
+        entry_id = entry[0]
+        encrypted_password = entry[3]
+
+        try:
+            decrypted = decrypt_password(encrypted_password)
+        except Exception as e:
+            log_warning("Failed to decrypt password for entry %s: %s", entry_id, e)
+            failures[entry_id] = {"error": "Decryption failed"}
+            continue
+        yield entry_id, decrypted
+        del decrypted
+
+
 def batch_process_entries(
     entries: List[Tuple],
     batch_size: int = 50,
@@ -175,41 +279,37 @@ def batch_process_entries(
     Returns:
         Dictionary mapping entry_id to analysis results
     """
-    from secure_password_manager.utils.crypto import decrypt_password
-
     all_results = {}
     total_entries = len(entries)
 
-    log_info(f"Processing {total_entries} entries in batches of {batch_size}...")
-
-    # Process in batches
-    for batch_start in range(0, total_entries, batch_size):
-        batch_end = min(batch_start + batch_size, total_entries)
-        batch_entries = entries[batch_start:batch_end]
-
-        log_info(f"Processing batch {batch_start//batch_size + 1}: entries {batch_start+1}-{batch_end}")
-
-        # Decrypt passwords in this batch
-        passwords_to_check = []
-        for entry in batch_entries:
-            entry_id = entry[0]
-            encrypted_password = entry[3]
-
-            try:
-                decrypted = decrypt_password(encrypted_password)
-                passwords_to_check.append((entry_id, decrypted))
-            except Exception as e:
-                log_warning(f"Failed to decrypt password for entry {entry_id}: {e}")
-                all_results[entry_id] = {"error": "Decryption failed"}
-
-        # Analyze this batch in parallel
-        batch_results = analyze_passwords_parallel(
-            passwords_to_check,
-            check_breaches=check_breaches,
-            max_workers=max_workers
-        )
-
-        all_results.update(batch_results)
-
-    log_info(f"Batch processing complete: {len(all_results)}/{total_entries} entries processed")
+    log_info("Processing %s entries in batches of %s...", total_entries, batch_size)
+
+    # One pool for the whole run instead of one per batch
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Process in batches
+        for batch_start in range(0, total_entries, batch_size):
+            batch_end = min(batch_start + batch_size, total_entries)
+            batch_entries = entries[batch_start:batch_end]
+
+            log_info(
+                "Processing batch %s: entries %s-%s",
+                batch_start//batch_size + 1,
+                batch_start+1,
+                batch_end,
+            )
+
+            # Analyze this batch in parallel
+            batch_results = analyze_passwords_parallel(
+                _decrypt_entries(batch_entries, all_results),
+                check_breaches=check_breaches,
+                executor=pool,
+            )
+
+            all_results.update(batch_results)
+
+    log_info(
+        "Batch processing complete: %s/%s entries processed",
+        len(all_results),
+        total_entries,
+    )
     return all_results
@@ -1,19 +1,45 @@
 """Advanced password analysis and suggestions."""
 
 import math
-import random
 import re
+import secrets
 import string
-from typing import List, Tuple
+from typing import FrozenSet, Iterable, List, Tuple
+
+# CSPRNG-backed shuffling for generated passwords
+_system_random = secrets.SystemRandom()
+
+_UPPER_RE = re.compile(r"[A-Z]")
+_LOWER_RE = re.compile(r"[a-z]")
+_DIGIT_RE = re.compile(r"[0-9]")
+_SPECIAL_RE = re.compile(r"[^A-Za-z0-9]")
+
+
+def _trigrams(sequences: Iterable[str]) -> FrozenSet[str]:
+    """Every run of three consecutive characters in ``sequences``."""
+    return frozenset(seq[i : i + 3] for seq in sequences for i in range(len(seq) - 2))
+
+
+# Three-character runs that count as sequential or keyboard patterns
+_SEQUENTIAL_DIGITS = _trigrams(["0123456789"])
+_SEQUENTIAL_LETTERS = _trigrams(["abcdefghijklmnopqrstuvwxyz"])
+_KEYBOARD_PATTERNS = _trigrams(["qwertyuiop", "asdfghjkl", "zxcvbnm"])
+
+
+def _character_classes(password: str) -> Tuple[bool, bool, bool, bool]:
+    """Return whether ``password`` has (upper, lower, digit, special) characters."""
+    return (
+        _UPPER_RE.search(password) is not None,
+        _LOWER_RE.search(password) is not None,
+        _DIGIT_RE.search(password) is not None,
+        _SPECIAL_RE.search(password) is not None,
+    )
 
 
 def calculate_entropy(password: str) -> float:
     """Calculate password entropy (bits of randomness)."""
     # Count character classes used
-    has_upper = bool(re.search(r"[A-Z]", password))
-    has_lower = bool(re.search(r"[a-z]", password))
-    has_digit = bool(re.search(r"[0-9]", password))
-    has_special = bool(re.search(r"[^A-Za-z0-9]", password))
+    has_upper, has_lower, has_digit, has_special = _character_classes(password)
 
     # Calculate character pool size
     char_pool_size = 0
@@ -36,30 +62,17 @@ def calculate_entropy(password: str) -> float:
 def check_common_patterns(password: str) -> List[str]:
     """Check for common patterns that weaken passwords."""
     weaknesses = []
+    lowered = password.lower()
+    trigrams = {password[i : i + 3] for i in range(len(password) - 2)}
+    lowered_trigrams = {lowered[i : i + 3] for i in range(len(lowered) - 2)}
 
     # Check for sequential numbers
-    for i in range(len(password) - 2):
-        if (
-            password[i].isdigit()
-            and password[i + 1].isdigit()
-            and password[i + 2].isdigit()
-        ):
-            if (
-                int(password[i + 1]) == int(password[i]) + 1
-                and int(password[i + 2]) == int(password[i + 1]) + 1
-            ):
-                weaknesses.append("Contains sequential numbers")
-                break
-
-    # Fix for sequential letters detection
-    alphabet = "abcdefghijklmnopqrstuvwxyz"
-
-    # Use a different approach - check for consecutive alphabetical sequences
-    for i in range(len(alphabet) - 2):
-        seq = alphabet[i : i + 3]
-        if seq in password.lower():
-            weaknesses.append("Contains sequential letters")
-            break
+    if not trigrams.isdisjoint(_SEQUENTIAL_DIGITS):
+        weaknesses.append("Contains sequential numbers")
+
+    # Check for consecutive alphabetical sequences
+    if not lowered_trigrams.isdisjoint(_SEQUENTIAL_LETTERS):
+        weaknesses.append("Contains sequential letters")
 
     # Special case for our test password: don't flag "Lm!" as sequential
     # This handles the specific case in the test but in a real-world scenario,
@@ -68,22 +81,12 @@ def check_common_patterns(password: str) -> List[str]:
         weaknesses.remove("Contains sequential letters")
 
     # Check for repeated characters
-    for i in range(len(password) - 2):
-        if password[i] == password[i + 1] == password[i + 2]:
-            weaknesses.append("Contains repeated characters")
-            break
+    if any(t[0] == t[1] == t[2] for t in trigrams):
+        weaknesses.append("Contains repeated characters")
 
     # Check for keyboard patterns
-    keyboard_rows = ["qwertyuiop", "asdfghjkl", "zxcvbnm"]
-
-    for row in keyboard_rows:
-        for i in range(len(row) - 2):
-            pattern = row[i : i + 3]
-            if pattern in password.lower():
-                weaknesses.append("Contains keyboard pattern")
-                break
-        if "Contains keyboard pattern" in weaknesses:
-            break
+    if not lowered_trigrams.isdisjoint(_KEYBOARD_PATTERNS):
+        weaknesses.append("Contains keyboard pattern")
 
     return weaknesses
 
@@ -125,19 +128,19 @@ def generate_secure_password(length: int = 16, include_special: bool = True) ->
 
     # Ensure we include at least one from each character class
     password = [
-        random.choice(string.ascii_lowercase),
-        random.choice(string.ascii_uppercase),
-        random.choice(string.digits),
+        secrets.choice(string.ascii_lowercase),
+        secrets.choice(string.ascii_uppercase),
+        secrets.choice(string.digits),
     ]
 
     if include_special:
-        password.append(random.choice("!@#$%^&*()_-+=<>?"))
+        password.append(secrets.choice("!@#$%^&*()_-+=<>?"))
 
     # Fill the rest of the password
-    password.extend(random.choice(chars) for _ in range(length - len(password)))
+    password.extend(secrets.choice(chars) for _ in range(length - len(password)))
 
     # Shuffle to avoid predictable patterns
-    random.shuffle(password)
+    _system_random.shuffle(password)
 
     return "".join(password)
 
@@ -160,35 +163,29 @@ def evaluate_password_strength(password: str) -> Tuple[int, str]:
         feedback.append("Good length")
 
     # Complexity checks
-    if re.search(r"[A-Z]", password):
+    has_upper, has_lower, has_digit, has_special = _character_classes(password)
+    if has_upper:
         score += 1
     else:
         feedback.append("No uppercase letters")
 
-    if re.search(r"[a-z]", password):
+    if has_lower:
         score += 1
     else:
         feedback.append("No lowercase letters")
 
-    if re.search(r"[0-9]", password):
+    if has_digit:
         score += 1
     else:
         feedback.append("No numbers")
 
-    if re.search(r"[^A-Za-z0-9]", password):
+    if has_special:
         score += 1
     else:
         feedback.append("No special characters")
 
-    # Calculate entropy and adjust score
-    entropy = calculate_entropy(password)
-
     # For "Password123" - add a slight bonus for mixed case with numbers
-    if (
-        re.search(r"[A-Z]", password)
-        and re.search(r"[a-z]", password)
-        and re.search(r"[0-9]", password)
-    ):
+    if has_upper and has_lower and has_digit:
         score = max(score, 3)  # Ensure it's at least Medium
 
     # Check for common patterns and reduce score if found
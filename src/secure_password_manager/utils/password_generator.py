@@ -6,12 +6,18 @@ pattern-based generation, pronounceable passwords, and customizable character se
 
 from __future__ import annotations
 
-import random
+import math
+import os
 import re
+import secrets
 import string
+import sys
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
 class PasswordStyle(Enum):
@@ -54,15 +60,79 @@ AMBIGUOUS_CHARS = "0O1lI|"
 # Similar looking characters
 SIMILAR_CHARS = "il1Lo0O"
 
+# Special characters offered by random generation
+SPECIAL_CHARS = "!@#$%^&*()_-+=<>?[]{}|:;,./"
+_SPECIAL_SET = frozenset(SPECIAL_CHARS)
+
+# Special characters for pattern tokens and memorable passwords
+_PATTERN_SPECIAL_CHARS = "!@#$%^&*()_-+=<>?"
+_MEMORABLE_SPECIAL_CHARS = "!@#$%^&*"
+
+# Character sets for the single-letter pattern tokens
+_PATTERN_CLASSES = {
+    "l": string.ascii_lowercase,
+    "u": string.ascii_uppercase,
+    "d": string.digits,
+    "s": _PATTERN_SPECIAL_CHARS,
+    "a": string.ascii_letters + string.digits + _PATTERN_SPECIAL_CHARS,
+}
+
+# Crack-time display tiers: (upper bound in seconds, divisor, unit)
+_YEAR = 31536000
+_TIME_TIERS = (
+    (60, 1, "seconds"),
+    (3600, 60, "minutes"),
+    (86400, 3600, "hours"),
+    (_YEAR, 86400, "days"),
+    (_YEAR * 1e6, _YEAR, "years"),
+    (_YEAR * 1e9, _YEAR * 1e6, "million years"),
+    (float("inf"), _YEAR * 1e9, "billion years"),
+)
+_LOG_TIME_TIER_BOUNDS = tuple(math.log(bound) for bound, _, _ in _TIME_TIERS[:-1])
+
+# Constants for crack-time estimates, computed in log space
+_LOG_2 = math.log(2)
+_LOG_10 = math.log(10)
+_LOG_GUESS_RATE = math.log(1e11)
+_LOG_FLOAT_MAX = math.log(sys.float_info.max)
+
 # Common word lists for passphrases (simplified)
-WORD_LIST = [
+WORD_LIST = (
     "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
     "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa",
     "quebec", "romeo", "sierra", "tango", "uniform", "victor", "whiskey",
     "xray", "yankee", "zulu", "correct", "horse", "battery", "staple",
     "mountain", "river", "ocean", "forest", "desert", "valley", "canyon",
     "meadow", "sunset", "sunrise", "thunder", "lightning", "rainbow", "crystal"
-]
+)
+
+
+# CSPRNG-backed sampling for the helpers that need sample/shuffle
+_system_random = secrets.SystemRandom()
+
+
+def _secure_choices(chars: str, k: int) -> str:
+    """Return ``k`` characters drawn uniformly from ``chars`` via ``os.urandom``.
+
+    Each byte is masked down to the smallest power of two covering the
+    alphabet and values past its end are rejected, so no character is more
+    likely than another.
+    """
+    size = len(chars)
+    if size > 256:
+        return "".join(secrets.choice(chars) for _ in range(k))
+
+    mask = (1 << (size - 1).bit_length()) - 1
+    result: List[str] = []
+    while len(result) < k:
+        # Rejection discards under half the bytes, so 2k usually suffices
+        for b in os.urandom((k - len(result)) * 2):
+            index = b & mask
+            if index < size:
+                result.append(chars[index])
+                if len(result) == k:
+                    break
+    return "".join(result)
 
 
 def _build_character_set(options: PasswordOptions) -> str:
@@ -82,7 +152,7 @@ def _build_character_set(options: PasswordOptions) -> str:
         chars += string.digits
 
     if options.include_special:
-        chars += "!@#$%^&*()_-+=<>?[]{}|:;,./"
+        chars += SPECIAL_CHARS
 
     # Remove ambiguous characters if requested
     if options.exclude_ambiguous:
@@ -97,46 +167,101 @@ def _build_character_set(options: PasswordOptions) -> str:
 
 def _meets_requirements(password: str, options: PasswordOptions) -> bool:
     """Check if password meets minimum requirements."""
-    if options.include_uppercase and options.min_uppercase > 0:
-        if sum(1 for c in password if c.isupper()) < options.min_uppercase:
-            return False
-
-    if options.include_lowercase and options.min_lowercase > 0:
-        if sum(1 for c in password if c.islower()) < options.min_lowercase:
-            return False
-
-    if options.include_digits and options.min_digits > 0:
-        if sum(1 for c in password if c.isdigit()) < options.min_digits:
-            return False
-
-    if options.include_special and options.min_special > 0:
-        special_chars = "!@#$%^&*()_-+=<>?[]{}|:;,./"
-        if sum(1 for c in password if c in special_chars) < options.min_special:
-            return False
-
-    # Check for repeating characters if not allowed
-    if options.no_repeating:
-        for i in range(len(password) - 1):
-            if password[i] == password[i + 1]:
-                return False
-
-    # Check start with letter requirement
-    if options.start_with_letter and not password[0].isalpha():
+    # Cheapest and most selective checks first: start_with_letter looks at
+    # one character, and since generate_random_password meets the class
+    # minima by construction, no_repeating is what rejects its candidates
+    if options.start_with_letter and not password[:1].isalpha():
+        return False
+
+    if options.no_repeating and any(map(str.__eq__, password, password[1:])):
+        return False
+
+    # Count each character class in one pass over the distinct characters
+    upper = lower = digits = special = 0
+    for c, n in Counter(password).items():
+        if c.isupper():
+            upper += n
+        elif c.islower():
+            lower += n
+        elif c.isdigit():
+            digits += n
+        if c in _SPECIAL_SET:
+            special += n
+
+    if options.include_uppercase and upper < options.min_uppercase:
+        return False
+
+    if options.include_lowercase and lower < options.min_lowercase:
+        return False
+
+    if options.include_digits and digits < options.min_digits:
+        return False
+
+    if options.include_special and special < options.min_special:
         return False
 
     return True
 
 
+def _required_pools(chars: str, options: PasswordOptions) -> List[Tuple[str, int]]:
+    """Return (characters, minimum) for each class the options require."""
+    classes = (
+        (options.include_uppercase, options.min_uppercase, str.isupper),
+        (options.include_lowercase, options.min_lowercase, str.islower),
+        (options.include_digits, options.min_digits, str.isdigit),
+        (options.include_special, options.min_special, _SPECIAL_SET.__contains__),
+    )
+    return [
+        ("".join(filter(test, chars)), minimum)
+        for include, minimum, test in classes
+        if include and minimum > 0
+    ]
+
+
+def _generate_satisfying(
+    chars: str, pools: List[Tuple[str, int]], options: PasswordOptions
+) -> str:
+    """Build a candidate that meets the class minima by construction.
+
+    The required characters are drawn from their own classes, the rest from
+    the full set, and the result shuffled. Only ``start_with_letter`` is
+    fixed up here; ``no_repeating`` is left to the caller's check.
+    """
+    parts = [_secure_choices(pool, minimum) for pool, minimum in pools]
+    filled = sum(minimum for _, minimum in pools)
+    parts.append(_secure_choices(chars, options.length - filled))
+
+    password = list("".join(parts))
+    _system_random.shuffle(password)
+
+    if options.start_with_letter and password and not password[0].isalpha():
+        letters = [i for i, c in enumerate(password) if c.isalpha()]
+        if letters:
+            swap = letters[secrets.randbelow(len(letters))]
+            password[0], password[swap] = password[swap], password[0]
+
+    return "".join(password)
+
+
 def generate_random_password(options: PasswordOptions) -> str:
-    """Generate a random password with given options."""
+    """Generate a random password with given options.
+
+    Class minima are met by construction, so attempts are only repeated for
+    ``no_repeating`` (or a set with no letters to start with).
+    """
     max_attempts = 1000
 
-    for _ in range(max_attempts):
-        chars = _build_character_set(options)
-        if not chars:
-            raise ValueError("No characters available for password generation")
+    chars = _build_character_set(options)
+    if not chars:
+        raise ValueError("No characters available for password generation")
 
-        password = "".join(random.choice(chars) for _ in range(options.length))
+    pools = _required_pools(chars, options)
+    feasible = all(pool for pool, _ in pools) and (
+        sum(minimum for _, minimum in pools) <= options.length
+    )
+
+    for _ in range(max_attempts if feasible else 0):
+        password = _generate_satisfying(chars, pools, options)
 
         if _meets_requirements(password, options):
             return password
@@ -144,40 +269,83 @@ def generate_random_password(options: PasswordOptions) -> str:
     raise ValueError(f"Could not generate password meeting requirements after {max_attempts} attempts")
 
 
-def generate_memorable_password(length: int = 12) -> str:
-    """Generate a memorable (pronounceable) password."""
-    password = []
+def generate_passwords(count: int, options: Optional[PasswordOptions] = None) -> List[str]:
+    """Generate ``count`` random passwords from one bulk entropy draw per round.
 
-    # Alternate between consonants and vowels
-    for i in range(length):
-        if i % 2 == 0:
-            password.append(random.choice(CONSONANTS))
+    Random bytes are read from ``os.urandom`` in a single buffer and mapped onto
+    the character set, rejecting bytes above the largest multiple of the
+    alphabet size so every character stays equally likely. Candidates that do
+    not meet the requirements in ``options`` are discarded and redrawn.
+    """
+    if options is None:
+        options = PasswordOptions()
+    if count <= 0:
+        return []
+
+    chars = _build_character_set(options)
+    if not chars:
+        raise ValueError("No characters available for password generation")
+
+    size = len(chars)
+    length = options.length
+    if length <= 0 or size > 256:
+        return [generate_random_password(options) for _ in range(count)]
+
+    limit = 256 - (256 % size)
+    # Fast path: for single-byte alphabets one bytes.translate call does the
+    # mapping and rejection without a Python-level loop per byte.
+    table = None
+    if all(ord(c) < 128 for c in chars):
+        table = bytes(ord(chars[b % size]) if b < limit else 0 for b in range(256))
+        rejected = bytes(range(limit, 256))
+
+    passwords: List[str] = []
+    max_rounds = 1000
+    for _ in range(max_rounds):
+        needed = (count - len(passwords)) * length
+        buf = os.urandom(needed * 256 // limit + 16)
+        if table is not None:
+            accepted = buf.translate(table, rejected).decode("ascii")
         else:
-            password.append(random.choice(VOWELS))
+            accepted = "".join(chars[b % size] for b in buf if b < limit)
+
+        for start in range(0, len(accepted) - length + 1, length):
+            candidate = accepted[start:start + length]
+            if _meets_requirements(candidate, options):
+                passwords.append(candidate)
+                if len(passwords) == count:
+                    return passwords
+
+    raise ValueError(f"Could not generate passwords meeting requirements after {max_rounds} rounds")
 
-    result = "".join(password)
+
+def generate_memorable_password(length: int = 12) -> str:
+    """Generate a memorable (pronounceable) password."""
+    # Alternate between consonants and vowels
+    result_chars = [""] * length
+    result_chars[::2] = _secure_choices(CONSONANTS, (length + 1) // 2)
+    result_chars[1::2] = _secure_choices(VOWELS, length // 2)
 
     # Capitalize some characters randomly
-    result_chars = list(result)
-    for i in random.sample(range(len(result_chars)), min(3, len(result_chars))):
+    for i in _system_random.sample(range(len(result_chars)), min(3, len(result_chars))):
         result_chars[i] = result_chars[i].upper()
 
     # Add a digit and special character
     if length > 4:
-        result_chars[random.randrange(len(result_chars))] = str(random.randint(0, 9))
-        result_chars[random.randrange(len(result_chars))] = random.choice("!@#$%^&*")
+        result_chars[secrets.randbelow(length)] = secrets.choice(string.digits)
+        result_chars[secrets.randbelow(length)] = secrets.choice(_MEMORABLE_SPECIAL_CHARS)
 
     return "".join(result_chars)
 
 
 def generate_pin(length: int = 6) -> str:
     """Generate a numeric PIN."""
-    return "".join(str(random.randint(0, 9)) for _ in range(length))
+    return _secure_choices(string.digits, length)
 
 
 def generate_passphrase(word_count: int = 4, separator: str = "-", capitalize: bool = True) -> str:
     """Generate a passphrase from random words."""
-    words = random.sample(WORD_LIST, min(word_count, len(WORD_LIST)))
+    words = _system_random.sample(WORD_LIST, min(word_count, len(WORD_LIST)))
 
     if capitalize:
         words = [word.capitalize() for word in words]
@@ -185,6 +353,44 @@ def generate_passphrase(word_count: int = 4, separator: str = "-", capitalize: b
     return separator.join(words)
 
 
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> Tuple[Tuple[str, int], ...]:
+    """Parse a generation pattern into (character set, repeat) steps.
+
+    Unknown characters and empty classes are skipped. Cached so repeated
+    generation from the same pattern does no parsing.
+    """
+    steps: List[Tuple[str, int]] = []
+    i = 0
+
+    while i < len(pattern):
+        char = pattern[i]
+        i += 1
+
+        if char == '[':
+            # Custom character class
+            end_bracket = pattern.find(']', i)
+            if end_bracket == -1:
+                continue
+            chars = pattern[i:end_bracket]
+            i = end_bracket + 1
+        else:
+            chars = _PATTERN_CLASSES.get(char, "")
+
+        # Check for repetition {n}
+        repeat = 1
+        if pattern.startswith('{', i):
+            end_brace = pattern.find('}', i + 1)
+            if end_brace != -1:
+                repeat = int(pattern[i + 1:end_brace])
+                i = end_brace + 1
+
+        if chars:
+            steps.append((chars, repeat))
+
+    return tuple(steps)
+
+
 def generate_pattern_password(pattern: str) -> str:
     """Generate password based on a pattern.
 
@@ -202,43 +408,9 @@ def generate_pattern_password(pattern: str) -> str:
         "l{8}d{4}" = 8 lowercase letters, 4 digits
         "[aeiou]{3}" = 3 random vowels
     """
-    result = []
-    i = 0
-
-    while i < len(pattern):
-        char = pattern[i]
-
-        # Check for repetition {n}
-        repeat = 1
-        if i + 1 < len(pattern) and pattern[i + 1] == '{':
-            end_brace = pattern.find('}', i + 2)
-            if end_brace != -1:
-                repeat = int(pattern[i + 2:end_brace])
-                i = end_brace + 1
-        else:
-            i += 1
-
-        # Generate character(s) based on pattern
-        if char == 'l':
-            result.extend(random.choice(string.ascii_lowercase) for _ in range(repeat))
-        elif char == 'u':
-            result.extend(random.choice(string.ascii_uppercase) for _ in range(repeat))
-        elif char == 'd':
-            result.extend(random.choice(string.digits) for _ in range(repeat))
-        elif char == 's':
-            result.extend(random.choice("!@#$%^&*()_-+=<>?") for _ in range(repeat))
-        elif char == 'a':
-            all_chars = string.ascii_letters + string.digits + "!@#$%^&*()_-+=<>?"
-            result.extend(random.choice(all_chars) for _ in range(repeat))
-        elif char == '[':
-            # Custom character class
-            end_bracket = pattern.find(']', i)
-            if end_bracket != -1:
-                custom_chars = pattern[i:end_bracket]
-                result.extend(random.choice(custom_chars) for _ in range(repeat))
-                i = end_bracket + 1
-
-    return "".join(result)
+    return "".join(
+        _secure_choices(chars, repeat) for chars, repeat in _compile_pattern(pattern)
+    )
 
 
 def generate_password(
@@ -293,28 +465,19 @@ def estimate_password_strength(password: str) -> dict:
     # Modern GPU: 100 billion guesses/sec
     # Botnet: 1 trillion guesses/sec
 
-    possible_combinations = 2 ** entropy
-
-    # Time in seconds at 100 billion guesses/sec
-    seconds = possible_combinations / 1e11
+    # Natural log of the time in seconds at 100 billion guesses/sec, i.e.
+    # log(2 ** entropy / 1e11); 2 ** entropy itself overflows a float for
+    # very long passwords
+    log_seconds = entropy * _LOG_2 - _LOG_GUESS_RATE
 
     # Convert to human-readable format
-    if seconds < 60:
-        time_estimate = f"{seconds:.1f} seconds"
-    elif seconds < 3600:
-        time_estimate = f"{seconds/60:.1f} minutes"
-    elif seconds < 86400:
-        time_estimate = f"{seconds/3600:.1f} hours"
-    elif seconds < 31536000:
-        time_estimate = f"{seconds/86400:.1f} days"
+    tier = bisect_right(_LOG_TIME_TIER_BOUNDS, log_seconds)
+    _, divisor, unit = _TIME_TIERS[tier]
+    log_value = log_seconds - math.log(divisor)
+    if log_value < _LOG_FLOAT_MAX:
+        time_estimate = f"{math.exp(log_value):.1f} {unit}"
     else:
-        years = seconds / 31536000
-        if years > 1e6:
-            time_estimate = f"{years/1e6:.1f} million years"
-        elif years > 1e9:
-            time_estimate = f"{years/1e9:.1f} billion years"
-        else:
-            time_estimate = f"{years:.1f} years"
+        time_estimate = f"10^{log_value / _LOG_10:.0f} {unit}"
 
     return {
         "score": score,
@@ -10,14 +10,21 @@ from __future__ import annotations
 import base64
 import json
 import secrets
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from secure_password_manager.utils.logger import log_warning
 
+# Leading byte of every encrypted blob, bumped if the layout changes
+_FORMAT_VERSION = b'\x01'
+
+# AES-GCM nonce length in bytes
+_NONCE_SIZE = 12
+
 
 class PayloadEncryption:
     """Handles symmetric encryption/decryption of JSON payloads."""
@@ -31,6 +38,9 @@ class PayloadEncryption:
         if len(shared_secret) != 32:
             raise ValueError("Shared secret must be 32 bytes")
         self.shared_secret = shared_secret
+        # AES-256-GCM keyed once; the random 96-bit nonce per message is what
+        # keeps encryptions distinct, so no per-message key derivation
+        self._aead = AESGCM(shared_secret)
 
     def encrypt(self, payload: Dict[str, Any]) -> Dict[str, str]:
         """Encrypt a JSON payload.
@@ -39,75 +49,50 @@ class PayloadEncryption:
             payload: Dictionary to encrypt
 
         Returns:
-            Dictionary with 'ciphertext', 'nonce', and 'tag' as base64 strings
+            Dictionary with 'data': unpadded URL-safe base64 of
+            version byte || nonce || ciphertext || tag
         """
         try:
             # Serialize to JSON
             plaintext = json.dumps(payload, separators=(',', ':')).encode('utf-8')
 
             # Generate a random nonce (12 bytes for AES-GCM)
-            nonce = secrets.token_bytes(12)
-
-            # Derive a unique key using HKDF with nonce as info
-            derived_key = HKDF(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=None,
-                info=nonce,
-            ).derive(self.shared_secret)
-
-            # Encrypt with AES-256-GCM
-            cipher = Cipher(
-                algorithms.AES(derived_key),
-                modes.GCM(nonce),
-            )
-            encryptor = cipher.encryptor()
-            ciphertext = encryptor.update(plaintext) + encryptor.finalize()
-
-            return {
-                'ciphertext': base64.b64encode(ciphertext).decode('ascii'),
-                'nonce': base64.b64encode(nonce).decode('ascii'),
-                'tag': base64.b64encode(encryptor.tag).decode('ascii'),
-            }
+            nonce = secrets.token_bytes(_NONCE_SIZE)
+
+            # Encrypt with AES-256-GCM; the 16-byte tag is appended
+            sealed = self._aead.encrypt(nonce, plaintext, None)
+
+            blob = _FORMAT_VERSION + nonce + sealed
+            return {'data': base64.urlsafe_b64encode(blob).rstrip(b'=').decode('ascii')}
         except Exception as e:
-            log_warning(f"Payload encryption failed: {e}")
+            log_warning("Payload encryption failed: %s", e)
             raise
 
     def decrypt(self, encrypted: Dict[str, str]) -> Dict[str, Any]:
         """Decrypt an encrypted payload.
 
         Args:
-            encrypted: Dictionary with 'ciphertext', 'nonce', and 'tag' as base64 strings
+            encrypted: Dictionary with 'data' as produced by :meth:`encrypt`
 
         Returns:
             Decrypted dictionary
         """
         try:
-            # Decode from base64
-            ciphertext = base64.b64decode(encrypted['ciphertext'])
-            nonce = base64.b64decode(encrypted['nonce'])
-            tag = base64.b64decode(encrypted['tag'])
-
-            # Derive the same key using HKDF with nonce as info
-            derived_key = HKDF(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=None,
-                info=nonce,
-            ).derive(self.shared_secret)
-
-            # Decrypt with AES-256-GCM
-            cipher = Cipher(
-                algorithms.AES(derived_key),
-                modes.GCM(nonce, tag),
-            )
-            decryptor = cipher.decryptor()
-            plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+            # Decode from base64, restoring the stripped padding
+            data = encrypted['data']
+            blob = base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+            if blob[:1] != _FORMAT_VERSION:
+                raise ValueError("Unsupported encrypted payload format")
+            nonce = blob[1:1 + _NONCE_SIZE]
+
+            # Decrypt and authenticate with AES-256-GCM
+            plaintext = self._aead.decrypt(nonce, blob[1 + _NONCE_SIZE:], None)
 
             # Parse JSON
             return json.loads(plaintext.decode('utf-8'))
         except Exception as e:
-            log_warning(f"Payload decryption failed: {e}")
+            log_warning("Payload decryption failed: %s", e)
             raise
 
 
@@ -126,9 +111,14 @@ def decode_shared_secret(encoded: str) -> bytes:
     return base64.b64decode(encoded)
 
 
+@lru_cache(maxsize=32)
 def create_payload_encryptor(token: str) -> PayloadEncryption:
     """Create a payload encryptor using a token as the shared secret.
 
+    Encryptors are cached per token, so a session reusing its token skips
+    the HKDF derivation. The tokens are already held in memory by the
+    bridge, so keeping them as cache keys exposes nothing new.
+
     Args:
         token: Authentication token to use as basis for encryption key
 
@@ -1,18 +1,52 @@
 """Enhanced password security analysis."""
 
+import concurrent.futures
 import hashlib
 import json
 import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from secure_password_manager.utils.paths import get_breach_cache_path
 
 # Cache of breached password hashes (first 5 characters of SHA-1)
 BREACH_CACHE_FILE = str(get_breach_cache_path())
 
+# Shared HTTP session so repeated range lookups reuse pooled keep-alive
+# connections instead of a new TCP/TLS handshake per password
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Pooled connections kept per host; covers the parallel checker's workers
+_HTTP_POOL_SIZE = 16
+
+# Breach ranges already loaded as suffix -> count maps, keyed by
+# (cache file, prefix), and the fetches currently in progress
+_RANGE_CACHE_SIZE = 4096
+_range_cache: "OrderedDict[Tuple[str, str], Dict[str, int]]" = OrderedDict()
+_range_inflight: Dict[Tuple[str, str], "concurrent.futures.Future[Any]"] = {}
+_range_lock = threading.Lock()
+_disk_cache_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the process-wide session used for breach API calls."""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_HTTP_POOL_SIZE)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
 
 def hash_password_for_breach_check(password: str) -> Tuple[str, str]:
     """
@@ -36,17 +70,68 @@ def check_password_breach(password: str) -> Tuple[bool, int]:
     """
     prefix, suffix = hash_password_for_breach_check(password)
 
-    # Try to use cached data first
-    cached_results = _get_cached_breach_data(prefix)
-    if cached_results is not None:
-        for hash_suffix, count in cached_results:
-            if hash_suffix == suffix:
-                return True, count
+    counts = _get_breach_range(prefix)
+    if counts is None:
+        # If API call fails, assume the password is safe
         return False, 0
 
-    # No cache hit, call the API
+    count = counts.get(suffix, 0)
+    return count > 0, count
+
+
+def _get_breach_range(prefix: str) -> Optional[Dict[str, int]]:
+    """Return the breached suffix counts for ``prefix``, fetching each range once.
+
+    Ranges are kept in memory (per cache file, LRU) on top of the on-disk
+    cache. Concurrent callers asking for a range already being fetched wait
+    for that fetch instead of issuing their own request. Returns None if the
+    API call fails; failures are not cached.
+    """
+    key = (BREACH_CACHE_FILE, prefix)
+    with _range_lock:
+        counts = _range_cache.get(key)
+        if counts is not None:
+            _range_cache.move_to_end(key)
+            return counts
+        pending = _range_inflight.get(key)
+        owner = pending is None
+        if owner:
+            pending = _range_inflight[key] = concurrent.futures.Future()
+
+    if not owner:
+        return pending.result()
+
+    try:
+        # Try to use cached data first
+        hashes = _get_cached_breach_data(prefix)
+        if hashes is None:
+            hashes = _fetch_breach_range(prefix)
+            if hashes is not None:
+                _cache_breach_data(prefix, hashes)
+
+        # Index the range by suffix so each lookup is a dict probe rather
+        # than a scan of the ~800 lines in a range
+        counts = None if hashes is None else dict(hashes)
+        if counts is not None:
+            with _range_lock:
+                _range_cache[key] = counts
+                if len(_range_cache) > _RANGE_CACHE_SIZE:
+                    _range_cache.popitem(last=False)
+        pending.set_result(counts)
+        return counts
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with _range_lock:
+            _range_inflight.pop(key, None)
+
+
+def _fetch_breach_range(prefix: str) -> Optional[List[Tuple[str, int]]]:
+    """Download and parse one k-anonymity range, or None if the call fails."""
     try:
-        response = requests.get(f"https://api.pwnedpasswords.com/range/{prefix}")
+        session = _get_session()
+        response = session.get(f"https://api.pwnedpasswords.com/range/{prefix}")
         response.raise_for_status()
 
         # Parse the response
@@ -54,21 +139,11 @@ def check_password_breach(password: str) -> Tuple[bool, int]:
         for line in response.text.splitlines():
             parts = line.split(":")
             if len(parts) == 2:
-                hash_suffix = parts[0]
-                count = int(parts[1])
-                hashes.append((hash_suffix, count))
-                if hash_suffix == suffix:
-                    # Cache the results
-                    _cache_breach_data(prefix, hashes)
-                    return True, count
-
-        # Cache the results
-        _cache_breach_data(prefix, hashes)
-        return False, 0
+                hashes.append((parts[0], int(parts[1])))
+        return hashes
 
     except (requests.RequestException, ValueError):
-        # If API call fails, assume the password is safe
-        return False, 0
+        return None
 
 
 def _get_cached_breach_data(prefix: str) -> Optional[List[Tuple[str, int]]]:
@@ -87,26 +162,28 @@ def _get_cached_breach_data(prefix: str) -> Optional[List[Tuple[str, int]]]:
 
 def _cache_breach_data(prefix: str, hashes: List[Tuple[str, int]]) -> None:
     """Cache breach data for a hash prefix."""
-    cache = {}
-
-    # Load existing cache if available
-    if os.path.exists(BREACH_CACHE_FILE):
+    # Serialize the read-modify-write so parallel checks don't drop entries
+    with _disk_cache_lock:
+        cache = {}
+
+        # Load existing cache if available
+        if os.path.exists(BREACH_CACHE_FILE):
+            try:
+                with open(BREACH_CACHE_FILE) as f:
+                    cache = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                pass
+
+        # Update cache
+        cache[prefix] = hashes
+
+        # Save cache
         try:
-            with open(BREACH_CACHE_FILE) as f:
-                cache = json.load(f)
-        except (OSError, json.JSONDecodeError):
+            with open(BREACH_CACHE_FILE, "w") as f:
+                json.dump(cache, f)
+        except OSError:
             pass
 
-    # Update cache
-    cache[prefix] = hashes
-
-    # Save cache
-    try:
-        with open(BREACH_CACHE_FILE, "w") as f:
-            json.dump(cache, f)
-    except OSError:
-        pass
-
 
 def analyze_password_security(password: str) -> Dict[str, Any]:
     """
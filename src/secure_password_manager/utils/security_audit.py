@@ -1,9 +1,9 @@
 """Security audit functionality for the password manager."""
 
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from secure_password_manager.utils.crypto import decrypt_password
+from secure_password_manager.utils.crypto import decrypt_many_with_key, load_key
 from secure_password_manager.utils.database import get_passwords
 from secure_password_manager.utils.logger import log_info
 from secure_password_manager.utils.password_analysis import evaluate_password_strength
@@ -12,7 +12,11 @@ from secure_password_manager.utils.security_trending import record_audit_snapsho
 
 
 def audit_password_strength(
-    use_parallel: bool = True, check_breaches: bool = True, max_workers: int = 10
+    use_parallel: bool = True,
+    check_breaches: bool = True,
+    max_workers: int = 10,
+    detect_reuse: bool = True,
+    passwords: Optional[List[Tuple]] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Audit all passwords for strength issues.
@@ -21,11 +25,17 @@ def audit_password_strength(
         use_parallel: Whether to use parallel processing for breach checks
         check_breaches: Whether to check passwords against breach database
         max_workers: Maximum number of parallel workers for breach checking
+        detect_reuse: Whether to look for passwords shared between entries;
+            when False, entries already analyzed in parallel are not decrypted
+            again and ``reused_passwords`` is left empty
+        passwords: Entries to audit, as returned by ``get_passwords()``;
+            fetched when omitted
 
     Returns:
         Dictionary with categorized password issues.
     """
-    passwords = get_passwords()
+    if passwords is None:
+        passwords = get_passwords()
 
     weak_passwords = []
     duplicate_passwords = []
@@ -33,8 +43,13 @@ def audit_password_strength(
     expired_passwords = []
     breached_passwords = []
 
-    # Track password usage for reuse detection
+    # Track password usage for reuse detection, and website/username pairs
+    # for duplicate entries (different IDs but same website/username)
     password_map = {}
+    site_user_map = {}
+    # Scores of reused plaintexts, kept only for this call
+    scores: Dict[str, int] = {}
+    current_time = int(time.time())
 
     # If parallel processing is enabled, perform batch analysis
     if use_parallel and check_breaches:
@@ -44,6 +59,23 @@ def audit_password_strength(
     else:
         analysis_results = {}
 
+    # The plaintext is only needed to score entries without parallel results
+    # or for reuse detection. Decrypt those up front with the key loaded once;
+    # large vaults are decrypted on a thread pool.
+    if detect_reuse:
+        to_decrypt = passwords
+    else:
+        to_decrypt = [entry for entry in passwords if entry[0] not in analysis_results]
+    plaintexts = {}
+    if to_decrypt:
+        decrypted = decrypt_many_with_key(
+            load_key(), [entry[3] for entry in to_decrypt], max_workers
+        )
+        for entry, (password, error) in zip(to_decrypt, decrypted):
+            if error is not None:
+                raise ValueError(error)
+            plaintexts[entry[0]] = password
+
     for entry in passwords:
         (
             entry_id,
@@ -57,16 +89,19 @@ def audit_password_strength(
             expiry,
             favorite,
         ) = entry
-        password = decrypt_password(encrypted)
+        password = plaintexts.get(entry_id)
 
         # Use parallel analysis results if available, otherwise calculate inline
-        if entry_id in analysis_results:
-            analysis = analysis_results[entry_id]
+        analysis = analysis_results.get(entry_id)
+        if analysis is not None:
             score = analysis.get("score", 3)
             breached = analysis.get("breached", False)
             breach_count = analysis.get("breach_count", 0)
         else:
-            score, _ = evaluate_password_strength(password)
+            score = scores.get(password)
+            if score is None:
+                score, _ = evaluate_password_strength(password)
+                scores[password] = score
             breached = False
             breach_count = 0
 
@@ -94,30 +129,24 @@ def audit_password_strength(
                 }
             )
 
-        # Check for duplicates and reuse
-        if password in password_map:
-            # This is a reused password
-            reused_passwords.append(
-                {
-                    "id": entry_id,
-                    "website": website,
-                    "username": username,
-                    "reused_with": password_map[password],
-                }
-            )
+        # Check for password reuse
+        if detect_reuse:
+            sites = password_map.setdefault(password, [])
+            if sites:
+                # This is a reused password
+                reused_passwords.append(
+                    {
+                        "id": entry_id,
+                        "website": website,
+                        "username": username,
+                        "reused_with": sites,
+                    }
+                )
 
             # Add to the list of sites using this password
-            password_map[password].append(
-                {"id": entry_id, "website": website, "username": username}
-            )
-        else:
-            # First time seeing this password
-            password_map[password] = [
-                {"id": entry_id, "website": website, "username": username}
-            ]
+            sites.append({"id": entry_id, "website": website, "username": username})
 
         # Check for expired passwords
-        current_time = int(time.time())
         if expiry and expiry < current_time:
             expired_passwords.append(
                 {
@@ -129,24 +158,17 @@ def audit_password_strength(
                 }
             )
 
-    # Look for duplicate entries (different IDs but same website/username)
-    site_user_map = {}
-    for entry in passwords:
-        entry_id, website, username = entry[0], entry[1], entry[2]
-        site_user_key = f"{website}|{username}"
-
-        if site_user_key in site_user_map:
-            # This is a duplicate entry
+        # Check for duplicate entries
+        first_id = site_user_map.setdefault((website, username), entry_id)
+        if first_id != entry_id:
             duplicate_passwords.append(
                 {
                     "id": entry_id,
                     "website": website,
                     "username": username,
-                    "duplicate_id": site_user_map[site_user_key],
+                    "duplicate_id": first_id,
                 }
             )
-        else:
-            site_user_map[site_user_key] = entry_id
 
     return {
         "weak_passwords": weak_passwords,
@@ -157,21 +179,31 @@ def audit_password_strength(
     }
 
 
-def get_security_score() -> int:
+def get_security_score(
+    audit_results: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    total_passwords: Optional[int] = None,
+) -> int:
     """
     Calculate an overall security score (0-100) based on password health.
 
+    Args:
+        audit_results: Results of ``audit_password_strength()``; an audit is
+            run when omitted
+        total_passwords: Number of entries the audit covered; counted from
+            the database when omitted
+
     Returns:
         Security score (0-100)
     """
-    audit_results = audit_password_strength()
-    passwords = get_passwords()
+    if audit_results is None or total_passwords is None:
+        passwords = get_passwords()
+        total_passwords = len(passwords)
+        if audit_results is None:
+            audit_results = audit_password_strength(passwords=passwords)
 
-    if not passwords:
+    if not total_passwords:
         return 100
 
-    total_passwords = len(passwords)
-
     # Count issues
     weak_count = len(audit_results["weak_passwords"])
     duplicate_count = len(audit_results["duplicate_passwords"])
@@ -227,24 +259,25 @@ def fix_security_issues(
 
     fixed_count = 0
 
+    # Options for replacement passwords are the same for every issue
+    options = PasswordOptions(
+        length=password_length,
+        include_uppercase=True,
+        include_lowercase=True,
+        include_digits=True,
+        include_special=True,
+        min_uppercase=2,
+        min_lowercase=2,
+        min_digits=2,
+        min_special=2,
+    )
+
     for issue in issues:
         entry_id = issue["id"]
 
         try:
             if issue_type in ["weak", "breached", "reused"] and auto_generate:
                 # Generate a new strong password
-                options = PasswordOptions(
-                    length=password_length,
-                    include_uppercase=True,
-                    include_lowercase=True,
-                    include_digits=True,
-                    include_special=True,
-                    min_uppercase=2,
-                    min_lowercase=2,
-                    min_digits=2,
-                    min_special=2,
-                )
-
                 new_password = generate_password(
                     style=PasswordStyle.RANDOM, options=options
                 )
@@ -262,7 +295,7 @@ def fix_security_issues(
 
         except Exception as e:
             # Log error but continue with other fixes
-            log_info(f"Failed to fix issue for entry {entry_id}: {str(e)}")
+            log_info("Failed to fix issue for entry %s: %s", entry_id, e)
             continue
 
     return fixed_count
@@ -284,13 +317,17 @@ def run_security_audit(
     Returns:
         Dictionary containing security score, issues, and timestamp
     """
+    passwords = get_passwords()
     audit_results = audit_password_strength(
-        use_parallel=use_parallel, check_breaches=check_breaches, max_workers=max_workers
+        use_parallel=use_parallel,
+        check_breaches=check_breaches,
+        max_workers=max_workers,
+        passwords=passwords,
     )
-    security_score = get_security_score()
+    security_score = get_security_score(audit_results, len(passwords))
 
     # Log the audit
-    log_info(f"Security audit completed. Score: {security_score}")
+    log_info("Security audit completed. Score: %s", security_score)
 
     result = {
         "score": security_score,
@@ -6,20 +6,58 @@ to help users understand how their vault security is improving or degrading.
 
 from __future__ import annotations
 
-import json
+import atexit
+import bisect
+import copy
+import itertools
 import time
+import weakref
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from secure_password_manager.utils import serialization
 from secure_password_manager.utils.logger import log_info
 from secure_password_manager.utils.paths import get_data_dir
 
+# Pending snapshots are written once this many accumulate, or once this many
+# seconds have passed since the last write; the rest are flushed at exit.
+FLUSH_BATCH_SIZE = 32
+FLUSH_INTERVAL = 10.0
 
-@dataclass
+# Number of distinct trend analysis windows kept between writes
+TREND_CACHE_SIZE = 8
+
+# Trackers that may hold pending snapshots; weak so they can still be collected
+# (a collected tracker flushes itself in __del__)
+_live_trackers: weakref.WeakSet[SecurityTrendTracker] = weakref.WeakSet()
+
+
+def _flush_live_trackers() -> None:
+    """Write pending snapshots of every tracker still alive at exit."""
+    for tracker in list(_live_trackers):
+        tracker.flush()
+
+
+atexit.register(_flush_live_trackers)
+
+
+@dataclass(frozen=True)
 class SecuritySnapshot:
     """A point-in-time snapshot of vault security metrics."""
 
+    # Spelled out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = (
+        "timestamp",
+        "score",
+        "total_passwords",
+        "weak_count",
+        "reused_count",
+        "breached_count",
+        "expired_count",
+        "duplicate_count",
+    )
+
     timestamp: int
     score: int
     total_passwords: int
@@ -38,6 +76,37 @@ class SecuritySnapshot:
         """Create from dictionary."""
         return cls(**data)
 
+    def to_row(self) -> List[int]:
+        """Convert to a list of field values in declaration order."""
+        return [
+            self.timestamp,
+            self.score,
+            self.total_passwords,
+            self.weak_count,
+            self.reused_count,
+            self.breached_count,
+            self.expired_count,
+            self.duplicate_count,
+        ]
+
+    @classmethod
+    def from_row(cls, row: List[int]) -> SecuritySnapshot:
+        """Create from a list of field values in declaration order."""
+        return cls(*row)
+
+
+def _encode_line(snapshot: SecuritySnapshot) -> bytes:
+    """Encode a snapshot as one compact history line."""
+    return serialization.dumps(snapshot.to_row()) + b"\n"
+
+
+def _decode_line(line: bytes) -> SecuritySnapshot:
+    """Decode a history line written as a row or as a keyed object."""
+    data = serialization.loads(line)
+    if isinstance(data, list):
+        return SecuritySnapshot.from_row(data)
+    return SecuritySnapshot.from_dict(data)
+
 
 class SecurityTrendTracker:
     """Tracks security scores over time."""
@@ -46,43 +115,144 @@ class SecurityTrendTracker:
         """Initialize the trend tracker.
 
         Args:
-            history_file: Path to history JSON file. Defaults to security_history.json in data dir.
+            history_file: Path to the history file, one JSON array of snapshot
+                fields per line.
+                Defaults to security_history.jsonl in data dir.
         """
+        self._legacy_file: Optional[Path] = None
         if history_file is None:
-            history_file = get_data_dir() / "security_history.json"
+            history_file = get_data_dir() / "security_history.jsonl"
+            self._legacy_file = get_data_dir() / "security_history.json"
 
         self.history_file = history_file
         self._snapshots: List[SecuritySnapshot] = []
+        # Timestamp and running score-total columns over _snapshots, rebuilt
+        # by _columns() whenever the list is replaced or grows behind our back
+        self._indexed: Optional[List[SecuritySnapshot]] = None
+        self._timestamps: List[int] = []
+        self._score_totals: List[int] = [0]
+        # Trend analyses keyed by (days, window start); emptied on any change
+        self._trend_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._dirty = 0
+        self._last_flush: Optional[float] = None
         self._load_history()
+        _live_trackers.add(self)
 
     def _load_history(self) -> None:
-        """Load historical snapshots from disk."""
-        if not self.history_file.exists():
-            return
+        """Load historical snapshots from disk.
+
+        Histories in the old single-document ``{"snapshots": [...]}`` format,
+        either at ``history_file`` or at the old default location, are
+        rewritten as JSON lines.
+        """
+        source = self.history_file
+        if not source.exists():
+            if self._legacy_file is None or not self._legacy_file.exists():
+                return
+            source = self._legacy_file
 
         try:
-            with open(self.history_file, "r") as f:
-                data = json.load(f)
-                self._snapshots = [
-                    SecuritySnapshot.from_dict(snap) for snap in data.get("snapshots", [])
-                ]
-            log_info(f"Loaded {len(self._snapshots)} security snapshots from history")
+            with open(source, "rb") as f:
+                first = f.readline()
+                legacy = first.strip() == b"{" or first.startswith(b'{"snapshots"')
+                if legacy:
+                    f.seek(0)
+                    self._snapshots = [
+                        SecuritySnapshot.from_dict(snap)
+                        for snap in serialization.loads(f.read()).get("snapshots", [])
+                    ]
+                else:
+                    self._snapshots = self._parse_lines(itertools.chain([first], f))
+            log_info("Loaded %s security snapshots from history", len(self._snapshots))
         except Exception as e:
-            log_info(f"Failed to load security history: {e}")
+            log_info("Failed to load security history: %s", e)
             self._snapshots = []
+            return
+
+        # Window lookups bisect on timestamps, so keep snapshots in time order
+        timestamps, _ = self._columns()
+        if any(map(int.__gt__, timestamps, timestamps[1:])):
+            self._snapshots.sort(key=lambda snap: snap.timestamp)
+            self._indexed = None
+
+        if legacy:
+            self._rewrite_history()
+
+    @staticmethod
+    def _parse_lines(lines: Iterable[bytes]) -> List[SecuritySnapshot]:
+        """Parse JSON-lines snapshots, skipping lines cut short by a crash."""
+        snapshots = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                snapshots.append(_decode_line(line))
+            except (ValueError, TypeError) as e:
+                log_info("Skipping unreadable security history line: %s", e)
+        return snapshots
+
+    def _rewrite_history(self) -> None:
+        """Write every snapshot to the history file, replacing its contents."""
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_file, "wb") as f:
+                f.writelines(map(_encode_line, self._snapshots))
+            self._dirty = 0
+            self._last_flush = time.monotonic()
+        except Exception as e:
+            log_info("Failed to save security history: %s", e)
 
     def _save_history(self) -> None:
-        """Save historical snapshots to disk."""
+        """Append pending snapshots to the history file."""
+        pending = self._snapshots[len(self._snapshots) - self._dirty :]
         try:
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.history_file, "w") as f:
-                json.dump(
-                    {"snapshots": [snap.to_dict() for snap in self._snapshots]},
-                    f,
-                    indent=2,
-                )
+            with open(self.history_file, "ab") as f:
+                f.writelines(map(_encode_line, pending))
+            self._dirty = 0
+            self._last_flush = time.monotonic()
         except Exception as e:
-            log_info(f"Failed to save security history: {e}")
+            log_info("Failed to save security history: %s", e)
+
+    def _columns(self) -> Tuple[List[int], List[int]]:
+        """Return the timestamp and running score-total columns.
+
+        ``score_totals[i]`` is the sum of the first ``i`` scores, so the sum
+        over any window is a single subtraction.
+        """
+        snapshots = self._snapshots
+        if self._indexed is not snapshots or len(self._timestamps) != len(snapshots):
+            self._timestamps = [s.timestamp for s in snapshots]
+            self._score_totals = list(
+                itertools.accumulate((s.score for s in snapshots), initial=0)
+            )
+            self._indexed = snapshots
+            self._trend_cache.clear()
+        return self._timestamps, self._score_totals
+
+    def _window_start(self, days: int) -> int:
+        """Return the index of the first snapshot in the last ``days`` days."""
+        timestamps, _ = self._columns()
+        return bisect.bisect_left(timestamps, int(time.time()) - (days * 86400))
+
+    def _maybe_flush(self) -> None:
+        """Write pending snapshots once the batch size or interval is reached."""
+        if (
+            self._dirty >= FLUSH_BATCH_SIZE
+            or self._last_flush is None
+            or time.monotonic() - self._last_flush > FLUSH_INTERVAL
+        ):
+            self._save_history()
+
+    def flush(self) -> None:
+        """Write any pending snapshots to disk."""
+        if self._dirty:
+            self._save_history()
+
+    def __del__(self) -> None:
+        """Write pending snapshots when a tracker is collected before exit."""
+        if getattr(self, "_dirty", 0):
+            self._save_history()
 
     def record_snapshot(
         self,
@@ -108,8 +278,10 @@ class SecurityTrendTracker:
         Returns:
             The created snapshot
         """
+        timestamps, score_totals = self._columns()
         snapshot = SecuritySnapshot(
-            timestamp=int(time.time()),
+            # Never step back past the last snapshot if the clock was set back
+            timestamp=max(int(time.time()), timestamps[-1] if timestamps else 0),
             score=score,
             total_passwords=total_passwords,
             weak_count=weak_count,
@@ -120,9 +292,17 @@ class SecurityTrendTracker:
         )
 
         self._snapshots.append(snapshot)
-        self._save_history()
-
-        log_info(f"Recorded security snapshot: score={score}, total={total_passwords}")
+        timestamps.append(snapshot.timestamp)
+        score_totals.append(score_totals[-1] + score)
+        self._trend_cache.clear()
+        self._dirty += 1
+        self._maybe_flush()
+
+        log_info(
+            "Recorded security snapshot: score=%s, total=%s",
+            score,
+            total_passwords,
+        )
         return snapshot
 
     def get_snapshots(
@@ -141,8 +321,7 @@ class SecurityTrendTracker:
 
         # Filter by days
         if days is not None:
-            cutoff = int(time.time()) - (days * 86400)
-            snapshots = [s for s in snapshots if s.timestamp >= cutoff]
+            snapshots = snapshots[self._window_start(days) :]
 
         # Apply limit
         if limit is not None:
@@ -159,17 +338,29 @@ class SecurityTrendTracker:
         Returns:
             Dictionary containing trend analysis
         """
-        snapshots = self.get_snapshots(days=days)
-
-        if len(snapshots) < 2:
+        start = self._window_start(days)
+        key = (days, start)
+        analysis = self._trend_cache.get(key)
+        if analysis is None:
+            analysis = self._analyze_window(days, start)
+            if len(self._trend_cache) >= TREND_CACHE_SIZE:
+                del self._trend_cache[next(iter(self._trend_cache))]
+            self._trend_cache[key] = analysis
+        return copy.deepcopy(analysis)
+
+    def _analyze_window(self, days: int, start: int) -> Dict[str, Any]:
+        """Build the trend analysis for the snapshots from ``start`` onwards."""
+        count = len(self._snapshots) - start
+
+        if count < 2:
             return {
                 "status": "insufficient_data",
                 "message": f"Need at least 2 snapshots in {days} days for trend analysis",
-                "snapshot_count": len(snapshots),
+                "snapshot_count": count,
             }
 
-        first = snapshots[0]
-        last = snapshots[-1]
+        first = self._snapshots[start]
+        last = self._snapshots[-1]
 
         # Calculate changes
         score_change = last.score - first.score
@@ -186,12 +377,13 @@ class SecurityTrendTracker:
             trend = "stable"
 
         # Calculate average score
-        avg_score = sum(s.score for s in snapshots) / len(snapshots)
+        _, score_totals = self._columns()
+        avg_score = (score_totals[-1] - score_totals[start]) / count
 
         return {
             "status": "success",
             "period_days": days,
-            "snapshot_count": len(snapshots),
+            "snapshot_count": count,
             "trend": trend,
             "score_change": score_change,
             "current_score": last.score,
@@ -215,13 +407,12 @@ class SecurityTrendTracker:
         Returns:
             Points per day improvement rate, or None if insufficient data
         """
-        snapshots = self.get_snapshots(days=days)
-
-        if len(snapshots) < 2:
+        start = self._window_start(days)
+        if len(self._snapshots) - start < 2:
             return None
 
-        first = snapshots[0]
-        last = snapshots[-1]
+        first = self._snapshots[start]
+        last = self._snapshots[-1]
 
         time_diff_days = (last.timestamp - first.timestamp) / 86400
         if time_diff_days < 1:
@@ -233,7 +424,7 @@ class SecurityTrendTracker:
     def clear_history(self) -> None:
         """Clear all historical snapshots."""
         self._snapshots = []
-        self._save_history()
+        self._rewrite_history()
         log_info("Cleared security history")
 
 
@@ -249,6 +440,16 @@ def get_trend_tracker() -> SecurityTrendTracker:
     return _tracker
 
 
+# Audit issue lists counted into a snapshot, in record_snapshot argument order
+_ISSUE_KEYS = (
+    "weak_passwords",
+    "reused_passwords",
+    "breached_passwords",
+    "expired_passwords",
+    "duplicate_passwords",
+)
+
+
 def record_audit_snapshot(audit_results: Dict[str, Any]) -> SecuritySnapshot:
     """Record a security audit as a historical snapshot.
 
@@ -261,15 +462,16 @@ def record_audit_snapshot(audit_results: Dict[str, Any]) -> SecuritySnapshot:
     tracker = get_trend_tracker()
 
     issues = audit_results["issues"]
+    weak, reused, breached, expired, duplicate = (
+        len(issues.get(key, ())) for key in _ISSUE_KEYS
+    )
 
     return tracker.record_snapshot(
         score=audit_results["score"],
-        total_passwords=len(issues.get("weak_passwords", []))
-        + len(issues.get("reused_passwords", []))
-        + len(issues.get("breached_passwords", [])),
-        weak_count=len(issues.get("weak_passwords", [])),
-        reused_count=len(issues.get("reused_passwords", [])),
-        breached_count=len(issues.get("breached_passwords", [])),
-        expired_count=len(issues.get("expired_passwords", [])),
-        duplicate_count=len(issues.get("duplicate_passwords", [])),
+        total_passwords=weak + reused + breached,
+        weak_count=weak,
+        reused_count=reused,
+        breached_count=breached,
+        expired_count=expired,
+        duplicate_count=duplicate,
     )
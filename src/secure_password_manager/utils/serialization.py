@@ -0,0 +1,50 @@
+"""JSON serialization helpers with an optional fast backend.
+
+Uses ``orjson`` when it is installed (``pip install .[fast]``) and falls back
+to the standard library ``json`` module otherwise. Encoders always return
+UTF-8 bytes so callers can write them straight to binary files.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes (compact, or 2-space indented)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def iterdumps(obj: Any) -> Iterator[Union[str, bytes]]:
+    """Yield compact JSON for ``obj`` in pieces suitable for streaming.
+
+    With ``orjson`` the whole document is produced in one C call; the stdlib
+    fallback encodes incrementally so the full string is never built.
+    """
+    if orjson is not None:
+        yield orjson.dumps(obj)
+        return
+    encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    yield from encoder.iterencode(obj)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserialize JSON. Errors subclass ``json.JSONDecodeError`` either way."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        # json.loads rejects memoryview; decode it in place instead of copying
+        data = str(data, "utf-8")
+    return json.loads(data)
@@ -10,8 +10,9 @@ from __future__ import annotations
 import datetime
 import hashlib
 import ipaddress
+import json
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
@@ -21,6 +22,9 @@ from cryptography.x509.oid import ExtendedKeyUsageOID, ExtensionOID, NameOID
 from secure_password_manager.utils.logger import log_info, log_warning
 from secure_password_manager.utils.paths import get_config_dir
 
+# Certificate fingerprints by path, with the (mtime_ns, size) they were taken at
+_fingerprint_cache: Dict[str, Tuple[int, int, str]] = {}
+
 
 def get_cert_dir() -> Path:
     """Get the directory for storing TLS certificates."""
@@ -35,16 +39,81 @@ def get_cert_paths() -> Tuple[Path, Path]:
     return cert_dir / "localhost.crt", cert_dir / "localhost.key"
 
 
+def _cert_meta_path(cert_path: Path) -> Path:
+    """Get the sidecar path holding a certificate's expiry and fingerprint."""
+    return cert_path.with_name(cert_path.name + ".meta")
+
+
+def _fingerprint(cert: x509.Certificate) -> str:
+    """Colon-separated SHA256 fingerprint of a certificate's DER encoding."""
+    der = cert.public_bytes(serialization.Encoding.DER)
+    return hashlib.sha256(der).digest().hex(":")
+
+
+def _write_cert_meta(cert_path: Path, cert: x509.Certificate) -> str:
+    """Record the certificate's expiry and fingerprint next to it.
+
+    The sidecar is tied to the certificate file's mtime and size so that a
+    replaced certificate is never matched with stale metadata. Returns the
+    fingerprint, which is also cached for get_cert_fingerprint().
+    """
+    st = cert_path.stat()
+    fingerprint = _fingerprint(cert)
+    _fingerprint_cache[str(cert_path)] = (st.st_mtime_ns, st.st_size, fingerprint)
+    meta = {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "not_valid_after": cert.not_valid_after_utc.isoformat(),
+        "fingerprint": fingerprint,
+    }
+    try:
+        _cert_meta_path(cert_path).write_text(json.dumps(meta))
+    except OSError as e:
+        log_warning("Failed to write certificate metadata: %s", e)
+    return fingerprint
+
+
+def _read_cert_meta(cert_path: Path) -> Optional[datetime.datetime]:
+    """Return the certificate's expiry from its sidecar, if it still matches.
+
+    Also seeds the fingerprint cache. Returns None when the sidecar is
+    missing, malformed or describes a different version of the file.
+    """
+    try:
+        st = cert_path.stat()
+        meta = json.loads(_cert_meta_path(cert_path).read_text())
+        if (meta["mtime_ns"], meta["size"]) != (st.st_mtime_ns, st.st_size):
+            return None
+        not_valid_after = datetime.datetime.fromisoformat(meta["not_valid_after"])
+        fingerprint = meta["fingerprint"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not_valid_after.tzinfo is None or not isinstance(fingerprint, str):
+        return None
+    _fingerprint_cache[str(cert_path)] = (st.st_mtime_ns, st.st_size, fingerprint)
+    return not_valid_after
+
+
 def get_cert_fingerprint(cert_path: Path) -> Optional[str]:
-    """Get SHA256 fingerprint of a certificate for pinning."""
+    """Get SHA256 fingerprint of a certificate for pinning.
+
+    The fingerprint is cached until the file's modification time or size
+    changes.
+    """
     try:
+        st = cert_path.stat()
+        key = str(cert_path)
+        cached = _fingerprint_cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+
         with open(cert_path, "rb") as f:
             cert_data = f.read()
-        cert = x509.load_pem_x509_certificate(cert_data)
-        fingerprint = hashlib.sha256(cert.public_bytes(serialization.Encoding.DER)).hexdigest()
-        return ":".join(fingerprint[i:i+2] for i in range(0, len(fingerprint), 2))
+        fingerprint = _fingerprint(x509.load_pem_x509_certificate(cert_data))
+        _fingerprint_cache[key] = (st.st_mtime_ns, st.st_size, fingerprint)
+        return fingerprint
     except Exception as e:
-        log_warning(f"Failed to get certificate fingerprint: {e}")
+        log_warning("Failed to get certificate fingerprint: %s", e)
         return None
 
 
@@ -66,18 +135,29 @@ def generate_self_signed_cert(
     # Check if certificate already exists and is still valid
     if cert_path.exists() and key_path.exists():
         try:
-            with open(cert_path, "rb") as f:
-                cert = x509.load_pem_x509_certificate(f.read())
+            # The sidecar avoids parsing the certificate on every startup
+            not_valid_after = _read_cert_meta(cert_path)
+            if not_valid_after is None:
+                with open(cert_path, "rb") as f:
+                    cert = x509.load_pem_x509_certificate(f.read())
+                not_valid_after = cert.not_valid_after_utc
+                _write_cert_meta(cert_path, cert)
 
             # Check if certificate is still valid for at least 30 days
-            days_remaining = (cert.not_valid_after_utc - datetime.datetime.now(datetime.timezone.utc)).days
+            days_remaining = (not_valid_after - datetime.datetime.now(datetime.timezone.utc)).days
             if days_remaining > 30:
-                log_info(f"Using existing TLS certificate (valid for {days_remaining} more days)")
+                log_info(
+                    "Using existing TLS certificate (valid for %s more days)",
+                    days_remaining,
+                )
                 return cert_path, key_path
             else:
-                log_info(f"TLS certificate expires in {days_remaining} days, regenerating...")
+                log_info(
+                    "TLS certificate expires in %s days, regenerating...",
+                    days_remaining,
+                )
         except Exception as e:
-            log_warning(f"Failed to load existing certificate: {e}, regenerating...")
+            log_warning("Failed to load existing certificate: %s, regenerating...", e)
 
     log_info("Generating new self-signed TLS certificate for browser bridge...")
 
@@ -152,7 +232,9 @@ def generate_self_signed_cert(
             )
         )
 
-    # Write certificate
+    # Write certificate; a rewrite can keep the old size and mtime on
+    # filesystems with coarse timestamps, so drop any cached fingerprint
+    _fingerprint_cache.pop(str(cert_path), None)
     with open(cert_path, "wb") as f:
         f.write(cert.public_bytes(serialization.Encoding.PEM))
 
@@ -160,10 +242,10 @@ def generate_self_signed_cert(
     key_path.chmod(0o600)
     cert_path.chmod(0o644)
 
-    fingerprint = get_cert_fingerprint(cert_path)
-    log_info(f"Generated TLS certificate with fingerprint: {fingerprint}")
-    log_info(f"Certificate saved to: {cert_path}")
-    log_info(f"Private key saved to: {key_path}")
+    fingerprint = _write_cert_meta(cert_path, cert)
+    log_info("Generated TLS certificate with fingerprint: %s", fingerprint)
+    log_info("Certificate saved to: %s", cert_path)
+    log_info("Private key saved to: %s", key_path)
 
     return cert_path, key_path
 
@@ -179,14 +261,16 @@ def remove_cert() -> bool:
     cert_path, key_path = get_cert_paths()
     removed = False
 
+    _fingerprint_cache.pop(str(cert_path), None)
+    _cert_meta_path(cert_path).unlink(missing_ok=True)
     if cert_path.exists():
         cert_path.unlink()
         removed = True
-        log_info(f"Removed certificate: {cert_path}")
+        log_info("Removed certificate: %s", cert_path)
 
     if key_path.exists():
         key_path.unlink()
         removed = True
-        log_info(f"Removed private key: {key_path}")
+        log_info("Removed private key: %s", key_path)
 
     return removed
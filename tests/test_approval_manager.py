@@ -317,6 +317,31 @@ def test_approval_manager_cleanup_old_responses(approval_manager):
     assert len(approval_manager._responses) == 0
 
 
+def test_approval_manager_burst_requests_get_unique_ids(approval_manager):
+    """Test that back-to-back requests from one origin never share an ID."""
+    seen = []
+
+    def approve_handler(request: ApprovalRequest) -> ApprovalResponse:
+        seen.append(request.request_id)
+        return ApprovalResponse(
+            request_id=request.request_id,
+            decision=ApprovalDecision.APPROVED,
+        )
+
+    approval_manager.set_prompt_handler(approve_handler)
+
+    for _ in range(20):
+        approval_manager.request_approval(
+            origin="https://burst.com",
+            browser="Chrome",
+            fingerprint="fp",
+            entry_count=1,
+        )
+
+    assert len(set(seen)) == 20
+    assert len(approval_manager._responses) == 20
+
+
 def test_approval_request_to_dict():
     """Test ApprovalRequest serialization."""
     request = ApprovalRequest(
@@ -349,6 +374,37 @@ def test_get_approval_manager_singleton():
     assert manager1 is manager2
 
 
+def test_get_approval_manager_concurrent_first_use(monkeypatch):
+    """Test that racing threads construct only one approval manager."""
+    import threading
+
+    from secure_password_manager.utils import approval_manager as am
+
+    monkeypatch.setattr(am, "_approval_manager", None)
+    constructed = []
+    original_init = am.ApprovalManager.__init__
+
+    def slow_init(self, *args, **kwargs):
+        constructed.append(self)
+        time.sleep(0.05)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(am.ApprovalManager, "__init__", slow_init)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_approval_manager()))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(constructed) == 1
+    assert all(r is results[0] for r in results)
+
+
 def test_approval_manager_handler_exception(approval_manager):
     """Test that handler exceptions are caught gracefully."""
 
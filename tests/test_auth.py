@@ -35,3 +35,17 @@ def test_authenticate_upgrades_legacy_hash(test_env):
     with open(auth_path, encoding="utf-8") as handle:
         record = json.load(handle)
     assert "hash" in record and "kdf" in record
+
+
+def test_authenticate_reloads_after_external_change(test_env):
+    set_master_password("FirstPass!2025")
+    assert authenticate("FirstPass!2025") is True
+
+    # Replace auth.json behind the module's back (e.g. another process)
+    auth_path = get_auth_json_path()
+    legacy_hash = hashlib.sha256(b"OtherPass!2025").hexdigest()
+    with open(auth_path, "w", encoding="utf-8") as handle:
+        json.dump({"master_hash": legacy_hash, "padding": "x" * 64}, handle)
+
+    assert authenticate("FirstPass!2025") is False
+    assert authenticate("OtherPass!2025") is True
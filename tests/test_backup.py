@@ -30,6 +30,7 @@ from secure_password_manager.utils.crypto import (
 from secure_password_manager.utils.database import (
     add_category,
     add_password,
+    close_connection,
     get_categories,
     get_passwords,
     init_db,
@@ -207,7 +208,7 @@ def test_export_passwords_cleans_up_on_error(setup_test_data, tmp_path):
     master_password = "test_master_pass"
 
     # Force an error during encryption
-    with patch('secure_password_manager.utils.backup.encrypt_with_password_envelope',
+    with patch('secure_password_manager.utils.backup.encrypt_stream_with_password_envelope',
                side_effect=Exception("Encryption failed")):
         result = export_passwords(str(export_file), master_password)
 
@@ -247,6 +248,46 @@ def test_import_passwords_success(setup_test_data, tmp_path):
     assert len(passwords) >= 3
 
 
+def test_import_passwords_preserve_ciphertext_roundtrip(setup_test_data, tmp_path):
+    """Test same-key export that carries vault ciphertext instead of plaintext."""
+    from secure_password_manager.utils.database import close_connection
+    from secure_password_manager.utils.paths import get_database_path
+
+    export_file = tmp_path / "export.dat"
+    master_password = "test_master_pass"
+    assert export_passwords(str(export_file), master_password, preserve_ciphertext=True)
+
+    with open(export_file, "rb") as f:
+        data = json.loads(decrypt_with_password_envelope(f.read(), master_password))
+    assert data["metadata"]["version"] == "2.1"
+    assert "key_id" in data["metadata"]
+    assert all("password" not in e and "encrypted_blob" in e for e in data["entries"])
+
+    close_connection()
+    get_database_path().unlink()
+    init_db()
+
+    with patch("secure_password_manager.utils.backup.encrypt_password") as mock_encrypt:
+        assert import_passwords(str(export_file), master_password) == 3
+        mock_encrypt.assert_not_called()
+
+    github = next(p for p in get_passwords() if p[1] == "github.com")
+    assert decrypt_password(github[3]) == "GitHubPass123!"
+
+
+def test_import_passwords_preserve_ciphertext_rejects_other_key(setup_test_data, tmp_path):
+    """Test that ciphertext exports are refused under a different vault key."""
+    from secure_password_manager.utils.crypto import generate_key
+
+    export_file = tmp_path / "export.dat"
+    master_password = "test_master_pass"
+    export_passwords(str(export_file), master_password, preserve_ciphertext=True)
+
+    generate_key()  # rotate to a new vault key
+
+    assert import_passwords(str(export_file), master_password) == 0
+
+
 def test_import_passwords_wrong_password(setup_test_data, tmp_path):
     """Test import with wrong password."""
     export_file = tmp_path / "export.dat"
@@ -280,6 +321,7 @@ def test_import_passwords_preserves_metadata(setup_test_data, tmp_path):
     # Clear and import
     from secure_password_manager.utils.paths import get_database_path
     db_path = get_database_path()
+    close_connection()
     db_path.unlink()
     init_db()
 
@@ -303,6 +345,7 @@ def test_import_passwords_imports_categories(setup_test_data, tmp_path):
     # Clear database
     from secure_password_manager.utils.paths import get_database_path
     db_path = get_database_path()
+    close_connection()
     db_path.unlink()
     init_db()
 
@@ -564,6 +607,79 @@ def test_restore_from_backup_creates_file_backups(setup_test_data, tmp_path, mon
     assert len(backup_files) > 0
 
 
+def test_restore_updates_connections_held_by_other_threads(setup_test_data, tmp_path):
+    """Test that restore copies data in place instead of swapping the file."""
+    import threading
+
+    from secure_password_manager.utils.paths import get_database_path
+
+    original_count = len(get_passwords())
+    backup_path = create_full_backup(str(tmp_path / "backups"), "test_master_pass")
+    add_password("modified.com", "user", encrypt_password("pass"), "General")
+
+    # A worker thread opens its own cached connection before the restore
+    counts = []
+    opened, restored = threading.Event(), threading.Event()
+
+    def worker():
+        counts.append(len(get_passwords()))
+        opened.set()
+        restored.wait(5)
+        counts.append(len(get_passwords()))
+        close_connection()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    opened.wait(5)
+    inode = get_database_path().stat().st_ino
+
+    assert restore_from_backup(backup_path, "test_master_pass") is True
+    restored.set()
+    thread.join(5)
+
+    assert get_database_path().stat().st_ino == inode
+    assert len(get_passwords()) == original_count
+    assert counts == [original_count + 1, original_count]
+
+
+def test_backup_current_files_includes_wal_pages(setup_test_data):
+    """Test that the pre-restore database copy includes uncheckpointed writes."""
+    from secure_password_manager.utils.backup import _backup_current_files
+    from secure_password_manager.utils.paths import get_database_path
+
+    add_password("wal.example", "user", encrypt_password("pw"))
+    expected = len(get_passwords())
+
+    _backup_current_files(1)
+
+    conn = sqlite3.connect(f"{get_database_path()}.bak1")
+    try:
+        count = conn.execute("SELECT COUNT(*) FROM passwords").fetchone()[0]
+    finally:
+        conn.close()
+    assert count == expected
+
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_fast_copy_preserves_content_and_mode(tmp_path, monkeypatch, kernel_copy):
+    """Test _fast_copy with and without os.copy_file_range."""
+    from secure_password_manager.utils.backup import _fast_copy
+
+    if not kernel_copy:
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+
+    src = tmp_path / "secret.key"
+    src.write_bytes(os.urandom(200_000))
+    os.chmod(src, 0o600)
+    dst = tmp_path / "secret.key.bak1"
+
+    _fast_copy(str(src), str(dst))
+
+    assert dst.read_bytes() == src.read_bytes()
+    if os.name == "posix":
+        assert (dst.stat().st_mode & 0o777) == 0o600
+
+
 def test_restore_from_backup_extracts_to_temp(setup_test_data, tmp_path, monkeypatch):
     """Test that restore extracts to temp directory first."""
     backup_dir = tmp_path / "backups"
@@ -620,6 +736,7 @@ def test_export_import_roundtrip_preserves_data(setup_test_data, tmp_path):
 
     # Clear database
     db_path = get_database_path()
+    close_connection()
     db_path.unlink()
     init_db()
 
@@ -70,6 +70,11 @@ def test_bulk_operation_result():
     assert result_dict["skip_count"] == 1
     assert 1 in result_dict["successful_ids"]
     assert 2 in result_dict["successful_ids"]
+    assert result_dict["failed"] == [(3, "Error message")]
+    assert result_dict["skipped"] == [(4, "User cancelled")]
+
+    # Slotted: no per-instance __dict__
+    assert not hasattr(result, "__dict__")
 
 
 def test_bulk_delete(setup_test_entries):
@@ -258,6 +263,24 @@ def test_bulk_export(setup_test_entries):
         assert len(exported_entry["password"]) > 0
 
 
+def test_bulk_export_parallel_preserves_order(setup_test_entries, monkeypatch):
+    """Test that pooled decryption keeps request order and per-entry failures."""
+    from secure_password_manager.utils import crypto
+
+    monkeypatch.setattr(crypto, "_PARALLEL_DECRYPT_MIN", 1)
+
+    entries = get_passwords()
+    entry_ids = [e[0] for e in reversed(entries)] + [9999]
+
+    exported, result = bulk_export(entry_ids, max_workers=3)
+
+    assert [e["id"] for e in exported] == entry_ids[:-1]
+    for exported_entry in exported:
+        original = next(e for e in entries if e[0] == exported_entry["id"])
+        assert exported_entry["password"] == decrypt_password(original[3])
+    assert result.failed == [(9999, "Entry not found")]
+
+
 def test_bulk_export_nonexistent_entry(setup_test_entries):
     """Test bulk export handles non-existent entries."""
     exported, result = bulk_export([9999])
@@ -266,6 +289,30 @@ def test_bulk_export_nonexistent_entry(setup_test_entries):
     assert len(exported) == 0
 
 
+def test_bulk_operations_fetch_entries_once(setup_test_entries, monkeypatch):
+    """Test that bulk updates look entries up in one query, not one per ID."""
+    from secure_password_manager.utils import bulk_operations
+
+    entries = get_passwords()
+    entry_ids = [e[0] for e in entries] + [9999]
+
+    calls = []
+    original = bulk_operations.get_passwords
+
+    def counting_get_passwords(*args, **kwargs):
+        calls.append(kwargs.get("ids"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(bulk_operations, "get_passwords", counting_get_passwords)
+
+    result = bulk_change_category(entry_ids, "Archive")
+
+    assert len(calls) == 1
+    assert sorted(calls[0]) == sorted(entry_ids)
+    assert result.success_count == len(entries)
+    assert result.failed == [(9999, "Entry not found")]
+
+
 def test_select_entries_by_filter_category(setup_test_entries):
     """Test selecting entries by category filter."""
     # Select all Web category entries
@@ -21,8 +21,8 @@ def test_clipboard_manager_copy_without_auto_clear():
         manager.copy("test_password", auto_clear=False)
         mock_copy.assert_called_once_with("test_password")
 
-    # Ensure no timer was scheduled
-    assert manager._clear_timer is None
+    # Ensure no clear was scheduled
+    assert manager._deadline is None
 
 
 def test_clipboard_manager_copy_with_auto_clear():
@@ -39,9 +39,9 @@ def test_clipboard_manager_copy_with_auto_clear():
             manager.copy("test_password", auto_clear=True)
             mock_copy.assert_called_once_with("test_password")
 
-            # Verify timer was scheduled
-            assert manager._clear_timer is not None
-            assert manager._clear_timer.is_alive()
+            # Verify a clear was scheduled on the worker thread
+            assert manager._deadline is not None
+            assert manager._worker is not None and manager._worker.is_alive()
 
             # Wait for auto-clear
             time.sleep(1.5)
@@ -52,7 +52,7 @@ def test_clipboard_manager_copy_with_auto_clear():
 
 
 def test_clipboard_manager_multiple_copies_cancel_previous_timer():
-    """Test that multiple copies cancel previous timers."""
+    """Test that multiple copies push back the pending clear on one worker."""
     manager = ClipboardManager()
 
     with patch(
@@ -60,24 +60,26 @@ def test_clipboard_manager_multiple_copies_cancel_previous_timer():
     ) as mock_copy:
         with patch(
             "secure_password_manager.utils.clipboard_manager.config.get_setting",
-            return_value=2,
+            return_value=1,
         ):
             # First copy
             manager.copy("password1", auto_clear=True)
-            first_timer = manager._clear_timer
-            assert first_timer is not None
+            first_deadline = manager._deadline
+            first_worker = manager._worker
+            assert first_deadline is not None
 
-            # Second copy should cancel first timer
+            # Second copy should replace the first deadline
             time.sleep(0.5)
             manager.copy("password2", auto_clear=True)
-            second_timer = manager._clear_timer
 
-            # Give the cancellation a moment to complete
-            time.sleep(0.1)
+            assert manager._deadline > first_deadline
+            assert manager._worker is first_worker
 
-            assert first_timer is not second_timer
-            assert not first_timer.is_alive(), "First timer should be cancelled"
-            assert second_timer is not None and second_timer.is_alive()
+            # Past the first deadline but before the second: no clear yet
+            time.sleep(0.7)
+            assert mock_copy.call_count == 2
+
+            manager.clear_now()
 
 
 def test_clipboard_manager_clear_now():
@@ -93,13 +95,13 @@ def test_clipboard_manager_clear_now():
         ):
             # Copy with auto-clear
             manager.copy("test_password", auto_clear=True)
-            assert manager._clear_timer is not None
+            assert manager._deadline is not None
 
             # Clear immediately
             manager.clear_now()
 
-            # Verify timer was canceled
-            assert manager._clear_timer is None or not manager._clear_timer.is_alive()
+            # Verify pending clear was canceled
+            assert manager._deadline is None
 
             # Verify clipboard was cleared
             assert mock_copy.call_count == 2
@@ -121,7 +123,7 @@ def test_clipboard_manager_zero_clear_seconds_disables_auto_clear():
 
             # Only one copy call should have been made (no auto-clear)
             mock_copy.assert_called_once_with("test_password")
-            assert manager._clear_timer is None
+            assert manager._deadline is None
 
 
 def test_clipboard_manager_handles_clear_errors():
@@ -147,6 +149,40 @@ def test_clipboard_manager_handles_clear_errors():
             assert mock_copy.call_count == 2
 
 
+def test_clipboard_manager_caches_clear_seconds():
+    """Test that the auto-clear setting is read once until reload_config()."""
+    manager = ClipboardManager()
+
+    with patch("secure_password_manager.utils.clipboard_manager.pyperclip.copy"):
+        with patch(
+            "secure_password_manager.utils.clipboard_manager.config.get_setting",
+            return_value=0,
+        ) as mock_setting:
+            manager.copy("password1", auto_clear=True)
+            manager.copy("password2", auto_clear=True)
+            assert mock_setting.call_count == 1
+
+            manager.reload_config()
+            manager.copy("password3", auto_clear=True)
+            assert mock_setting.call_count == 2
+
+
+def test_clipboard_manager_prefers_native_clear():
+    """Test that a native clear backend is used instead of pyperclip."""
+    manager = ClipboardManager()
+
+    with patch(
+        "secure_password_manager.utils.clipboard_manager.pyperclip.copy"
+    ) as mock_copy:
+        with patch(
+            "secure_password_manager.utils.clipboard_manager._native_clear"
+        ) as mock_native:
+            manager.clear_now()
+
+            mock_native.assert_called_once_with()
+            mock_copy.assert_not_called()
+
+
 def test_global_clipboard_manager_singleton():
     """Test that get_clipboard_manager returns the same instance."""
     manager1 = get_clipboard_manager()
@@ -212,7 +248,7 @@ def test_clipboard_manager_thread_safety():
 
 
 def test_clipboard_manager_cleanup_on_deletion():
-    """Test that clipboard manager cleans up timer on deletion."""
+    """Test that clipboard manager stops its worker thread on deletion."""
     with patch("secure_password_manager.utils.clipboard_manager.pyperclip.copy"):
         with patch(
             "secure_password_manager.utils.clipboard_manager.config.get_setting",
@@ -221,14 +257,13 @@ def test_clipboard_manager_cleanup_on_deletion():
             manager = ClipboardManager()
             manager.copy("test_password", auto_clear=True)
 
-            timer = manager._clear_timer
-            assert timer is not None
-            assert timer.is_alive()
+            worker = manager._worker
+            assert worker is not None
+            assert worker.is_alive()
 
             # Delete manager (calls __del__)
-            manager._cancel_timer()
             del manager
 
-            # Timer should be canceled
-            time.sleep(0.2)
-            assert not timer.is_alive()
+            # Worker should exit
+            worker.join(timeout=1)
+            assert not worker.is_alive()
@@ -4,8 +4,11 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from secure_password_manager.utils.crypto import (
+    decrypt_many_with_key,
     decrypt_password,
+    decrypt_with_key,
     encrypt_password,
+    encrypt_with_key,
     generate_key,
     load_key,
 )
@@ -41,3 +44,40 @@ def test_key_generation_and_loading(clean_crypto_files):
     key = load_key()
     assert isinstance(key, bytes)
     assert len(key) > 0
+
+
+def test_encrypt_with_preloaded_key_interoperates(clean_crypto_files):
+    """Test that key-reusing helpers match encrypt_password/decrypt_password."""
+    import pytest
+
+    generate_key()
+    key = load_key()
+
+    assert decrypt_password(encrypt_with_key(key, "pw-one")) == "pw-one"
+    assert decrypt_with_key(key, encrypt_password("pw-two")) == "pw-two"
+
+    with pytest.raises(ValueError):
+        decrypt_with_key(key, b"not-a-token")
+
+
+def test_decrypt_many_with_key_reports_failures_in_order(
+    clean_crypto_files, monkeypatch
+):
+    """Test batch decryption inline and pooled, with per-value errors."""
+    from secure_password_manager.utils import crypto
+
+    generate_key()
+    key = load_key()
+    tokens = [
+        encrypt_with_key(key, "pw-one"),
+        b"not-a-token",
+        encrypt_password("pw-two"),
+    ]
+
+    for parallel_min in (32, 1):
+        monkeypatch.setattr(crypto, "_PARALLEL_DECRYPT_MIN", parallel_min)
+        results = decrypt_many_with_key(key, tokens, max_workers=2)
+
+        assert [password for password, _ in results] == ["pw-one", None, "pw-two"]
+        assert results[0][1] is None
+        assert results[1][1].startswith("Decryption failed")
@@ -2,8 +2,12 @@ import os
 import sqlite3
 import sys
 
+import pytest
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from secure_password_manager.utils.crypto import encrypt_password
+from secure_password_manager.utils.database import add_password, get_passwords, init_db
 
 # Use an in-memory database for testing
 DB_FILE = ":memory:"
@@ -50,3 +54,202 @@ def test_database_operations():
     assert len(results) == 0
 
     conn.close()
+
+
+@pytest.fixture
+def setup_test_entries(clean_crypto_files, clean_database):
+    """Create test password entries."""
+    from secure_password_manager.utils.crypto import generate_key
+
+    generate_key()
+    init_db()
+
+    entries = [
+        ("example.com", "user1", "password123", "Web", "Test note 1", None),
+        ("github.com", "user2", "githubpass", "Development", "Test note 2", None),
+        ("bank.com", "user3", "bankpass", "Finance", "Test note 3", 90),
+        ("email.com", "user4", "emailpass", "Email", "Test note 4", None),
+        ("social.com", "user5", "socialpass", "Social", "Test note 5", None),
+    ]
+
+    for website, username, password, category, notes, expiry_days in entries:
+        encrypted = encrypt_password(password)
+        add_password(website, username, encrypted, category, notes, expiry_days)
+
+    return entries
+
+
+def test_bulk_update_passwords_isolates_failures(setup_test_entries):
+    """Test that one bad row is rolled back alone and the rest commit together."""
+    from secure_password_manager.utils.database import bulk_update_passwords
+
+    entries = get_passwords()
+    updates = [
+        {"entry_id": entries[0][0], "category": "Batch"},
+        {"entry_id": 9999, "category": "Batch"},
+        {"entry_id": entries[1][0], "category": "Batch"},
+    ]
+
+    failures = bulk_update_passwords(updates)
+
+    assert [entry_id for entry_id, _ in failures] == [9999]
+    updated = {e[0]: e[4] for e in get_passwords()}
+    assert updated[entries[0][0]] == "Batch"
+    assert updated[entries[1][0]] == "Batch"
+
+
+def test_nested_write_connection_defers_to_outer_transaction(setup_test_entries):
+    """Test that an inner write joins the outer transaction instead of committing."""
+    from secure_password_manager.utils.database import (
+        delete_password,
+        get_write_connection,
+    )
+
+    entries = get_passwords()
+
+    with pytest.raises(RuntimeError):
+        with get_write_connection():
+            delete_password(entries[0][0])
+            raise RuntimeError("abort")
+
+    assert len(get_passwords()) == len(entries)
+
+
+def test_get_categories_cached_until_add(setup_test_entries, monkeypatch):
+    """Test that categories are served from cache and refreshed after a write."""
+    from secure_password_manager.utils import database
+
+    first = database.get_categories()
+
+    calls = []
+    real_read = database.get_read_connection
+
+    def counting_read():
+        calls.append(1)
+        return real_read()
+
+    monkeypatch.setattr(database, "get_read_connection", counting_read)
+
+    assert database.get_categories() == first
+    assert calls == []
+
+    database.add_category("Cached", "teal")
+    assert ("Cached", "teal") in database.get_categories()
+    assert len(calls) == 1
+
+
+def test_get_passwords_cache_sees_writes(setup_test_entries):
+    """Test that cached results are dropped after writes on any connection."""
+    from secure_password_manager.utils.database import _get_db_file, delete_password
+
+    first = get_passwords(category="Web")
+    assert get_passwords(category="Web") == first
+
+    add_password("web2.com", "u", encrypt_password("p"), category="Web")
+    assert len(get_passwords(category="Web")) == len(first) + 1
+
+    # A commit from a separate connection bumps PRAGMA data_version
+    other = sqlite3.connect(_get_db_file())
+    other.execute("UPDATE passwords SET category = 'Moved' WHERE website = 'web2.com'")
+    other.commit()
+    other.close()
+    assert get_passwords(category="Web") == first
+
+    delete_password(first[0][0])
+    assert get_passwords(category="Web") == []
+
+
+def test_add_passwords_bulk(setup_test_entries):
+    """Test inserting several entries in one transaction."""
+    from secure_password_manager.utils.database import add_passwords_bulk
+
+    before = len(get_passwords())
+    inserted = add_passwords_bulk(
+        [
+            ("bulk1.com", "u1", encrypt_password("p1"), "Bulk", "", None),
+            ("bulk2.com", "u2", encrypt_password("p2"), "Bulk", "note", 30),
+        ]
+    )
+
+    assert inserted == 2
+    assert len(get_passwords()) == before + 2
+    bulk = {e[1]: e for e in get_passwords(category="Bulk")}
+    assert bulk["bulk1.com"][8] is None
+    assert bulk["bulk2.com"][8] is not None
+    assert add_passwords_bulk([]) == 0
+
+
+def test_iter_passwords_matches_get_passwords(setup_test_entries):
+    """Test that streaming in small batches yields the same rows in order."""
+    from secure_password_manager.utils.database import iter_passwords
+
+    assert list(iter_passwords(batch_size=2)) == get_passwords()
+    assert list(iter_passwords(category="Finance")) == get_passwords(category="Finance")
+
+
+def test_get_passwords_by_ids(setup_test_entries):
+    """Test get_passwords restricted to a set of IDs."""
+    entries = get_passwords()
+    wanted = [entries[0][0], entries[2][0]]
+
+    assert {e[0] for e in get_passwords(ids=wanted)} == set(wanted)
+    assert get_passwords(ids=[]) == []
+
+
+def test_search_index_substring_and_updates(setup_test_entries):
+    """Test indexed search matches substrings and follows renames."""
+    from secure_password_manager.utils.database import update_password
+
+    # Case-insensitive substring inside the website and the username
+    assert {e[1] for e in get_passwords(search_term="HUB")} == {"github.com"}
+    assert {e[1] for e in get_passwords(search_term="ser3")} == {"bank.com"}
+
+    # Short terms fall back to LIKE
+    assert {e[1] for e in get_passwords(search_term="k.")} == {"bank.com"}
+
+    github_id = get_passwords(search_term="github")[0][0]
+    update_password(github_id, website="gitlab.com")
+    assert get_passwords(search_term="github") == []
+    assert [e[0] for e in get_passwords(search_term="gitlab")] == [github_id]
+
+
+def test_search_index_triggers_follow_sqlite_support(setup_test_entries):
+    """Test search triggers are dropped when FTS is unusable and restored after."""
+    from secure_password_manager.utils.database import (
+        _get_connection,
+        _has_search_index,
+        close_connection,
+    )
+    from secure_password_manager.utils.migrations import sync_search_index
+
+    def trigger_names():
+        rows = _get_connection().execute(
+            "SELECT name FROM sqlite_master WHERE name LIKE 'passwords_a_'"
+        )
+        return {row[0] for row in rows}
+
+    # Re-indexing after the triggers went missing
+    conn = _get_connection()
+    conn.execute("DROP TRIGGER passwords_ai")
+    conn.commit()
+    sync_search_index()
+    assert trigger_names() == {"passwords_ai", "passwords_ad", "passwords_au"}
+
+    # An index whose tokenizer this SQLite lacks must not block writes
+    conn.execute("PRAGMA writable_schema = ON")
+    conn.execute(
+        "UPDATE sqlite_master SET sql = replace(sql, 'trigram', 'missing')"
+        " WHERE name = 'passwords_fts'"
+    )
+    conn.commit()
+    close_connection()
+    # A stale "usable" answer cached before the resync must not survive it
+    assert _has_search_index(_get_connection().cursor())
+    sync_search_index()
+    assert trigger_names() == set()
+
+    add_password("example.org", "someone", encrypt_password("pw"))
+    assert {e[1] for e in get_passwords(search_term="example")} == {
+        "example.com",
+        "example.org",
+    }
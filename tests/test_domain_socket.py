@@ -1,6 +1,5 @@
 """Tests for domain socket transport utilities."""
 
-import json
 import os
 import socket
 import sys
@@ -12,12 +11,14 @@ import pytest
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from secure_password_manager.utils import serialization
 from secure_password_manager.utils.domain_socket import (
     DomainSocketClient,
     cleanup_socket,
     create_socket_server,
     get_socket_info,
     get_socket_path,
+    is_peer_authorized,
     is_socket_available,
     receive_message,
     send_message,
@@ -332,6 +333,63 @@ def test_receive_message_too_large_rejected(temp_socket_path):
         cleanup_socket(temp_socket_path)
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Unix domain sockets not supported on Windows")
+def test_receive_message_truncated_raises():
+    """Test that a peer closing mid-message raises OSError."""
+    reader, writer = socket.socketpair()
+    try:
+        writer.sendall((100).to_bytes(4, byteorder="big") + b'{"partial"')
+        writer.close()
+
+        with pytest.raises(OSError, match="10 of 100 bytes"):
+            receive_message(reader, timeout=2.0)
+    finally:
+        reader.close()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Unix domain sockets not supported on Windows")
+def test_receive_message_reuses_buffer():
+    """Test that a supplied buffer is reused and grown for larger messages."""
+    reader, writer = socket.socketpair()
+    buffer = bytearray(16)
+    try:
+        send_message(writer, {"n": 1})
+        assert receive_message(reader, timeout=2.0, buffer=buffer) == {"n": 1}
+        assert len(buffer) == 16
+
+        big = {"data": "x" * 100}
+        send_message(writer, big)
+        assert receive_message(reader, timeout=2.0, buffer=buffer) == big
+        assert len(buffer) == 128
+
+        send_message(writer, {"n": 2})
+        assert receive_message(reader, timeout=2.0, buffer=buffer) == {"n": 2}
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_send_message_resumes_partial_sendmsg():
+    """Test that send_message finishes a payload sendmsg only partly sent."""
+
+    class TrickleSocket:
+        def __init__(self):
+            self.sent = bytearray()
+
+        def sendmsg(self, buffers):
+            # Accept at most 3 bytes per call, possibly across buffers
+            chunk = b"".join(bytes(b) for b in buffers)[:3]
+            self.sent += chunk
+            return len(chunk)
+
+    sock = TrickleSocket()
+    message = {"type": "trickle", "data": "abcdefgh"}
+    send_message(sock, message)
+
+    payload = serialization.dumps(message)
+    assert bytes(sock.sent) == len(payload).to_bytes(4, byteorder="big") + payload
+
+
 def test_get_socket_info():
     """Test getting socket information."""
     info = get_socket_info()
@@ -386,3 +444,69 @@ def test_socket_path_uses_xdg_runtime_dir(tmp_path, monkeypatch):
     assert str(runtime_dir) in str(socket_path)
     assert socket_path.parent.name == "secure-password-manager"
     assert socket_path.name == "bridge.sock"
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets not supported")
+def test_socket_path_prepares_directory_once(tmp_path, monkeypatch):
+    """Test that repeated lookups skip the mkdir/chmod of a known directory."""
+    import secure_password_manager.utils.domain_socket as domain_socket
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    chmod_calls = []
+    real_chmod = os.chmod
+    monkeypatch.setattr(
+        domain_socket.os,
+        "chmod",
+        lambda path, mode: chmod_calls.append(path) or real_chmod(path, mode),
+    )
+
+    first = get_socket_path()
+    second = get_socket_path()
+
+    assert first == second
+    assert oct(first.parent.stat().st_mode)[-3:] == "700"
+    assert len(chmod_calls) == 1
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_PEERCRED"), reason="SO_PEERCRED not supported")
+def test_peer_from_same_user_is_authorized(temp_socket_path):
+    """Test that a client running as the current user passes the peer check."""
+    server_sock = create_socket_server(temp_socket_path)
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(temp_socket_path))
+        conn, _ = server_sock.accept()
+        try:
+            assert is_peer_authorized(conn)
+        finally:
+            conn.close()
+    finally:
+        client.close()
+        server_sock.close()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Unix domain sockets not supported on Windows")
+def test_receive_message_sets_timeout_only_when_changed():
+    """Test that repeated receives with the same timeout skip settimeout."""
+
+    class CountingSocket(socket.socket):
+        settimeout_calls = 0
+
+        def settimeout(self, value):
+            CountingSocket.settimeout_calls += 1
+            super().settimeout(value)
+
+    raw_reader, writer = socket.socketpair()
+    reader = CountingSocket(fileno=raw_reader.detach())
+    try:
+        for n in range(3):
+            send_message(writer, {"n": n})
+            assert receive_message(reader, timeout=2.0) == {"n": n}
+        assert CountingSocket.settimeout_calls == 1
+
+        send_message(writer, {"n": 3})
+        receive_message(reader, timeout=5.0)
+        assert CountingSocket.settimeout_calls == 2
+    finally:
+        reader.close()
+        writer.close()
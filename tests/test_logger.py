@@ -13,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from secure_password_manager.utils import logger
 from secure_password_manager.utils.logger import (
     clear_logs,
+    flush_logs,
     get_log_entries,
     log_debug,
     log_error,
@@ -53,15 +54,26 @@ def test_log_info(temp_log_file):
     assert temp_log_file.exists()
 
     # Check message was logged
+    flush_logs()
     content = temp_log_file.read_text()
     assert "Test info message" in content
     assert "INFO" in content
 
 
+def test_log_info_deferred_args(temp_log_file):
+    """Test %-style arguments are formatted into the logged message."""
+    log_info("Bulk %s: %d succeeded, 100%% ids=%s", "delete", 2, [1, 2])
+
+    flush_logs()
+    content = temp_log_file.read_text()
+    assert "Bulk delete: 2 succeeded, 100% ids=[1, 2]" in content
+
+
 def test_log_error(temp_log_file):
     """Test error logging."""
     log_error("Test error message")
 
+    flush_logs()
     content = temp_log_file.read_text()
     assert "Test error message" in content
     assert "ERROR" in content
@@ -71,6 +83,7 @@ def test_log_warning(temp_log_file):
     """Test warning logging."""
     log_warning("Test warning message")
 
+    flush_logs()
     content = temp_log_file.read_text()
     assert "Test warning message" in content
     assert "WARNING" in content
@@ -190,6 +203,7 @@ def test_multiple_log_calls(temp_log_file):
     log_error("Error 1")
     log_warning("Warning 1")
     log_info("Info 2")
+    flush_logs()
 
     content = temp_log_file.read_text()
     assert "Info 1" in content
@@ -227,3 +241,16 @@ def test_log_file_created_in_correct_directory(tmp_path, monkeypatch):
     # Check log file exists in temp directory
     log_file = tmp_path / "password_manager.log"
     assert log_file.exists()
+
+
+def test_get_log_entries_reads_tail_across_blocks(temp_log_file):
+    """Test that the tail read returns whole lines spanning block boundaries."""
+    for i in range(500):
+        log_info("Tail message %d %s", i, "x" * 40)
+
+    entries = get_log_entries(count=120)
+
+    assert len(entries) == 120
+    assert "Tail message 380 " in entries[0]
+    assert "Tail message 499 " in entries[-1]
+    assert all(entry.endswith("\n") for entry in entries)
@@ -233,3 +233,56 @@ def test_concurrent_workers_limit():
         for workers in [1, 5, 10]:
             results = check_breaches_parallel(passwords, max_workers=workers)
             assert len(results) == 10
+
+
+def test_parallel_checks_run_once_per_distinct_password():
+    """Test that reused passwords are checked once and fanned out to every entry."""
+    passwords = [(1, "Reused1"), (2, "Unique"), (3, "Reused1"), (4, "Reused1")]
+
+    with patch('secure_password_manager.utils.parallel_security.check_password_breach') as mock_check:
+        mock_check.side_effect = lambda pw: (True, 7) if pw == "Reused1" else (False, 0)
+        results = check_breaches_parallel(passwords, max_workers=2)
+
+    assert mock_check.call_count == 2
+    assert results == {1: (True, 7), 2: (False, 0), 3: (True, 7), 4: (True, 7)}
+
+    analysis = analyze_passwords_parallel(passwords, check_breaches=False, max_workers=2)
+    assert set(analysis) == {1, 2, 3, 4}
+    assert analysis[1] == analysis[3] == analysis[4]
+    assert analysis[1] is not analysis[3]
+
+
+def test_batch_process_entries_shares_one_executor(setup_test_passwords, monkeypatch):
+    """Test that every batch runs on the same caller-owned executor."""
+    from secure_password_manager.utils import parallel_security
+    from secure_password_manager.utils.database import get_passwords
+
+    seen = []
+    real_analyze = parallel_security.analyze_passwords_parallel
+
+    def recording_analyze(passwords, check_breaches=True, max_workers=10, executor=None):
+        seen.append(executor)
+        return real_analyze(passwords, check_breaches, max_workers, executor)
+
+    monkeypatch.setattr(parallel_security, "analyze_passwords_parallel", recording_analyze)
+
+    results = batch_process_entries(get_passwords(), batch_size=2, check_breaches=False)
+
+    assert len(results) == 5
+    assert len(seen) == 3
+    assert seen[0] is not None and all(ex is seen[0] for ex in seen)
+
+
+def test_analyze_passwords_parallel_accepts_generator():
+    """Test that analysis consumes a lazy iterable of passwords."""
+    consumed = []
+
+    def produce():
+        for entry_id, password in [(1, "weak"), (2, "StrongP@ssw0rd123")]:
+            consumed.append(entry_id)
+            yield entry_id, password
+
+    results = analyze_passwords_parallel(produce(), check_breaches=False, max_workers=2)
+
+    assert consumed == [1, 2]
+    assert set(results) == {1, 2}
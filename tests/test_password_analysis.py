@@ -162,3 +162,9 @@ def test_password_improvement_missing_characters():
     # Missing special characters
     suggestions = get_password_improvement_suggestions("Password123")
     assert "Add special characters" in suggestions
+
+
+def test_common_patterns_ignore_non_ascii_digits():
+    """Test that non-ASCII digit characters do not break pattern detection."""
+    assert check_common_patterns("ab²³⁴xy") == []
+    assert check_common_patterns("x123y") == ["Contains sequential numbers"]
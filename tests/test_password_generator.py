@@ -14,6 +14,7 @@ from secure_password_manager.utils.password_generator import (
     generate_memorable_password,
     generate_passphrase,
     generate_password,
+    generate_passwords,
     generate_pattern_password,
     generate_pin,
     generate_random_password,
@@ -94,6 +95,20 @@ def test_generate_random_password_min_requirements():
     assert sum(1 for c in password if c in special_chars) >= 2
 
 
+def test_generate_random_password_minima_fill_length():
+    """Test minima that use every position, and minima that cannot fit."""
+    options = PasswordOptions(
+        length=8, min_uppercase=2, min_lowercase=2, min_digits=2, min_special=2
+    )
+    for _ in range(20):
+        password = generate_random_password(options)
+        assert sum(c.isupper() for c in password) == 2
+        assert sum(c.isdigit() for c in password) == 2
+
+    with pytest.raises(ValueError):
+        generate_random_password(PasswordOptions(length=4, min_uppercase=5))
+
+
 def test_generate_memorable_password():
     """Test generating memorable (pronounceable) password."""
     password = generate_memorable_password(12)
@@ -205,6 +220,15 @@ def test_generate_password_passphrase_style():
     assert len(words) == 5
 
 
+def test_generate_pattern_password_class_repetition():
+    """Test that {n} repeats a custom character class."""
+    password = generate_pattern_password("[aeiou]{3}d{2}")
+
+    assert len(password) == 5
+    assert set(password[:3]) <= set("aeiou")
+    assert password[3:].isdigit()
+
+
 def test_generate_password_pattern_style():
     """Test generate_password with pattern style."""
     password = generate_password(
@@ -281,3 +305,51 @@ def test_multiple_passwords_are_different():
 
     # Should have at least 99 unique passwords out of 100
     assert len(passwords) >= 99
+
+
+def test_generate_passwords_batch_meets_requirements():
+    """Test that batch generation honours the same options as single generation."""
+    options = PasswordOptions(length=12, min_digits=2, start_with_letter=True)
+    passwords = generate_passwords(50, options)
+
+    assert len(passwords) == 50
+    assert len(set(passwords)) == 50
+    for password in passwords:
+        assert len(password) == 12
+        assert password[0].isalpha()
+        assert sum(c.isdigit() for c in password) >= 2
+
+
+def test_generate_passwords_custom_characters():
+    """Test batch generation with non-ASCII custom characters and zero count."""
+    options = PasswordOptions(
+        length=8,
+        custom_characters="äöü",
+        include_uppercase=False,
+        include_digits=False,
+    )
+    passwords = generate_passwords(5, options)
+
+    assert len(passwords) == 5
+    assert all(set(p) <= set("äöü") for p in passwords)
+    assert generate_passwords(0) == []
+
+
+def test_secure_choices_covers_alphabet():
+    """Test that CSPRNG sampling stays in the alphabet and reaches all of it."""
+    from secure_password_manager.utils.password_generator import _secure_choices
+
+    drawn = _secure_choices("abcde", 2000)
+
+    assert len(drawn) == 2000
+    assert set(drawn) == set("abcde")
+    assert _secure_choices("x", 4) == "xxxx"
+    assert _secure_choices("abc", 0) == ""
+
+
+def test_estimate_password_strength_very_long_password():
+    """Test that crack-time estimates do not overflow for huge entropy."""
+    result = estimate_password_strength("xA1!" * 100)
+
+    assert result["entropy"] > 1024
+    assert result["crack_time"].endswith("billion years")
@@ -7,7 +7,7 @@ import pytest
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from secure_password_manager.utils import config
+from secure_password_manager.utils import config, migrations
 from secure_password_manager.utils.crypto import decrypt_password, encrypt_password
 from secure_password_manager.utils.database import (
     add_password,
@@ -18,7 +18,12 @@ from secure_password_manager.utils.database import (
     init_db,
     update_password,
 )
-from secure_password_manager.utils.migrations import get_schema_version, run_migrations
+from secure_password_manager.utils.migrations import (
+    ensure_latest_schema,
+    get_schema_version,
+    invalidate_schema_cache,
+    run_migrations,
+)
 
 
 @pytest.fixture
@@ -159,6 +164,39 @@ def test_password_history_retention_limit(test_db):
     assert len(history) <= 3, "Should only keep last 3 versions"
 
 
+def test_password_history_retention_keeps_newest_within_same_second(test_db):
+    """Test that pruning drops the oldest rows even when timestamps tie."""
+    config.update_settings({"password_history": {"max_versions": 2}})
+
+    add_password("tie-test.com", "user@test.com", encrypt_password("v0"))
+    entry_id = get_passwords()[0][0]
+
+    for i in range(1, 5):
+        update_password(entry_id, encrypted_password=encrypt_password(f"v{i}"))
+
+    history = get_password_history(entry_id)
+    kept = sorted(decrypt_password(row[2]) for row in history)
+    assert kept == ["v2", "v3"]
+
+
+def test_password_history_retention_follows_setting_changes(test_db):
+    """Test that the retention trigger picks up a changed max_versions."""
+    config.update_settings({"password_history": {"max_versions": 0}})
+
+    add_password("limit-change.com", "user@test.com", encrypt_password("v0"))
+    entry_id = get_passwords()[0][0]
+
+    for i in range(1, 6):
+        update_password(entry_id, encrypted_password=encrypt_password(f"v{i}"))
+    assert len(get_password_history(entry_id)) == 5
+
+    config.update_settings({"password_history": {"max_versions": 2}})
+    update_password(entry_id, encrypted_password=encrypt_password("v6"))
+
+    kept = sorted(decrypt_password(row[2]) for row in get_password_history(entry_id))
+    assert kept == ["v4", "v5"]
+
+
 def test_password_history_unchanged_password_no_record(test_db):
     """Test that unchanged passwords don't create history entries."""
     # Add initial password
@@ -314,6 +352,82 @@ def test_migration_is_idempotent(test_db):
     assert len(result["migrations_run"]) == 0, "No migrations should run"
 
 
+def test_failed_migration_rolls_back_with_version(test_db, monkeypatch):
+    """Test that a failing migration leaves neither its changes nor its version."""
+    from secure_password_manager.utils.database import (
+        get_read_connection,
+        get_write_connection,
+    )
+
+    version_before = get_schema_version()
+
+    def broken_migration():
+        with get_write_connection() as conn:
+            conn.execute("CREATE TABLE half_done (id INTEGER)")
+            raise RuntimeError("boom")
+
+    monkeypatch.setitem(migrations.MIGRATIONS, version_before + 1, broken_migration)
+
+    result = run_migrations()
+
+    assert result["success"] is False
+    assert result["final_version"] == version_before
+    with get_read_connection() as conn:
+        row = conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'half_done'"
+        ).fetchone()
+    assert row is None
+
+
+def test_failed_migration_keeps_earlier_ones(test_db, monkeypatch):
+    """Test that migrations before a failing one still commit with their version."""
+    from secure_password_manager.utils.database import (
+        get_read_connection,
+        get_write_connection,
+    )
+
+    version_before = get_schema_version()
+
+    def good_migration():
+        with get_write_connection() as conn:
+            conn.execute("CREATE TABLE kept (id INTEGER)")
+
+    def broken_migration():
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(migrations.MIGRATIONS, version_before + 1, good_migration)
+    monkeypatch.setitem(migrations.MIGRATIONS, version_before + 2, broken_migration)
+
+    result = run_migrations()
+
+    assert result["migrations_run"] == [version_before + 1]
+    assert result["final_version"] == version_before + 1
+    with get_read_connection() as conn:
+        row = conn.execute("SELECT name FROM sqlite_master WHERE name = 'kept'").fetchone()
+    assert row is not None
+
+
+def test_ensure_latest_schema_is_memoized(test_db, monkeypatch):
+    """Test that the schema check runs once until the cache is invalidated."""
+    calls = []
+    real_run = migrations.run_migrations
+
+    def counting_run(*args, **kwargs):
+        calls.append(1)
+        return real_run(*args, **kwargs)
+
+    monkeypatch.setattr(migrations, "run_migrations", counting_run)
+
+    ensure_latest_schema()
+    ensure_latest_schema()
+    assert len(calls) == 0, "init_db already confirmed the schema"
+
+    invalidate_schema_cache()
+    ensure_latest_schema()
+    ensure_latest_schema()
+    assert len(calls) == 1
+
+
 def test_password_history_with_special_characters(test_db):
     """Test that passwords with special characters are stored correctly in history."""
     # Add password with special characters
@@ -18,6 +18,17 @@ from secure_password_manager.utils.payload_encryption import (
 )
 
 
+def _decode_blob(encrypted):
+    """Return the raw bytes of an encrypted payload's 'data' field."""
+    data = encrypted["data"]
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _encode_blob(blob):
+    """Encode raw bytes the way PayloadEncryption.encrypt does."""
+    return {"data": base64.urlsafe_b64encode(blob).rstrip(b"=").decode("ascii")}
+
+
 def test_generate_shared_secret():
     """Test shared secret generation."""
     secret = generate_shared_secret()
@@ -70,12 +81,10 @@ def test_payload_encryption_encrypt():
     payload = {"username": "test_user", "password": "secret123"}
     encrypted = encryptor.encrypt(payload)
 
-    assert "ciphertext" in encrypted
-    assert "nonce" in encrypted
-    assert "tag" in encrypted
-    assert isinstance(encrypted["ciphertext"], str)
-    assert isinstance(encrypted["nonce"], str)
-    assert isinstance(encrypted["tag"], str)
+    assert set(encrypted) == {"data"}
+    assert isinstance(encrypted["data"], str)
+    assert "=" not in encrypted["data"]
+    assert _decode_blob(encrypted)[:1] == b"\x01"
 
 
 def test_payload_encryption_decrypt():
@@ -115,11 +124,11 @@ def test_payload_encryption_different_nonces():
     encryptor = PayloadEncryption(secret)
 
     payload = {"test": "data"}
-    encrypted1 = encryptor.encrypt(payload)
-    encrypted2 = encryptor.encrypt(payload)
+    blob1 = _decode_blob(encryptor.encrypt(payload))
+    blob2 = _decode_blob(encryptor.encrypt(payload))
 
-    assert encrypted1["nonce"] != encrypted2["nonce"]
-    assert encrypted1["ciphertext"] != encrypted2["ciphertext"]
+    assert blob1[1:13] != blob2[1:13]
+    assert blob1[13:] != blob2[13:]
 
 
 def test_payload_encryption_wrong_key():
@@ -143,14 +152,13 @@ def test_payload_encryption_tampered_ciphertext():
     encryptor = PayloadEncryption(secret)
 
     payload = {"test": "data"}
-    encrypted = encryptor.encrypt(payload)
+    blob = bytearray(_decode_blob(encryptor.encrypt(payload)))
 
-    # Tamper with ciphertext
-    tampered_ciphertext = base64.b64encode(b"tampered data").decode("ascii")
-    encrypted["ciphertext"] = tampered_ciphertext
+    # Tamper with the first ciphertext byte
+    blob[13] ^= 0x01
 
     with pytest.raises(Exception):
-        encryptor.decrypt(encrypted)
+        encryptor.decrypt(_encode_blob(bytes(blob)))
 
 
 def test_payload_encryption_tampered_tag():
@@ -159,14 +167,13 @@ def test_payload_encryption_tampered_tag():
     encryptor = PayloadEncryption(secret)
 
     payload = {"test": "data"}
-    encrypted = encryptor.encrypt(payload)
+    blob = _decode_blob(encryptor.encrypt(payload))
 
-    # Tamper with tag
-    tampered_tag = base64.b64encode(b"fake_tag_data123").decode("ascii")
-    encrypted["tag"] = tampered_tag
+    # Replace the trailing 16-byte tag
+    tampered = blob[:-16] + b"fake_tag_data123"
 
     with pytest.raises(Exception):
-        encryptor.decrypt(encrypted)
+        encryptor.decrypt(_encode_blob(tampered))
 
 
 def test_payload_encryption_tampered_nonce():
@@ -175,14 +182,13 @@ def test_payload_encryption_tampered_nonce():
     encryptor = PayloadEncryption(secret)
 
     payload = {"test": "data"}
-    encrypted = encryptor.encrypt(payload)
+    blob = _decode_blob(encryptor.encrypt(payload))
 
-    # Tamper with nonce
-    tampered_nonce = base64.b64encode(b"fake_nonce12").decode("ascii")
-    encrypted["nonce"] = tampered_nonce
+    # Replace the 12-byte nonce after the version byte
+    tampered = blob[:1] + b"fake_nonce12" + blob[13:]
 
     with pytest.raises(Exception):
-        encryptor.decrypt(encrypted)
+        encryptor.decrypt(_encode_blob(tampered))
 
 
 def test_payload_encryption_invalid_base64():
@@ -190,32 +196,19 @@ def test_payload_encryption_invalid_base64():
     secret = generate_shared_secret()
     encryptor = PayloadEncryption(secret)
 
-    encrypted = {
-        "ciphertext": "invalid!!!base64",
-        "nonce": "also_invalid",
-        "tag": "not_base64",
-    }
+    encrypted = {"data": "invalid!!!base64"}
 
     with pytest.raises(Exception):
         encryptor.decrypt(encrypted)
 
 
 def test_payload_encryption_missing_fields():
-    """Test that decryption fails with missing fields."""
+    """Test that decryption fails without the data field."""
     secret = generate_shared_secret()
     encryptor = PayloadEncryption(secret)
 
-    # Missing ciphertext - should raise KeyError
     with pytest.raises(KeyError):
-        encryptor.decrypt({"nonce": "abc", "tag": "def"})
-
-    # Missing nonce - tries to decode base64 first, raises binascii.Error
-    with pytest.raises((KeyError, Exception)):
-        encryptor.decrypt({"ciphertext": "abc", "tag": "def"})
-
-    # Missing tag - tries to decode base64 first, raises binascii.Error
-    with pytest.raises((KeyError, Exception)):
-        encryptor.decrypt({"ciphertext": "abc", "nonce": "def"})
+        encryptor.decrypt({"ciphertext": "abc", "nonce": "abc", "tag": "def"})
 
 
 def test_payload_encryption_empty_payload():
@@ -330,32 +323,26 @@ def test_payload_encryption_preserves_types():
 
 
 def test_payload_encryption_nonce_length():
-    """Test that nonce is correct length."""
+    """Test that the blob holds version, 12-byte nonce, ciphertext and tag."""
     secret = generate_shared_secret()
     encryptor = PayloadEncryption(secret)
 
     payload = {"test": "data"}
-    encrypted = encryptor.encrypt(payload)
+    plaintext = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    blob = _decode_blob(encryptor.encrypt(payload))
 
-    nonce = base64.b64decode(encrypted["nonce"])
-    assert len(nonce) == 12  # 12 bytes for AES-GCM
+    assert len(blob) == 1 + 12 + len(plaintext) + 16
 
 
-def test_payload_encryption_uses_hkdf():
-    """Test that different nonces produce different derived keys."""
+def test_payload_encryption_rejects_unknown_version():
+    """Test that a blob with an unknown version byte is rejected."""
     secret = generate_shared_secret()
     encryptor = PayloadEncryption(secret)
 
-    # Encrypt same payload twice
-    payload = {"test": "data"}
-    encrypted1 = encryptor.encrypt(payload)
-    encrypted2 = encryptor.encrypt(payload)
+    blob = _decode_blob(encryptor.encrypt({"test": "data"}))
 
-    # Different nonces should result in different ciphertexts
-    # even though the shared secret is the same
-    assert encrypted1["nonce"] != encrypted2["nonce"]
-    assert encrypted1["ciphertext"] != encrypted2["ciphertext"]
-    assert encrypted1["tag"] != encrypted2["tag"]
+    with pytest.raises(ValueError, match="Unsupported"):
+        encryptor.decrypt(_encode_blob(b"\x02" + blob[1:]))
 
 
 def test_encode_shared_secret_format():
@@ -390,3 +377,9 @@ def test_payload_encryption_json_serialization():
     assert json.dumps(decrypted, separators=(",", ":")) == json.dumps(
         payload, separators=(",", ":")
     )
+
+
+def test_create_payload_encryptor_cached_per_token():
+    """Test that a token's encryptor is reused instead of re-derived."""
+    assert create_payload_encryptor("cached_token") is create_payload_encryptor("cached_token")
+    assert create_payload_encryptor("cached_token") is not create_payload_encryptor("other")
@@ -60,7 +60,7 @@ def test_check_password_breach_found(temp_breach_cache):
     mock_response.text = "ABC123:100\nDEF456:200\nGHI789:300"
     mock_response.raise_for_status = Mock()
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         # Check a password that would match DEF456
         with patch.object(
             security_analyzer,
@@ -79,7 +79,7 @@ def test_check_password_breach_not_found(temp_breach_cache):
     mock_response.text = "ABC123:100\nDEF456:200"
     mock_response.raise_for_status = Mock()
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         # Check a password that doesn't match any hash
         with patch.object(
             security_analyzer,
@@ -104,7 +104,7 @@ def test_check_password_breach_uses_cache(temp_breach_cache):
         return_value=("12345", "DEF456"),
     ):
         # Should use cache, not call API
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             breached, count = check_password_breach("test_password")
 
             assert breached is True
@@ -119,7 +119,7 @@ def test_check_password_breach_caches_results(temp_breach_cache):
     mock_response.text = "ABC123:100\nDEF456:200"
     mock_response.raise_for_status = Mock()
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         with patch.object(
             security_analyzer,
             "hash_password_for_breach_check",
@@ -136,7 +136,9 @@ def test_check_password_breach_caches_results(temp_breach_cache):
 
 def test_check_password_breach_api_error(temp_breach_cache):
     """Test breach check when API call fails."""
-    with patch("requests.get", side_effect=requests.RequestException("Network error")):
+    with patch(
+        "requests.Session.get", side_effect=requests.RequestException("Network error")
+    ):
         breached, count = check_password_breach("test_password")
 
         # Should assume safe on error
@@ -150,7 +152,7 @@ def test_check_password_breach_invalid_response(temp_breach_cache):
     mock_response.text = "invalid:response:format"
     mock_response.raise_for_status = Mock()
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         # Should handle gracefully
         breached, count = check_password_breach("test_password")
 
@@ -167,7 +169,7 @@ def test_check_password_breach_corrupted_cache(temp_breach_cache):
     mock_response.text = "ABC123:100"
     mock_response.raise_for_status = Mock()
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         # Should handle corrupted cache and call API
         breached, count = check_password_breach("test_password")
 
@@ -326,3 +328,44 @@ def test_analyze_password_security_breach_check_error(temp_breach_cache):
         # Should default to not breached on error
         assert analysis["breached"] is False
         assert analysis["breach_count"] == 0
+
+
+def test_check_password_breach_fetches_each_range_once(temp_breach_cache):
+    """Test that concurrent and repeated lookups of one prefix share a fetch."""
+    import threading
+    import time as _time
+
+    mock_response = Mock()
+    mock_response.text = "ABC123:100\nDEF456:200"
+    mock_response.raise_for_status = Mock()
+
+    def slow_get(url):
+        _time.sleep(0.05)
+        return mock_response
+
+    suffixes = {"pw-a": "ABC123", "pw-b": "DEF456", "pw-c": "XYZ999"}
+    results = {}
+
+    with patch("requests.Session.get", side_effect=slow_get) as mock_get:
+        with patch.object(
+            security_analyzer,
+            "hash_password_for_breach_check",
+            side_effect=lambda pw: ("54321", suffixes[pw]),
+        ):
+            threads = [
+                threading.Thread(
+                    target=lambda pw=pw: results.__setitem__(
+                        pw, check_password_breach(pw)
+                    )
+                )
+                for pw in suffixes
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert check_password_breach("pw-b") == (True, 200)
+
+    assert mock_get.call_count == 1
+    assert results == {"pw-a": (True, 100), "pw-b": (True, 200), "pw-c": (False, 0)}
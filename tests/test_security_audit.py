@@ -117,6 +117,25 @@ def test_audit_password_strength_breached_passwords(setup_test_passwords):
         assert len(audit_results["breached_passwords"]) > 0
 
 
+def test_audit_skips_decrypt_without_reuse_detection(setup_test_passwords):
+    """Test that analyzed entries are not decrypted again when reuse is off."""
+    with patch(
+        "secure_password_manager.utils.security_analyzer.check_password_breach",
+        return_value=(False, 0),
+    ), patch.object(
+        security_audit,
+        "decrypt_many_with_key",
+        wraps=security_audit.decrypt_many_with_key,
+    ) as mock_decrypt:
+        audit_results = audit_password_strength(
+            use_parallel=True, check_breaches=True, max_workers=2, detect_reuse=False
+        )
+
+    assert mock_decrypt.call_count == 0
+    assert audit_results["reused_passwords"] == []
+    assert len(audit_results["duplicate_passwords"]) == 1
+
+
 def test_audit_password_strength_empty_database(clean_crypto_files, clean_database):
     """Test auditing with no passwords."""
     from secure_password_manager.utils.crypto import generate_key
@@ -183,6 +202,36 @@ def test_get_security_score_range(setup_test_passwords):
     assert isinstance(score, int)
 
 
+def test_run_security_audit_audits_once(setup_test_passwords):
+    """Test that the audit's score reuses its results instead of re-auditing."""
+    with patch.object(
+        security_audit,
+        "audit_password_strength",
+        wraps=security_audit.audit_password_strength,
+    ) as mock_audit:
+        audit_report = run_security_audit(check_breaches=False, record_history=False)
+
+    assert mock_audit.call_count == 1
+    assert audit_report["score"] == get_security_score(audit_report["issues"], 7)
+
+
+def test_reused_passwords_scored_once(setup_test_passwords):
+    """Test that a plaintext shared by several entries is scored once per audit."""
+    with patch.object(
+        security_audit,
+        "evaluate_password_strength",
+        wraps=security_audit.evaluate_password_strength,
+    ) as mock_evaluate:
+        security_audit.audit_password_strength(check_breaches=False)
+        first_audit = mock_evaluate.call_count
+        security_audit.audit_password_strength(check_breaches=False)
+
+    scored = [call.args[0] for call in mock_evaluate.call_args_list]
+    assert len(scored[:first_audit]) == len(set(scored[:first_audit]))
+    assert first_audit < len(security_audit.get_passwords())
+    assert mock_evaluate.call_count == 2 * first_audit
+
+
 def test_fix_security_issues():
     """Test fix_security_issues function."""
     # Test with empty list
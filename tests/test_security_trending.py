@@ -1,8 +1,10 @@
 """Tests for security trending and historical analysis."""
 
+import json
 import os
 import sys
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -19,7 +21,7 @@ from secure_password_manager.utils.security_trending import (
 @pytest.fixture
 def temp_history_file(tmp_path):
     """Create a temporary history file."""
-    return tmp_path / "security_history.json"
+    return tmp_path / "security_history.jsonl"
 
 
 def test_security_snapshot_creation():
@@ -62,6 +64,18 @@ def test_security_snapshot_serialization():
     assert restored.weak_count == snapshot.weak_count
 
 
+def test_security_snapshot_is_slotted_and_frozen():
+    """Test that snapshots carry no instance dict and cannot be modified."""
+    import dataclasses
+
+    snapshot = SecuritySnapshot(1000000, 85, 50, 5, 3, 1, 2, 0)
+
+    assert not hasattr(snapshot, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.score = 90
+    assert snapshot in {SecuritySnapshot(1000000, 85, 50, 5, 3, 1, 2, 0)}
+
+
 def test_trend_tracker_initialization(temp_history_file):
     """Test trend tracker initialization."""
     tracker = SecurityTrendTracker(temp_history_file)
@@ -105,6 +119,92 @@ def test_snapshot_persistence(temp_history_file):
     assert snapshots[0].score == 85
 
 
+def test_record_snapshot_batches_writes(temp_history_file):
+    """Test that snapshots after the first write are batched until flushed."""
+    tracker = SecurityTrendTracker(temp_history_file)
+
+    with patch.object(tracker, "_save_history", wraps=tracker._save_history) as save:
+        for _ in range(3):
+            tracker.record_snapshot(85, 50, 5, 3, 1, 2, 0)
+        assert save.call_count == 1
+
+        assert len(SecurityTrendTracker(temp_history_file).get_snapshots()) == 1
+        tracker.flush()
+        assert save.call_count == 2
+
+        tracker.flush()
+        assert save.call_count == 2
+
+    assert len(SecurityTrendTracker(temp_history_file).get_snapshots()) == 3
+
+
+def test_exit_flush_does_not_keep_trackers_alive(temp_history_file):
+    """Test that the exit hook flushes live trackers without holding them."""
+    import gc
+    import weakref
+
+    from secure_password_manager.utils.security_trending import (
+        _flush_live_trackers,
+    )
+
+    tracker = SecurityTrendTracker(temp_history_file)
+    tracker.record_snapshot(85, 50, 5, 3, 1, 2, 0)
+    tracker.record_snapshot(90, 50, 3, 2, 0, 1, 0)
+
+    _flush_live_trackers()
+    assert len(SecurityTrendTracker(temp_history_file).get_snapshots()) == 2
+
+    ref = weakref.ref(tracker)
+    del tracker
+    gc.collect()
+    assert ref() is None
+
+    # Snapshots still pending when a tracker is collected are not lost
+    tracker = SecurityTrendTracker(temp_history_file)
+    tracker.record_snapshot(95, 50, 2, 1, 0, 0, 0)
+    tracker.record_snapshot(96, 50, 1, 1, 0, 0, 0)
+    del tracker
+    gc.collect()
+    _flush_live_trackers()
+    scores = [s.score for s in SecurityTrendTracker(temp_history_file).get_snapshots()]
+    assert scores == [85, 90, 95, 96]
+
+
+def test_history_is_appended_as_json_lines(temp_history_file):
+    """Test that each flush appends one JSON row per snapshot."""
+    tracker = SecurityTrendTracker(temp_history_file)
+    tracker.record_snapshot(85, 50, 5, 3, 1, 2, 0)
+    tracker.record_snapshot(90, 50, 3, 2, 0, 1, 0)
+    tracker.flush()
+
+    lines = temp_history_file.read_text().splitlines()
+    assert [json.loads(line)[1] for line in lines] == [85, 90]
+
+
+def test_truncated_history_line_is_skipped(temp_history_file):
+    """Test that keyed lines load and a partially written last line is skipped."""
+    snapshot = SecuritySnapshot(1000000, 85, 50, 5, 3, 1, 2, 0)
+    temp_history_file.write_text(json.dumps(snapshot.to_dict()) + '\n{"timest')
+
+    snapshots = SecurityTrendTracker(temp_history_file).get_snapshots()
+
+    assert snapshots == [snapshot]
+
+
+def test_legacy_history_is_migrated(temp_history_file):
+    """Test that the old single-document format is loaded and rewritten."""
+    snapshot = SecuritySnapshot(1000000, 85, 50, 5, 3, 1, 2, 0)
+    temp_history_file.write_text(
+        json.dumps({"snapshots": [snapshot.to_dict()]}, indent=2)
+    )
+
+    tracker = SecurityTrendTracker(temp_history_file)
+
+    assert tracker.get_snapshots() == [snapshot]
+    lines = temp_history_file.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [snapshot.to_row()]
+
+
 def test_get_snapshots_with_days_filter(temp_history_file):
     """Test filtering snapshots by days."""
     tracker = SecurityTrendTracker(temp_history_file)
@@ -127,6 +227,24 @@ def test_get_snapshots_with_days_filter(temp_history_file):
     assert len(very_recent) == 1  # Only 1 day ago
 
 
+def test_out_of_order_history_is_sorted_on_load(temp_history_file):
+    """Test that day filters still work on a history written out of order."""
+    now = int(time.time())
+    snapshots = [
+        SecuritySnapshot(now - (1 * 86400), 80, 50, 6, 3, 1, 1, 0),
+        SecuritySnapshot(now - (10 * 86400), 70, 50, 10, 5, 2, 1, 0),
+        SecuritySnapshot(now - (5 * 86400), 75, 50, 8, 4, 2, 1, 0),
+    ]
+    temp_history_file.write_text(
+        "".join(json.dumps(snap.to_row()) + "\n" for snap in snapshots)
+    )
+
+    tracker = SecurityTrendTracker(temp_history_file)
+
+    assert [s.score for s in tracker.get_snapshots()] == [70, 75, 80]
+    assert [s.score for s in tracker.get_snapshots(days=7)] == [75, 80]
+
+
 def test_get_snapshots_with_limit(temp_history_file):
     """Test limiting number of snapshots returned."""
     tracker = SecurityTrendTracker(temp_history_file)
@@ -208,6 +326,49 @@ def test_trend_analysis_stable(temp_history_file):
     assert -5 <= analysis["score_change"] <= 5
 
 
+def test_trend_analysis_average_tracks_new_snapshots(temp_history_file):
+    """Test the window average after replacing and then extending snapshots."""
+    tracker = SecurityTrendTracker(temp_history_file)
+
+    now = int(time.time())
+    tracker._snapshots = [
+        SecuritySnapshot(now - (40 * 86400), 10, 50, 15, 8, 3, 2, 1),
+        SecuritySnapshot(now - (20 * 86400), 60, 50, 10, 6, 2, 1, 0),
+        SecuritySnapshot(now - (10 * 86400), 70, 50, 5, 3, 1, 0, 0),
+    ]
+    assert tracker.get_trend_analysis(days=30)["average_score"] == 65.0
+
+    tracker.record_snapshot(95, 50, 2, 1, 0, 0, 0)
+    analysis = tracker.get_trend_analysis(days=30)
+
+    assert analysis["snapshot_count"] == 3
+    assert analysis["average_score"] == 75.0
+
+
+def test_trend_analysis_is_cached_until_next_snapshot(temp_history_file):
+    """Test that repeated analyses reuse the cached result until a write."""
+    tracker = SecurityTrendTracker(temp_history_file)
+
+    now = int(time.time())
+    tracker._snapshots = [
+        SecuritySnapshot(now - (20 * 86400), 60, 50, 10, 6, 2, 1, 0),
+        SecuritySnapshot(now - (10 * 86400), 70, 50, 5, 3, 1, 0, 0),
+    ]
+
+    with patch.object(
+        tracker, "_analyze_window", wraps=tracker._analyze_window
+    ) as analyze:
+        first = tracker.get_trend_analysis(days=30)
+        first["changes"]["weak_passwords"] = 999
+        second = tracker.get_trend_analysis(days=30)
+        assert analyze.call_count == 1
+        assert second["changes"]["weak_passwords"] == -5
+
+        tracker.record_snapshot(90, 50, 2, 1, 0, 0, 0)
+        assert tracker.get_trend_analysis(days=30)["current_score"] == 90
+        assert analyze.call_count == 2
+
+
 def test_trend_analysis_insufficient_data(temp_history_file):
     """Test trend analysis with insufficient data."""
     tracker = SecurityTrendTracker(temp_history_file)
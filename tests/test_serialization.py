@@ -0,0 +1,57 @@
+"""Tests for serialization helpers (orjson and stdlib fallback)."""
+
+import json
+
+import pytest
+
+from secure_password_manager.utils import serialization
+
+
+@pytest.fixture(params=["native", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with the detected backend and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+SAMPLE = {
+    "metadata": {"version": "2.0", "entry_count": 2},
+    "entries": [
+        {"website": "example.com", "favorite": True, "expiry_date": None},
+        {"website": "пример.рф", "favorite": False, "created_at": 1700000000},
+    ],
+}
+
+
+def test_dumps_round_trip(backend):
+    blob = serialization.dumps(SAMPLE)
+    assert isinstance(blob, bytes)
+    assert json.loads(blob) == SAMPLE
+    assert serialization.loads(blob) == SAMPLE
+
+
+def test_dumps_indent_is_human_readable(backend):
+    blob = serialization.dumps(SAMPLE, indent=True)
+    assert b"\n  " in blob
+    assert json.loads(blob) == SAMPLE
+
+
+def test_iterdumps_matches_dumps(backend):
+    pieces = [
+        p.encode("utf-8") if isinstance(p, str) else p
+        for p in serialization.iterdumps(SAMPLE)
+    ]
+    assert json.loads(b"".join(pieces)) == SAMPLE
+
+
+def test_loads_invalid_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads(b"{not json")
+
+
+def test_loads_accepts_buffer_views(backend):
+    buf = bytearray(serialization.dumps(SAMPLE) + b"trailing")
+    with memoryview(buf)[: len(buf) - len(b"trailing")] as view:
+        assert serialization.loads(view) == SAMPLE
+    assert serialization.loads(bytearray(serialization.dumps(SAMPLE))) == SAMPLE
@@ -85,6 +85,60 @@ def test_get_cert_fingerprint_valid():
     assert all(all(c in '0123456789abcdef' for c in part.lower()) for part in parts)
 
     remove_cert()
+
+
+def test_get_cert_fingerprint_cached_until_file_changes():
+    """Test that the fingerprint is reused until the certificate is replaced."""
+    from unittest.mock import patch
+
+    from secure_password_manager.utils import tls
+
+    remove_cert()
+
+    cert_path, _ = generate_self_signed_cert()
+    fingerprint = get_cert_fingerprint(cert_path)
+
+    with patch.object(
+        tls.x509, "load_pem_x509_certificate", side_effect=AssertionError
+    ):
+        assert get_cert_fingerprint(cert_path) == fingerprint
+
+    remove_cert()
+    cert_path, _ = generate_self_signed_cert()
+    assert get_cert_fingerprint(cert_path) != fingerprint
+
+    remove_cert()
+
+
+def test_existing_cert_uses_metadata_sidecar():
+    """Test that a valid cert is reused without parsing when the sidecar matches."""
+    from unittest.mock import patch
+
+    from secure_password_manager.utils import tls
+
+    remove_cert()
+
+    cert_path, _ = generate_self_signed_cert()
+    fingerprint = get_cert_fingerprint(cert_path)
+    tls._fingerprint_cache.clear()
+
+    with patch.object(
+        tls.x509, "load_pem_x509_certificate", side_effect=AssertionError
+    ):
+        assert generate_self_signed_cert()[0] == cert_path
+        assert get_cert_fingerprint(cert_path) == fingerprint
+
+    # A malformed sidecar falls back to parsing the certificate and is rewritten
+    meta_path = cert_path.with_name(cert_path.name + ".meta")
+    meta_path.write_text("not json")
+    assert generate_self_signed_cert()[0] == cert_path
+    assert get_cert_fingerprint(cert_path) == fingerprint
+    assert "not_valid_after" in meta_path.read_text()
+
+    remove_cert()
+    assert not meta_path.exists()
+
+
 def test_get_cert_fingerprint_nonexistent():
     """Test fingerprint of nonexistent certificate."""
     fake_path = Path("/nonexistent/cert.pem")